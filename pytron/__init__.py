@@ -96,6 +96,8 @@ sys.modules["plugins"] = plugins
 # --------------------------------------
 
 from .core import App, Webview, get_resource_path, Menu, MenuBar
+from .core import CancelToken, CallCancelled, ArgumentError
+from .core import current_token, current_window
 from .plugin import Plugin
 from .updater import Updater
 
@@ -105,6 +107,11 @@ __all__ = [
     "get_resource_path",
     "Menu",
     "MenuBar",
+    "CancelToken",
+    "CallCancelled",
+    "ArgumentError",
+    "current_token",
+    "current_window",
     "Plugin",
     "Updater",
     "plugins",
@@ -1,5 +1,7 @@
 import os
 import sys
+import inspect
+import threading
 from typing import Any
 from .state import ReactiveState
 from .router import Router
@@ -13,6 +15,10 @@ from .apputils.config import ConfigMixin
 from .apputils.windows import WindowMixin
 from .apputils.extras import ExtrasMixin
 from .apputils.shell import Shell
+from .apputils.executors import ExecutorRegistry
+from .apputils.callcache import CallCache
+from .apputils.callstats import CallStats, DEFAULT_SLOW_CALL_MS
+from .apputils.validation import compile_validator
 from .inspector import Inspector
 
 
@@ -46,6 +52,23 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
         self.state = ReactiveState(self)
         self._check_deep_link()
         self._load_config(config_file)
+        # Named executors and per-function limits for exposed functions
+        self.executors = ExecutorRegistry(
+            self.thread_pool, self.config.get("executors"), self.logger
+        )
+        self._call_caches = {}
+        # One event loop for every window's async handlers (see WindowMixin.loop)
+        self.shared_loop = self.config.get("shared_event_loop", True)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        if self.config.get("state_flush_interval"):
+            # PERFORMANCE: Coalesce state updates into one emit per window per tick
+            self.state.set_flush_interval(self.config["state_flush_interval"])
+        if "state_patch_limit" in self.config or "state_patch_max_items" in self.config:
+            self.state.set_patch_limit(
+                self.config.get("state_patch_limit", self.state._patch_limit),
+                self.config.get("state_patch_max_items"),
+            )
         _, safe_title = self._setup_identity()
         self._setup_storage(safe_title)
         self._resolve_resources()
@@ -70,6 +93,12 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
 
         # Initialize Inspector
         self.inspector = Inspector(self)
+        # Latency histograms and slow-call log for every IPC call
+        self.call_timings = CallStats(
+            self.config.get("slow_call_ms", DEFAULT_SLOW_CALL_MS),
+            logger=self.logger,
+            observer=self.inspector.log_ipc,
+        )
 
         if self.config.get("single_instance", False):
             # ConfigMixin already handles this via _setup_identity -> _setup_single_instance
@@ -81,6 +110,7 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
         # Register automatic cleanup for thread pool
         @self.on_exit
         def _cleanup_pool():
+            self.executors.shutdown()
             if self.thread_pool:
                 self.logger.debug("Shutting down thread pool...")
                 try:
@@ -167,16 +197,57 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
         return func
 
     # Expose function to all windows
-    def expose(self, func=None, name=None, secure=False, run_in_thread=True):
+    def expose(
+        self,
+        func=None,
+        name=None,
+        secure=False,
+        run_in_thread=True,
+        executor=None,
+        max_concurrency=None,
+        max_queue=None,
+        cpu_bound=False,
+        single_flight=False,
+        cache_ttl=None,
+        cache_size=None,
+        validate=True,
+    ):
         """
         Expose a function to ALL windows created by this App.
         Can be used as a decorator: @app.expose or @app.expose(secure=True)
+
+        executor runs the function on a named pool instead of the shared one,
+        max_concurrency caps the calls in flight and max_queue the calls waiting
+        behind them (further calls fail fast). cpu_bound=True runs it in a
+        process pool, so the function and its arguments must be picklable.
+        Async functions always run on the event loop; only the limits apply.
+
+        single_flight=True makes identical concurrent calls share one run.
+        cache_ttl (seconds) and/or cache_size (LRU entries) also keep results;
+        see invalidate_cache(). Both imply single_flight.
+
+        Arguments are checked and coerced against the function's type hints
+        before it runs (a validator compiled once, here); validate=False
+        passes them through as decoded from JSON.
         """
+        limits = dict(
+            executor=executor,
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            cpu_bound=cpu_bound,
+            single_flight=single_flight,
+            cache_ttl=cache_ttl,
+            cache_size=cache_size,
+            validate=validate,
+        )
+
         # Case 1: Used as @app.expose(secure=True) - func is None
         if func is None:
 
             def decorator(f):
-                self.expose(f, name=name, secure=secure, run_in_thread=run_in_thread)
+                self.expose(
+                    f, name=name, secure=secure, run_in_thread=run_in_thread, **limits
+                )
                 return f
 
             return decorator
@@ -211,6 +282,7 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
                             "func": attr,
                             "secure": secure,
                             "run_in_thread": run_in_thread,
+                            **self._make_policies(attr_name, attr, **limits),
                         }
                         self._exposed_ts_defs[attr_name] = self._get_ts_definition(
                             attr_name, attr
@@ -226,10 +298,86 @@ class App(ConfigMixin, WindowMixin, ExtrasMixin, CodegenMixin, NativeMixin, Shel
             "func": func,
             "secure": secure,
             "run_in_thread": run_in_thread,
+            **self._make_policies(name, func, **limits),
         }
         self._exposed_ts_defs[name] = self._get_ts_definition(name, func)
         return func
 
+    def _make_policies(
+        self,
+        name,
+        func,
+        executor=None,
+        max_concurrency=None,
+        max_queue=None,
+        cpu_bound=False,
+        single_flight=False,
+        cache_ttl=None,
+        cache_size=None,
+        validate=True,
+    ):
+        """
+        Builds the CallGate, CallCache and argument validator (None when unused)
+        of an exposed function.
+        """
+        gate = cache = None
+        if inspect.iscoroutinefunction(func) and (cpu_bound or executor is not None):
+            # Coroutines run on the event loop: only the limits apply to them
+            self.logger.warning(
+                f"'{name}' is async, so executor/cpu_bound are ignored for it"
+            )
+            executor, cpu_bound = None, False
+        # Functions without options keep using the shared pool directly
+        limited = (executor, max_concurrency, max_queue)
+        if cpu_bound or any(option is not None for option in limited):
+            gate = self.executors.gate(
+                name,
+                executor=executor,
+                max_concurrency=max_concurrency,
+                max_queue=max_queue,
+                cpu_bound=cpu_bound,
+            )
+        if single_flight or cache_ttl is not None or cache_size is not None:
+            cache = self._call_caches[name] = CallCache(
+                name, ttl=cache_ttl, max_entries=cache_size
+            )
+        validator = compile_validator(name, func) if validate else None
+        return {"gate": gate, "cache": cache, "validator": validator}
+
+    def invalidate_cache(self, name=None, *args):
+        """
+        Drops memoized results of exposed function `name` (only the entry for
+        `args` if given), or of every function when name is None.
+        """
+        if name is None:
+            caches = list(self._call_caches.values())
+        else:
+            caches = [self._call_caches[name]] if name in self._call_caches else []
+        for cache in caches:
+            cache.invalidate(*args)
+
+    def cache_stats(self):
+        """Hit/shared/miss counters of every single-flight or memoized function."""
+        return {name: cache.stats() for name, cache in self._call_caches.items()}
+
+    def call_stats(self, name=None):
+        """
+        Per-function IPC latency percentiles (total, queue, execute, serialize,
+        transport), for every exposed function or just `name`.
+        """
+        return self.call_timings.stats(name)
+
+    def slow_calls(self):
+        """Recent calls slower than the "slow_call_ms" setting, args as shapes."""
+        return self.call_timings.slow_calls()
+
+    def add_executor(self, name, max_workers=None, processes=False):
+        """
+        Registers a named executor for expose(executor=name).
+        Unregistered names are created on first use from the "executors" setting.
+        """
+        return self.executors.add(name, max_workers=max_workers, processes=processes)
+
     def shortcut(self, key_combo, func=None):
         """
         Register a global keyboard shortcut for all windows.
@@ -0,0 +1,120 @@
+import json
+import time
+import threading
+from collections import OrderedDict
+
+# Entry cap when only a TTL is given, so the cache can't grow without bound
+DEFAULT_CACHE_SIZE = 256
+
+
+def _call_key(args):
+    return json.dumps(args, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+class CallCache:
+    """
+    Single-flight and memoization for one exposed function.
+
+    Identical calls (same arguments) that arrive while one is running share
+    its result instead of running the handler again. With a `ttl` (seconds)
+    and/or `max_entries` successful results are also kept, least recently
+    used first out. Errors are shared with concurrent callers but never kept.
+    """
+
+    def __init__(self, name, ttl=None, max_entries=None):
+        self.name = name
+        self.ttl = ttl
+        self.memoize = ttl is not None or max_entries is not None
+        self.max_entries = max_entries or (DEFAULT_CACHE_SIZE if self.memoize else 0)
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}  # key -> [respond, ...]
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def call(self, args, respond, start):
+        """
+        Answers respond(status, result) for a call with `args`, from the cache,
+        by joining an identical call in flight, or by running start(done).
+        """
+        key = _call_key(args)
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and (
+                entry[0] is None or entry[0] > time.monotonic()
+            )
+            if hit:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                    self.expirations += 1
+                waiters = self._inflight.get(key)
+                if waiters is not None:
+                    waiters.append(respond)
+                    self.shared += 1
+                    return
+                waiters = self._inflight[key] = [respond]
+                self.misses += 1
+                generation = self._generation
+        if hit:
+            respond(0, entry[1])
+            return
+
+        def done(status, result):
+            with self._lock:
+                if self._inflight.get(key) is waiters:
+                    del self._inflight[key]
+                # Don't keep a result computed before an invalidation
+                if status == 0 and self.memoize and generation == self._generation:
+                    self._store(key, result)
+            for waiter in waiters:
+                waiter(status, result)
+
+        start(done)
+
+    def _store(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *args):
+        """
+        Drops the result kept for these arguments, or every result if none are
+        given. Calls already running won't store what they return.
+        """
+        with self._lock:
+            self._generation += 1
+            if args:
+                key = _call_key(list(args))
+                self._entries.pop(key, None)
+                self._inflight.pop(key, None)
+            else:
+                self._entries.clear()
+                self._inflight.clear()
+
+    def stats(self):
+        with self._lock:
+            calls = self.hits + self.shared + self.misses
+            return {
+                "entries": len(self._entries),
+                "in_flight": len(self._inflight),
+                "ttl": self.ttl,
+                "max_entries": self.max_entries if self.memoize else None,
+                "hits": self.hits,
+                "shared": self.shared,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (
+                    round((self.hits + self.shared) / calls, 3) if calls else 0.0
+                ),
+            }
@@ -0,0 +1,233 @@
+import time
+import logging
+import threading
+from collections import deque
+
+# Phases of an IPC call, in order: waiting for a worker (or a shared result),
+# running the handler, encoding the reply and handing it to the engine
+PHASES = ("queue", "execute", "serialize", "transport")
+DEFAULT_SLOW_CALL_MS = 100
+DEFAULT_SLOW_LOG_SIZE = 100
+
+# Log-linear buckets over microseconds: exact below 128us, then 64 buckets per
+# power of two (under 1.6% relative error), like an HDR histogram
+_SUB_BITS = 7
+_SUB = 1 << _SUB_BITS
+_HALF = _SUB >> 1
+
+
+def _bucket(micros):
+    if micros < _SUB:
+        return micros
+    shift = micros.bit_length() - _SUB_BITS
+    return (shift + 1) * _HALF + (micros >> shift) - _HALF
+
+
+def _bucket_top(index):
+    """Highest value (us) that falls into bucket `index`."""
+    if index < _SUB:
+        return index
+    shift = index // _HALF - 1
+    return ((index % _HALF + _HALF) << shift) + (1 << shift) - 1
+
+
+def _ms(seconds):
+    return round((seconds or 0.0) * 1000, 3)
+
+
+def args_shape(value, depth=2):
+    """Describes a value by type and size only, so logs never hold user data."""
+    if value is None:
+        return "None"
+    if isinstance(value, (bool, int, float)):
+        return type(value).__name__
+    if isinstance(value, (str, bytes, bytearray)):
+        return f"{type(value).__name__}[{len(value)}]"
+    if isinstance(value, dict):
+        if depth <= 0:
+            return f"dict[{len(value)}]"
+        return {str(k): args_shape(v, depth - 1) for k, v in list(value.items())[:10]}
+    if isinstance(value, (list, tuple)):
+        if depth <= 0:
+            return f"{type(value).__name__}[{len(value)}]"
+        return [args_shape(v, depth - 1) for v in value[:10]]
+    return type(value).__name__
+
+
+class LatencyHistogram:
+    """
+    Sparse HDR-style latency histogram: constant-time record(), bounded
+    relative error on percentiles and no stored samples.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        micros = max(int(seconds * 1_000_000), 0)
+        index = _bucket(micros)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q):
+        """Latency (seconds) at or below which `q` percent of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(_bucket_top(index) / 1_000_000, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.total / self.count if self.count else 0.0),
+            "min_ms": _ms(self.min),
+            "p50_ms": _ms(self.percentile(50)),
+            "p90_ms": _ms(self.percentile(90)),
+            "p99_ms": _ms(self.percentile(99)),
+            "max_ms": _ms(self.max),
+        }
+
+
+class CallTimer:
+    """Timestamps of one IPC call, filled in by the dispatcher and the engine."""
+
+    __slots__ = ("stats", "name", "args", "arrived", "started", "executed")
+
+    def __init__(self, stats, name, args):
+        self.stats = stats
+        self.name = name
+        self.args = args
+        self.arrived = time.perf_counter()
+        self.started = None
+        self.executed = None
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def stop(self):
+        if self.executed is None:
+            self.executed = time.perf_counter()
+
+    def record(self, status, result, serialize, transport):
+        # Calls that never ran themselves (cache hits, shared single-flight
+        # runs) spent their whole time waiting
+        executed = self.executed or time.perf_counter()
+        started = self.started or executed
+        self.stats.record(
+            self.name,
+            self.args,
+            {
+                "queue": started - self.arrived,
+                "execute": executed - started,
+                "serialize": serialize,
+                "transport": transport,
+            },
+            error=result if status else None,
+        )
+
+
+class CallStats:
+    """
+    Per-function latency histograms for every phase of an IPC call, plus a
+    log of calls slower than `slow_call_ms` (argument shapes, not values).
+    `observer(name, args, error=, duration=)` sees every call, e.g.
+    Inspector.log_ipc.
+    """
+
+    def __init__(
+        self,
+        slow_call_ms=DEFAULT_SLOW_CALL_MS,
+        max_slow_calls=DEFAULT_SLOW_LOG_SIZE,
+        logger=None,
+        observer=None,
+    ):
+        self.slow_call_ms = slow_call_ms
+        self.logger = logger or logging.getLogger("Pytron.CallStats")
+        self.observer = observer
+        self._functions = {}  # name -> {"calls", "errors", phase -> histogram}
+        self._slow = deque(maxlen=max_slow_calls)
+        self._lock = threading.Lock()
+
+    def timer(self, name, args):
+        return CallTimer(self, name, args)
+
+    def record(self, name, args, phases, error=None):
+        total = sum(phases.values())
+        with self._lock:
+            entry = self._functions.get(name)
+            if entry is None:
+                entry = {"calls": 0, "errors": 0, "total": LatencyHistogram()}
+                entry.update((phase, LatencyHistogram()) for phase in PHASES)
+                self._functions[name] = entry
+            entry["calls"] += 1
+            if error is not None:
+                entry["errors"] += 1
+            entry["total"].record(total)
+            for phase, seconds in phases.items():
+                entry[phase].record(seconds)
+
+        slow = self.slow_call_ms is not None and total * 1000 >= self.slow_call_ms
+        if slow or self.observer is not None:
+            shape = args_shape(args)
+        if slow:
+            self._slow.append(
+                {
+                    "time": time.strftime("%H:%M:%S"),
+                    "function": name,
+                    "args": shape,
+                    "error": error is not None,
+                    "duration_ms": round(total * 1000, 2),
+                    **{
+                        f"{phase}_ms": round(seconds * 1000, 2)
+                        for phase, seconds in phases.items()
+                    },
+                }
+            )
+            self.logger.warning(
+                f"Slow IPC call: {name} took {total * 1000:.1f}ms {shape}"
+            )
+        if self.observer is not None:
+            try:
+                self.observer(name, shape, error=error, duration=total)
+            except Exception as e:
+                self.logger.debug(f"IPC observer failed: {e}")
+
+    def stats(self, name=None):
+        """Calls, errors and latency percentiles per phase, per function."""
+        with self._lock:
+            if name is None:
+                entries = dict(self._functions)
+            elif name in self._functions:
+                entries = {name: self._functions[name]}
+            else:
+                entries = {}
+            return {
+                fn: {
+                    "calls": entry["calls"],
+                    "errors": entry["errors"],
+                    **{key: entry[key].summary() for key in ("total",) + PHASES},
+                }
+                for fn, entry in entries.items()
+            }
+
+    def slow_calls(self):
+        return list(self._slow)
+
+    def reset(self):
+        with self._lock:
+            self._functions.clear()
+            self._slow.clear()
@@ -128,7 +128,8 @@ class CodegenMixin:
             params = []
 
             for param_name, param in sig.parameters.items():
-                if param_name == "self":
+                # cancel_token is supplied by the bridge, not the frontend
+                if param_name in ("self", "cancel_token"):
                     continue
 
                 py_type = param.annotation
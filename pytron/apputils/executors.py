@@ -0,0 +1,210 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+DEFAULT_EXECUTOR = "default"
+# Named executor used by expose(cpu_bound=True)
+PROCESS_EXECUTOR = "process"
+# Named executor running sync generator streams, whose producers block
+# while they wait for credits and must not tie up the shared pool
+STREAM_EXECUTOR = "stream"
+
+
+class CallGate:
+    """
+    Runs the calls of one exposed function on its executor, with at most
+    `max_concurrency` in flight and up to `max_queue` waiting behind them.
+    Calls past the queue limit are rejected straight away instead of
+    tying up workers other functions need. None means no limit.
+    """
+
+    def __init__(
+        self, name, executor, max_concurrency=None, max_queue=None, executor_name=None
+    ):
+        self.name = name
+        self.executor = executor
+        self.executor_name = executor_name
+        # Process pools can't be handed cancellation tokens or closures
+        self.processes = isinstance(executor, ProcessPoolExecutor)
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self.active = 0
+        self.peak_active = 0
+        self.peak_queued = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def submit(self, fn, args, done):
+        """
+        Schedules fn(*args); done(future) is called once it finishes.
+        Returns False if the call was rejected because the gate is saturated.
+        """
+        return self.admit(lambda: self._start(fn, args, done))
+
+    def admit(self, start):
+        """
+        Runs start() now if a slot is free, else once one frees up. For calls
+        that don't run on the executor (async handlers on the event loop):
+        the call started must report back through release(failed).
+        Returns False if the call was rejected because the gate is saturated.
+        """
+        with self._lock:
+            if self.max_concurrency is None or self.active < self.max_concurrency:
+                self.active += 1
+                self.peak_active = max(self.peak_active, self.active)
+                run_now = True
+            elif self.max_queue is not None and len(self._queue) >= self.max_queue:
+                self.rejected += 1
+                return False
+            else:
+                self._queue.append(start)
+                self.peak_queued = max(self.peak_queued, len(self._queue))
+                run_now = False
+            self.submitted += 1
+        if run_now:
+            start()
+        return True
+
+    def _start(self, fn, args, done):
+        try:
+            future = self.executor.submit(fn, *args)
+        except Exception as e:
+            # Shut down or broken executor: fail this call, keep the gate moving
+            future = Future()
+            future.set_exception(e)
+        future.add_done_callback(lambda f: self._finished(f, done))
+
+    def _finished(self, future, done):
+        try:
+            done(future)
+        finally:
+            self.release(future.cancelled() or future.exception() is not None)
+
+    def release(self, failed=False):
+        """Frees the slot of a finished call and starts the next queued one."""
+        with self._lock:
+            if failed:
+                self.failed += 1
+            else:
+                self.completed += 1
+            queued = self._queue.popleft() if self._queue else None
+            if queued is None:
+                self.active -= 1
+        if queued is not None:
+            queued()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "executor": self.executor_name,
+                "active": self.active,
+                "queued": len(self._queue),
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "peak_active": self.peak_active,
+                "peak_queued": self.peak_queued,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+
+
+class ExecutorRegistry:
+    """
+    Named executors for exposed functions. "default" is the app's shared
+    thread pool; others are created on first use from the "executors"
+    setting, e.g. {"export": {"max_workers": 2}, "process": {"processes": true}}.
+    """
+
+    def __init__(self, default, settings=None, logger=None):
+        self.settings = settings or {}
+        self.logger = logger or logging.getLogger("Pytron.Executors")
+        self._executors = {DEFAULT_EXECUTOR: default}
+        self._gates = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, max_workers=None, processes=False):
+        """Creates (or returns the existing) executor called `name`."""
+        with self._lock:
+            if name in self._executors:
+                return self._executors[name]
+            if processes:
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix=f"Pytron-{name}"
+                )
+            self.logger.debug(f"Created executor '{name}' (processes={processes})")
+            self._executors[name] = executor
+            return executor
+
+    def get(self, name=None, processes=False):
+        name = name or (PROCESS_EXECUTOR if processes else DEFAULT_EXECUTOR)
+        executor = self._executors.get(name)
+        if executor is not None:
+            return executor
+        options = self.settings.get(name, {})
+        return self.add(
+            name,
+            max_workers=options.get("max_workers"),
+            processes=options.get("processes", processes),
+        )
+
+    def gate(
+        self,
+        func_name,
+        executor=None,
+        max_concurrency=None,
+        max_queue=None,
+        cpu_bound=False,
+    ):
+        """Builds and registers the CallGate for an exposed function."""
+        executor = executor or (PROCESS_EXECUTOR if cpu_bound else DEFAULT_EXECUTOR)
+        gate = CallGate(
+            func_name,
+            self.get(executor, processes=cpu_bound),
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            executor_name=executor,
+        )
+        self._gates[func_name] = gate
+        return gate
+
+    def stats(self):
+        """Saturation metrics per executor and per limited function."""
+        executors = {}
+        for name, executor in list(self._executors.items()):
+            work_queue = getattr(executor, "_work_queue", None)
+            executors[name] = {
+                "processes": isinstance(executor, ProcessPoolExecutor),
+                "max_workers": getattr(executor, "_max_workers", None),
+                "workers": len(
+                    getattr(executor, "_threads", None)
+                    or getattr(executor, "_processes", None)
+                    or ()
+                ),
+                "queued": work_queue.qsize() if hasattr(work_queue, "qsize") else None,
+            }
+        return {
+            "executors": executors,
+            "functions": {
+                name: gate.stats() for name, gate in list(self._gates.items())
+            },
+        }
+
+    def shutdown(self):
+        """Shuts down every executor except the app's shared pool."""
+        for name, executor in list(self._executors.items()):
+            if name == DEFAULT_EXECUTOR:
+                continue
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except Exception as e:
+                self.logger.debug(f"Error shutting down executor {name}: {e}")
+        self._executors = {DEFAULT_EXECUTOR: self._executors[DEFAULT_EXECUTOR]}
@@ -0,0 +1,181 @@
+import inspect
+import logging
+import types
+import typing
+from ..exceptions import ArgumentError
+
+try:
+    import pydantic
+except ImportError:
+    pydantic = None
+
+logger = logging.getLogger("Pytron.Validation")
+
+_NONE = type(None)
+_Literal = getattr(typing, "Literal", None)
+# `int | None` (3.10+) has no __origin__
+_UnionType = getattr(types, "UnionType", None)
+_TRUE = ("true", "1", "yes", "on")
+_FALSE = ("false", "0", "no", "off")
+
+
+# JSON only carries numbers, strings, booleans and null, so primitives are
+# checked with a type test and coerced from the obvious lossless spellings.
+def _to_int(value):
+    if type(value) is int:
+        return value
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is str:
+        return int(value.strip())
+    raise TypeError
+
+
+def _to_float(value):
+    if type(value) is float:
+        return value
+    if type(value) in (int, str):
+        return float(value)
+    raise TypeError
+
+
+def _to_str(value):
+    if type(value) is str:
+        return value
+    raise TypeError
+
+
+def _to_bool(value):
+    if type(value) is bool:
+        return value
+    if type(value) is int and value in (0, 1):
+        return bool(value)
+    if type(value) is str and value.lower() in _TRUE + _FALSE:
+        return value.lower() in _TRUE
+    raise TypeError
+
+
+def _to_none(value):
+    if value is None:
+        return value
+    raise TypeError
+
+
+_PRIMITIVES = {
+    int: _to_int,
+    float: _to_float,
+    str: _to_str,
+    bool: _to_bool,
+    _NONE: _to_none,
+}
+
+
+def _union(members):
+    exact = tuple(members)
+    coercers = [_PRIMITIVES[member] for member in members]
+
+    def _to_union(value):
+        if type(value) in exact:
+            return value
+        for coerce in coercers:
+            try:
+                return coerce(value)
+            except (TypeError, ValueError):
+                pass
+        raise TypeError
+
+    return _to_union
+
+
+def _literal(choices):
+    def _to_literal(value):
+        if value in choices:
+            return value
+        raise ValueError
+
+    return _to_literal
+
+
+def _adapter(hint):
+    """Pydantic validator for a non-primitive hint, or None without pydantic."""
+    if pydantic is None:
+        return None
+    try:
+        if hasattr(pydantic, "TypeAdapter"):
+            return pydantic.TypeAdapter(hint).validate_python
+        return lambda value: pydantic.parse_obj_as(hint, value)
+    except Exception as e:
+        # Types pydantic can't build a schema for are passed through unchecked
+        logger.debug(f"No validator for {hint!r}: {e}")
+        return None
+
+
+def _converter(hint):
+    if hint is typing.Any or hint is inspect.Parameter.empty:
+        return None
+    if isinstance(hint, type) and hint in _PRIMITIVES:
+        return _PRIMITIVES[hint]
+    origin = getattr(hint, "__origin__", None)
+    members = getattr(hint, "__args__", ())
+    union = origin is typing.Union or (
+        _UnionType is not None and isinstance(hint, _UnionType)
+    )
+    if union and all(m in _PRIMITIVES for m in members):
+        return _union(members)
+    if _Literal is not None and origin is _Literal:
+        return _literal(members)
+    return _adapter(hint)
+
+
+def _type_name(hint):
+    if isinstance(hint, type):
+        return hint.__name__
+    return str(hint).replace("typing.", "")
+
+
+def compile_validator(name, func):
+    """
+    PERFORMANCE: Builds validate(args) -> args for an exposed function from its
+    type hints, once, at expose time. Primitives (int, float, str, bool, None,
+    Optional/Union/Literal of them) get a type test and lossless coercion;
+    other hints (models, containers) go through pydantic when it's installed.
+    Returns None when no parameter needs checking, so plain calls cost nothing.
+    Invalid arguments raise ArgumentError.
+    """
+    try:
+        signature = inspect.signature(func)
+        hints = typing.get_type_hints(func)
+    except Exception as e:
+        logger.debug(f"Not validating arguments of {name}: {e}")
+        return None
+
+    params = []
+    for param in signature.parameters.values():
+        if param.kind not in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            break
+        if param.name == "cancel_token":
+            continue
+        hint = hints.get(param.name, param.annotation)
+        params.append((param.name, hint, _converter(hint)))
+    if not any(convert for _, _, convert in params):
+        return None
+
+    def validate(args):
+        checked = list(args)
+        for index, (param, hint, convert) in enumerate(params[: len(checked)]):
+            if convert is None:
+                continue
+            value = checked[index]
+            try:
+                checked[index] = convert(value)
+            except Exception as e:
+                detail = ""
+                if pydantic is not None and isinstance(e, pydantic.ValidationError):
+                    detail = f" ({e.errors()[0].get('msg')})"
+                raise ArgumentError(
+                    f"Invalid argument '{param}' for {name}: expected "
+                    f"{_type_name(hint)}, got {type(value).__name__}{detail}"
+                ) from None
+        return checked
+
+    return validate
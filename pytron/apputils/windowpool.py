@@ -0,0 +1,140 @@
+import logging
+import threading
+from collections import deque
+
+# Options that can be applied to an already created window. Anything else
+# (frameless, transparent, engine flags...) needs a fresh window.
+POOLABLE_OPTIONS = frozenset(
+    {"url", "title", "dimensions", "center", "start_hidden", "icon", "id"}
+)
+
+DEFAULT_POOL_DELAY = 2.0
+
+
+class WindowPool:
+    """
+    Keeps up to `size` hidden, pre-bound windows ready for create_window.
+
+    `factory` builds one hidden window; the pool calls it from a background
+    thread once the app has been idle for `delay` seconds, and again after
+    every hand-out so the pool refills. Closed windows can be handed back
+    through release() instead of being destroyed.
+    """
+
+    def __init__(self, factory, size=1, delay=DEFAULT_POOL_DELAY, logger=None):
+        self.factory = factory
+        self.size = max(0, int(size))
+        self.delay = delay
+        self.logger = logger or logging.getLogger("Pytron.WindowPool")
+        self._idle = deque()
+        self._lock = threading.Lock()
+        self._filling = False
+        self._timer = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.recycled = 0
+        self.discarded = 0
+
+    def acquire(self, compatible=True):
+        """
+        Returns a warm window, or None (a miss). Requests a pooled window
+        can't satisfy pass compatible=False so they still count as misses.
+        """
+        with self._lock:
+            window = None
+            if self._idle and compatible:
+                window = self._idle.popleft()
+            if window is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self.schedule()
+        return window
+
+    def release(self, window):
+        """
+        Takes back a closed window. Returns False if the pool is full and
+        the caller should destroy it instead.
+        """
+        with self._lock:
+            if self._closed or len(self._idle) >= self.size:
+                self.discarded += 1
+                return False
+            self._idle.append(window)
+            self.recycled += 1
+            return True
+
+    def resize(self, size):
+        """Changes the pool size. Surplus idle windows are returned for closing."""
+        with self._lock:
+            self.size = max(0, int(size))
+            surplus = []
+            while len(self._idle) > self.size:
+                surplus.append(self._idle.pop())
+        self.schedule()
+        return surplus
+
+    def schedule(self, delay=None):
+        """Refills the pool in the background after `delay` seconds."""
+        with self._lock:
+            if self._closed or self._filling or self._timer:
+                return
+            if len(self._idle) >= self.size:
+                return
+            self._timer = threading.Timer(
+                self.delay if delay is None else delay, self.fill
+            )
+            self._timer.daemon = True
+            self._timer.name = "PytronWindowPool"
+            self._timer.start()
+
+    def fill(self):
+        """Creates windows until the pool is full."""
+        with self._lock:
+            self._timer = None
+            if self._filling:
+                return
+            self._filling = True
+        try:
+            while True:
+                with self._lock:
+                    if self._closed or len(self._idle) >= self.size:
+                        return
+                try:
+                    window = self.factory()
+                except Exception as e:
+                    self.logger.warning(f"Failed to prewarm window: {e}")
+                    return
+                with self._lock:
+                    self.created += 1
+                    self._idle.append(window)
+        finally:
+            with self._lock:
+                self._filling = False
+
+    def drain(self):
+        """Stops refilling and returns the idle windows for closing."""
+        with self._lock:
+            self._closed = True
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            windows = list(self._idle)
+            self._idle.clear()
+        return windows
+
+    def stats(self):
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "created": self.created,
+                "recycled": self.recycled,
+                "discarded": self.discarded,
+            }
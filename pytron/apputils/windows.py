@@ -4,9 +4,27 @@ import shutil
 import inspect
 import asyncio
 from ..webview import Webview
+from ..eventloop import start_event_loop, stop_event_loop
+from .windowpool import WindowPool, POOLABLE_OPTIONS, DEFAULT_POOL_DELAY
 
 
 class WindowMixin:
+    @property
+    def loop(self):
+        """
+        PERFORMANCE: The app-wide event loop (uvloop when installed, unless the
+        "uvloop" setting is false), started on first use. Every window runs its
+        async handlers here unless "shared_event_loop" is false, so they can
+        share sessions and pools.
+        """
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    self._loop = start_event_loop(
+                        "Pytron-AppLoop", self.config.get("uvloop", True)
+                    )
+        return self._loop
+
     def create_window(self, **kwargs):
         if "url" in kwargs and not getattr(sys, "frozen", False):
             if not kwargs["url"].startswith(("http:", "https:", "file:")):
@@ -22,27 +40,22 @@ class WindowMixin:
 
         window_config["navigate_on_init"] = False
 
-        # Engine Selection
-        if getattr(self, "engine", "native") == "chrome":
-            from ..engines.chrome.engine import ChromeWebView
-
-            window = ChromeWebView(config=window_config)
+        # PERFORMANCE: Secondary windows come prewarmed from the pool when possible
+        window = None
+        pool = getattr(self, "_window_pool", None)
+        if pool and self.windows:
+            window = pool.acquire(compatible=self._poolable(kwargs))
+        pooled = window is not None
+        if pooled:
+            self._adopt_window(window, window_config)
         else:
-            window = Webview(config=window_config)
+            window = self._new_window(window_config)
 
         self.windows.append(window)
-        for name, data in self._exposed_functions.items():
-            func = data["func"]
-            secure = data["secure"]
-            run_in_thread = data.get("run_in_thread", True)
-            if isinstance(func, type):
-                try:
-                    window.expose(func)
-                except Exception as e:
-                    self.logger.debug(f"Failed to expose class {name}: {e}")
-                    window.bind(name, func, secure=secure, run_in_thread=run_in_thread)
-            else:
-                window.bind(name, func, secure=secure, run_in_thread=run_in_thread)
+        # Pooled windows only need what was exposed after they were warmed
+        self._bind_exposed(window, skip=window._prebound if pooled else ())
+        if pooled:
+            window._prebound = set(self._exposed_functions)
 
         if target_url:
             window.navigate(target_url)
@@ -106,8 +119,125 @@ class WindowMixin:
             except Exception as e:
                 self.logger.warning(f"Failed to enable Native Drag & Drop: {e}")
 
+        if pooled and not window_config.get("start_hidden", False):
+            window.show()
         return window
 
+    def _new_window(self, window_config):
+        # Engine Selection
+        if getattr(self, "engine", "native") == "chrome":
+            from ..engines.chrome.engine import ChromeWebView
+
+            return ChromeWebView(config=window_config)
+        return Webview(config=window_config)
+
+    def _bind_exposed(self, window, skip=()):
+        for name, data in self._exposed_functions.items():
+            if name in skip:
+                continue
+            func = data["func"]
+            options = dict(
+                secure=data["secure"], run_in_thread=data.get("run_in_thread", True)
+            )
+            for policy in ("gate", "cache", "validator"):
+                if data.get(policy) is not None:
+                    options[policy] = data[policy]
+            if isinstance(func, type):
+                try:
+                    window.expose(func)
+                except Exception as e:
+                    self.logger.debug(f"Failed to expose class {name}: {e}")
+                    window.bind(name, func, **options)
+            else:
+                window.bind(name, func, **options)
+
+    # --- Window Pool ---
+
+    def _start_window_pool(self):
+        size = self.config.get("window_pool_size", 0)
+        if not size or getattr(self, "_window_pool", None):
+            return
+        self._window_pool = WindowPool(
+            self._warm_window,
+            size=size,
+            delay=self.config.get("window_pool_delay", DEFAULT_POOL_DELAY),
+            logger=self.logger,
+        )
+        # Warm up once the main window has had time to load
+        self._window_pool.schedule()
+
+    def _poolable(self, options):
+        if not set(options) <= POOLABLE_OPTIONS:
+            return False
+        url = options.get("url")
+        if not url or url.startswith(("http:", "https:", "pytron:", "file:")):
+            return True
+        # Warm windows serve the main page's directory; pages elsewhere need their own root
+        main = os.path.join(self.app_root, self.config.get("url", ""))
+        return os.path.dirname(os.path.abspath(url)) == os.path.dirname(
+            os.path.abspath(main)
+        )
+
+    def _warm_window(self):
+        window_config = self.config.copy()
+        window_config.update(
+            {"__app__": self, "navigate_on_init": False, "start_hidden": True}
+        )
+        window = self._new_window(window_config)
+        self._bind_exposed(window)
+        window._prebound = set(self._exposed_functions)
+        # Closing a pooled window hands it back instead of destroying it
+        window._recycle = self.recycle_window
+        if getattr(window, "native", None):
+            window.native.bind("pytron_on_close", window._on_close_requested)
+            window.set_prevent_close(True)
+        return window
+
+    def _adopt_window(self, window, window_config):
+        # Apply the options create_window would have passed to the constructor
+        window.config.update(window_config)
+        window.id = window_config.get("id") or window.id
+        window.set_title(window_config.get("title", "Pytron App"))
+        w, h = window_config.get("dimensions", [800, 600])
+        window.set_size(w, h)
+
+    def recycle_window(self, window):
+        """
+        Hides a closed pooled window and returns it to the pool, or destroys
+        it if the pool is full. Returns True if the window was kept.
+        """
+        if window in self.windows:
+            self.windows.remove(window)
+        pool = getattr(self, "_window_pool", None)
+        if pool and self.is_running:
+            try:
+                window.hide()
+                window.navigate("about:blank")
+                if pool.release(window):
+                    return True
+            except Exception as e:
+                self.logger.debug(f"Failed to recycle window {window}: {e}")
+        window._recycle = None
+        window.close(force=True)
+        return False
+
+    def set_window_pool_size(self, size):
+        """Resizes the window pool, enabling it if needed. 0 closes idle windows."""
+        self.config["window_pool_size"] = size
+        pool = getattr(self, "_window_pool", None)
+        if pool is None:
+            if self.is_running:
+                self._start_window_pool()
+            return
+        for window in pool.resize(size):
+            window._recycle = None
+            window.close(force=True)
+
+    def window_pool_stats(self):
+        """Hit rate and size of the prewarmed window pool, or None if disabled."""
+        pool = getattr(self, "_window_pool", None)
+        return pool.stats() if pool else None
+
     def run(self, **kwargs):
         self.is_running = True
         if "storage_path" not in kwargs:
@@ -147,6 +277,7 @@ class WindowMixin:
                 if self.windows:
                     self.windows[0].emit("pytron:deep-link", {"url": url})
 
+            self._start_window_pool()
             self.windows[0].start()
 
         self.is_running = False
@@ -167,6 +298,8 @@ class WindowMixin:
                     callback()
             except Exception as e:
                 self.logger.error(f"Error in on_exit callback: {e}")
+        # Async on_exit callbacks were the loop's last work
+        stop_event_loop(getattr(self, "_loop", None))
 
         if self.tray:
             self.tray.stop()
@@ -277,7 +410,8 @@ class WindowMixin:
                     self.logger.debug(f"Failed to notify window {window}: {e}")
 
     def quit(self):
-        for window in self.windows:
+        pool = getattr(self, "_window_pool", None)
+        for window in self.windows + (pool.drain() if pool else []):
             window.close(force=True)
 
     def set_menubar(self, menu_bar):
@@ -0,0 +1,58 @@
+import threading
+import contextvars
+from .exceptions import CallCancelled
+
+# Token of the exposed-function call running in the current thread/task
+_current_token = contextvars.ContextVar("pytron_cancel_token", default=None)
+
+
+class CancelToken:
+    """
+    Cooperative cancellation for one call from the frontend. Set when the
+    page aborts the call (AbortSignal) or unloads. Long-running sync handlers
+    poll `cancelled` or call raise_if_cancelled() between units of work.
+    """
+
+    __slots__ = ("_event", "_callbacks", "_lock")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback):
+        """Runs callback() on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CallCancelled("Call was cancelled by the frontend")
+
+    def wait(self, timeout=None):
+        """Sleeps up to `timeout` seconds, returning True early if cancelled."""
+        return self._event.wait(timeout)
+
+
+def current_token():
+    """Returns the CancelToken of the call being handled, or None outside a call."""
+    return _current_token.get()
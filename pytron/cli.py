@@ -193,6 +193,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable auto-inclusion of smart assets (non-code files).",
     )
+    grp_general.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Ship .br/.gz copies of frontend assets for faster loading.",
+    )
 
     # Engine Options
     grp_engine = p_pkg.add_argument_group("Engine Options")
@@ -131,6 +131,7 @@ def cmd_package(args: argparse.Namespace) -> int:
 
     # Pass through some CLI flags to context for module use
     ctx.smart_assets = args.smart_assets
+    ctx.precompress = getattr(args, "precompress", False)
     ctx.build_installer = args.installer
     ctx.bundled = args.bundled
     ctx.collect_all = getattr(args, "collect_all", False)
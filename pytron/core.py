@@ -1,18 +1,27 @@
 # Re-export everything to maintain backward compatibility
 from .utils import get_resource_path
-from .serializer import PytronJSONEncoder, pytron_serialize
+from .serializer import PytronJSONEncoder, pytron_serialize, register_serializer
 from .state import ReactiveState
 from .application import App
 from .webview import Webview
 from .menu import Menu, MenuBar
+from .cancellation import CancelToken, current_token
+from .exceptions import CallCancelled, ArgumentError
+from .eventloop import current_window
 
 __all__ = [
     "get_resource_path",
     "PytronJSONEncoder",
     "pytron_serialize",
+    "register_serializer",
     "ReactiveState",
     "App",
     "Webview",
     "Menu",
     "MenuBar",
+    "CancelToken",
+    "CallCancelled",
+    "ArgumentError",
+    "current_token",
+    "current_window",
 ]
@@ -3,6 +3,7 @@ import sys
 import json
 import logging
 import threading
+import queue
 import socket
 import uuid
 import struct
@@ -15,8 +16,33 @@ try:
 except ImportError:
     pytron_native = None
 
+from .shm import ShmRing, DEFAULT_SHM_SIZE
+
 logger = logging.getLogger("Pytron.ChromeAdapter")
 
+# Set in a frame's length word to mark a binary frame. Its body is
+# <u32 LE header length><JSON header><raw bytes>, so blobs skip base64.
+BINARY_FRAME_FLAG = 0x80000000
+# Results at least this large are sent as binary frames
+BINARY_FRAME_THRESHOLD = 64 * 1024
+# Outbound queue: frames held before senders feel backpressure
+DEFAULT_SEND_QUEUE_SIZE = 4096
+DEFAULT_SEND_TIMEOUT = 5.0
+# The writer joins queued frames into writes of up to this many bytes
+COALESCE_BYTES = 64 * 1024
+
+
+def _frame_size(pieces):
+    return sum(len(piece) for piece in pieces)
+
+
+def _binary_prefix(head, data_len):
+    """Length word, header length and JSON header of a binary frame."""
+    size = 4 + len(head) + data_len
+    if size >= BINARY_FRAME_FLAG:
+        raise ValueError(f"Binary frame too large ({size} bytes)")
+    return struct.pack("<II", size | BINARY_FRAME_FLAG, len(head)) + head
+
 
 class ChromeIPCServer:
     """
@@ -28,7 +54,13 @@ class ChromeIPCServer:
         - \\\\.\\pipe\\pytron-{uuid}-out (Electron Writes -> Python Reads)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue=DEFAULT_SEND_QUEUE_SIZE,
+        backpressure="block",
+        send_timeout=DEFAULT_SEND_TIMEOUT,
+        shm_size=None,
+    ):
         self.connected = False
         self._lock = threading.Lock()
         self.listening_event = threading.Event()
@@ -51,6 +83,27 @@ class ChromeIPCServer:
 
         self.is_windows = sys.platform == "win32"
 
+        # Outbound frames are queued and written by a single writer thread.
+        # When the queue is full, "block" makes senders wait up to
+        # `send_timeout` seconds for room; "drop" discards the new frame.
+        self._outbox = queue.Queue(maxsize=max_queue)
+        self.backpressure = backpressure
+        self.send_timeout = send_timeout
+        self._writer = None
+        self._high_water = 0
+        self._frames_sent = 0
+        self._writes = 0
+        self._bytes_sent = 0
+        self._blocked = 0
+        self._dropped = 0
+
+        # Optional shared-memory ring: offered to the shell by the writer and
+        # used once the shell confirms it could open it (see on_shm_ack)
+        self._shm_size = shm_size
+        self._ring = None
+        self._ring_ready = False
+        self._shm_bytes = 0
+
     def listen(self):
         uid = str(uuid.uuid4())
 
@@ -179,10 +232,12 @@ class ChromeIPCServer:
                 # or until disconnect.
                 while self.connected:
                     threading.Event().wait(1.0)
+                self._close_shm()
                 return
             except Exception as e:
                 logger.error(f"Native IPC Read Loop Error: {e}")
                 self.connected = False
+                self._close_shm()
                 return
 
         while self.connected:
@@ -206,6 +261,7 @@ class ChromeIPCServer:
                 break
         self.connected = False
         # Cleanup
+        self._close_shm()
         if self.is_windows:
             if self._win_in_handle:
                 ctypes.windll.kernel32.CloseHandle(self._win_in_handle)
@@ -250,52 +306,256 @@ class ChromeIPCServer:
             return data
 
     def send(self, data_dict):
+        """
+        Queues one frame. Accepts a dict, or a pre-encoded UTF-8 JSON body
+        (bytes) which is written as-is without another json.dumps pass.
+        """
         if not self.connected:
             return
-        with self._lock:
-            try:
-                body_str = json.dumps(data_dict)
-
-                if self._native:
-                    self._native.send(body_str)
-                    return
-
-                body = body_str.encode("utf-8")
-                header = struct.pack("<I", len(body))
-                full_msg = header + body
-
-                if self.is_windows:
-                    written = ctypes.c_ulong(0)
-                    # Write to IN handle
-                    ctypes.windll.kernel32.WriteFile(
-                        self._win_in_handle,
-                        full_msg,
-                        len(full_msg),
-                        ctypes.byref(written),
-                        None,
+        try:
+            if isinstance(data_dict, (bytes, bytearray)):
+                body = bytes(data_dict)
+            else:
+                body = json.dumps(data_dict).encode("utf-8")
+        except Exception as e:
+            logger.error(f"IPC Send Error: {e}")
+            return
+        self._enqueue((struct.pack("<I", len(body)) + body,))
+
+    def send_binary(self, header, data):
+        """
+        Queues one binary frame: a JSON header dict followed by `data` (bytes
+        or any buffer) as raw bytes. The shell hands them over as a Buffer.
+        """
+        if not self.connected:
+            return
+        try:
+            if not isinstance(data, bytes):
+                # Snapshot mutable buffers; the frame is written later
+                data = bytes(data)
+            prefix = _binary_prefix(json.dumps(header).encode("utf-8"), len(data))
+        except Exception as e:
+            logger.error(f"IPC Send Error: {e}")
+            return
+        self._enqueue((prefix, data))
+
+    def _enqueue(self, pieces):
+        self._ensure_writer()
+        try:
+            if self.backpressure == "drop":
+                self._outbox.put_nowait(pieces)
+            else:
+                try:
+                    self._outbox.put_nowait(pieces)
+                except queue.Full:
+                    # Backpressure: the caller waits for the writer to catch up
+                    self._blocked += 1
+                    self._outbox.put(pieces, timeout=self.send_timeout)
+        except queue.Full:
+            self._dropped += 1
+            logger.warning(
+                f"IPC send queue full ({self._outbox.maxsize} frames), dropping frame"
+            )
+            return
+        depth = self._outbox.qsize()
+        if depth > self._high_water:
+            self._high_water = depth
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._write_loop, daemon=True, name="PytronIPCWriter"
                     )
-                else:
-                    self.conn.sendall(full_msg)
+                    self._writer.start()
+
+    def _write_loop(self):
+        if self._shm_size:
+            self._offer_shm()
+        while True:
+            frames = [self._outbox.get()]
+            size = _frame_size(frames[0])
+            # PERFORMANCE: Gather whatever else is already queued into the same
+            # write, so a burst of small frames costs one syscall
+            while size < COALESCE_BYTES:
+                try:
+                    frames.append(self._outbox.get_nowait())
+                except queue.Empty:
+                    break
+                size += _frame_size(frames[-1])
 
+            try:
+                if self.connected:
+                    rest = self._write_ring(frames) if self._ring_ready else frames
+                    if rest:
+                        self._write_pieces([piece for f in rest for piece in f])
+                    self._frames_sent += len(frames)
+                    self._bytes_sent += size
             except Exception as e:
                 if self.connected:
                     logger.error(f"IPC Send Error: {e}")
                 self.connected = False
+            finally:
+                for _ in frames:
+                    self._outbox.task_done()
+
+    def flush(self):
+        """Blocks until every queued frame has been written (or discarded)."""
+        self._outbox.join()
+
+    def _offer_shm(self):
+        ring = ShmRing.create(self._shm_size)
+        if ring is None:
+            return
+        self._ring = ring
+        head = json.dumps({"action": "shm_attach", **ring.describe()})
+        try:
+            self._write(_binary_prefix(head.encode("utf-8"), 0))
+        except Exception as e:
+            logger.error(f"IPC Send Error: {e}")
+            self._close_shm()
+
+    def on_shm_ack(self, payload):
+        """Called with the shell's reply to the shared-memory offer."""
+        if self._ring is None:
+            return
+        if payload and payload.get("attached"):
+            self._ring_ready = True
+            logger.info(f"Mojo IPC using shared memory ring: {self._ring.path}")
+        else:
+            error = payload.get("error") if payload else None
+            logger.info(
+                f"Shell could not attach shared memory ({error}), using the socket"
+            )
+            self._close_shm()
+
+    def _write_ring(self, frames):
+        """
+        Moves the leading frames that fit into the ring and returns the rest,
+        which go over the socket. The shell handles frames in socket order and
+        reads the ring on each doorbell, so ordering is preserved either way.
+        """
+        free = self._ring.free()
+        count = size = 0
+        for frame in frames:
+            frame_size = _frame_size(frame)
+            if size + frame_size > free:
+                break
+            size += frame_size
+            count += 1
+        if not count:
+            return frames
+
+        # PERFORMANCE: One memcpy into shared memory, then a tiny doorbell
+        # frame over the socket instead of pushing the bytes through the kernel
+        pieces = [piece for frame in frames[:count] for piece in frame]
+        end = self._ring.write(pieces, size)
+        head = json.dumps({"action": "shm_doorbell", "end": end}).encode("utf-8")
+        self._write(_binary_prefix(head, 0))
+        self._shm_bytes += size
+        return frames[count:]
+
+    def _close_shm(self):
+        self._ring_ready = False
+        ring, self._ring = self._ring, None
+        if ring is not None:
+            ring.close()
+
+    def _write_pieces(self, pieces):
+        # Small pieces are joined into one write; large payloads go out as-is
+        # instead of being copied into the joined buffer
+        small = []
+        for piece in pieces:
+            if len(piece) < COALESCE_BYTES:
+                small.append(piece)
+                continue
+            if small:
+                self._write(b"".join(small))
+                small = []
+            self._write(piece)
+        if small:
+            self._write(b"".join(small))
+
+    def _write(self, data):
+        self._writes += 1
+        if self._native:
+            self._native.write(data)
+        elif self.is_windows:
+            written = ctypes.c_ulong(0)
+            # Write to IN handle
+            ctypes.windll.kernel32.WriteFile(
+                self._win_in_handle,
+                data,
+                len(data),
+                ctypes.byref(written),
+                None,
+            )
+        else:
+            self.conn.sendall(data)
+
+    def stats(self):
+        """Outbound queue metrics."""
+        return {
+            "queued": self._outbox.qsize(),
+            "max_queue": self._outbox.maxsize,
+            "high_water": self._high_water,
+            "frames_sent": self._frames_sent,
+            "writes": self._writes,
+            "bytes_sent": self._bytes_sent,
+            "blocked": self._blocked,
+            "dropped": self._dropped,
+            "shm": self._ring_ready,
+            "shm_bytes": self._shm_bytes,
+        }
 
 
 class ChromeAdapter:
+    # Running adapters shared by windows in chrome_shared_process mode
+    _shared = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, binary_path, config=None):
         self.binary_path = binary_path
         self.config = config or {}
         self.process = None
         self.ipc = None
         self.ready = False
-        self._raw_callback = None
+        self._callbacks = {}  # window id -> raw message callback
+        self._window_count = 0
         self._queue = []
         self._flush_lock = threading.Lock()
 
+    @classmethod
+    def shared(cls, binary_path, config=None):
+        """
+        Returns the running adapter for `binary_path`, starting one if needed.
+        Windows opened on it share one Electron process and one IPC connection.
+        """
+        with cls._shared_lock:
+            adapter = cls._shared.get(binary_path)
+            if adapter is None or (
+                adapter.process is not None and adapter.process.poll() is not None
+            ):
+                adapter = cls(binary_path, config)
+                adapter.start()
+                cls._shared[binary_path] = adapter
+            return adapter
+
+    def open_channel(self, config=None):
+        """Returns a ChromeChannel for a new window on this shell."""
+        with self._flush_lock:
+            self._window_count += 1
+            window_id = f"w{self._window_count}"
+        return ChromeChannel(self, window_id, config)
+
     def start(self):
-        self.ipc = ChromeIPCServer()
+        self.ipc = ChromeIPCServer(
+            max_queue=self.config.get("ipc_queue_size", DEFAULT_SEND_QUEUE_SIZE),
+            backpressure=self.config.get("ipc_backpressure", "block"),
+            send_timeout=self.config.get("ipc_send_timeout", DEFAULT_SEND_TIMEOUT),
+            shm_size=self._shm_size(),
+        )
 
         # Start the server thread
         def _server_launcher():
@@ -363,6 +623,11 @@ class ChromeAdapter:
             target=self._proxy_logs, args=(self.process.stderr, "STDERR"), daemon=True
         ).start()
 
+    def _shm_size(self):
+        # ipc_shared_memory: ring size in bytes, or True for the default size
+        size = self.config.get("ipc_shared_memory")
+        return DEFAULT_SHM_SIZE if size is True else size
+
     def _proxy_logs(self, pipe, prefix):
         try:
             while True:
@@ -402,12 +667,18 @@ class ChromeAdapter:
             while self._queue:
                 msg = self._queue.pop(0)
                 try:
+                    # Binary frames are queued as (header, data) tuples
+                    binary = isinstance(msg, tuple)
+                    head = msg[0] if binary else msg
                     # Log the critical 'show' or 'init' commands to verify order
-                    action = msg.get("action") if isinstance(msg, dict) else "unknown"
+                    action = head.get("action") if isinstance(head, dict) else "unknown"
                     if action in ["init", "show", "navigate"]:
                         logger.info(f"Flushing critical command: {action}")
 
-                    self.ipc.send(msg)
+                    if binary:
+                        self.ipc.send_binary(*msg)
+                    else:
+                        self.ipc.send(msg)
                     flushed += 1
                     # Reduced sleep to 0, relying on OS buffering
                 except Exception as e:
@@ -426,13 +697,29 @@ class ChromeAdapter:
         payload = msg.get("payload")
         logger.debug(f"Mojo Received: {msg_type} -> {payload}")
 
+        if msg_type == "shm":
+            # Transport-level: reply to the shared-memory ring offer
+            if self.ipc:
+                self.ipc.on_shm_ack(payload)
+            return
+
         if msg_type == "lifecycle" and payload == "app_ready":
             logger.info("Mojo Handshake (app_ready) received. Initiating flush.")
             self.ready = True
             threading.Thread(target=self._flush_queue, daemon=True).start()
 
-        if self._raw_callback:
-            self._raw_callback(msg)
+        # Route by window id; shell-wide messages go to every window, but an
+        # untagged call must still run exactly once
+        callbacks = list(self._callbacks.values())
+        window_id = msg.get("window")
+        if window_id in self._callbacks:
+            self._callbacks[window_id](msg)
+        elif msg_type == "ipc":
+            if callbacks:
+                callbacks[0](msg)
+        else:
+            for callback in callbacks:
+                callback(msg)
 
     def send(self, payload):
         if self.ipc and self.ipc.connected and self.ready:
@@ -441,5 +728,59 @@ class ChromeAdapter:
             with self._flush_lock:
                 self._queue.append(payload)
 
+    def send_binary(self, header, data):
+        if self.ipc and self.ipc.connected and self.ready:
+            self.ipc.send_binary(header, data)
+        else:
+            with self._flush_lock:
+                self._queue.append((header, data))
+
+    def ipc_stats(self):
+        """Outbound IPC queue metrics, plus frames held until the shell is ready."""
+        stats = self.ipc.stats() if self.ipc else {}
+        stats["pending"] = len(self._queue)
+        return stats
+
+    def bind_raw(self, callback, window_id=None):
+        self._callbacks[window_id] = callback
+
+    def unbind_raw(self, window_id=None):
+        self._callbacks.pop(window_id, None)
+
+
+class ChromeChannel:
+    """
+    One window's view of a ChromeAdapter. Outbound frames are tagged with the
+    window id so the shell applies them to that BrowserWindow, and inbound
+    messages tagged with it are routed back to this window only.
+    """
+
+    def __init__(self, adapter, window_id, config=None):
+        self.adapter = adapter
+        self.window_id = window_id
+        self.config = config if config is not None else adapter.config
+        self._tag = b'{"window":%s,' % json.dumps(window_id).encode("utf-8")
+
+    @property
+    def process(self):
+        return self.adapter.process
+
+    def send(self, payload):
+        if isinstance(payload, (bytes, bytearray)):
+            # Pre-encoded JSON object: splice the tag in instead of re-encoding
+            payload = self._tag + bytes(payload[1:])
+        else:
+            payload = {**payload, "window": self.window_id}
+        self.adapter.send(payload)
+
+    def send_binary(self, header, data):
+        self.adapter.send_binary({**header, "window": self.window_id}, data)
+
+    def ipc_stats(self):
+        return self.adapter.ipc_stats()
+
     def bind_raw(self, callback):
-        self._raw_callback = callback
+        self.adapter.bind_raw(callback, self.window_id)
+
+    def unbind_raw(self):
+        self.adapter.unbind_raw(self.window_id)
@@ -1,14 +1,16 @@
 import os
 import sys
 import json
+import time
 import logging
 import ctypes
 import platform
 import subprocess
 import urllib.parse
 from ...webview import Webview
-from .adapter import ChromeAdapter
-from ...serializer import pytron_serialize
+from .adapter import ChromeAdapter, BINARY_FRAME_THRESHOLD
+from ...vap import DEFAULT_VAP_MAX_BYTES
+from ...eventloop import start_event_loop
 
 
 def _to_str(b):
@@ -95,16 +97,26 @@ class ChromeBridge:
         self.adapter.send({"action": "bind", "name": n})
 
     def webview_return(self, w, seq, status, result):
-        try:
-            if result is None:
-                res_obj = None
-            else:
-                res_obj = json.loads(_to_str(result))
-        except:
-            res_obj = _to_str(result)
+        # PERFORMANCE: `result` is already-encoded JSON, so splice it into the
+        # reply frame instead of decoding and re-encoding it.
+        if result is None:
+            result = b"null"
+        elif isinstance(result, str):
+            result = result.encode("utf-8")
+
+        if len(result) >= BINARY_FRAME_THRESHOLD:
+            # Large results go out as raw bytes: the shell splices them into the
+            # resolving script without a JSON.parse/JSON.stringify round-trip
+            self.adapter.send_binary(
+                {"action": "reply", "id": _to_str(seq), "status": int(status)},
+                result,
+            )
+            return
 
+        seq_json = json.dumps(_to_str(seq)).encode("utf-8")
         self.adapter.send(
-            {"action": "reply", "id": _to_str(seq), "status": status, "result": res_obj}
+            b'{"action":"reply","id":%s,"status":%d,"result":%s}'
+            % (seq_json, int(status), result)
         )
 
     def webview_get_window(self, w):
@@ -160,7 +172,19 @@ class ChromeWebView(Webview):
             ).futures.ThreadPoolExecutor(max_workers=5)
 
         self._bound_functions = {}
+        self._dispatchers = {}
+        self.call_timings = self.app.call_timings if self.app else None
+        self._inflight = {}
+        self._streams = {}
+        self._recycle = None
         self._served_data = {}
+        self._vap_stats = None
+
+        # Event loop for async handlers: the app-wide one unless disabled
+        if self.app and self.app.shared_loop:
+            self.loop = self.app.loop
+        else:
+            self.loop = start_event_loop("Pytron-Loop-Chrome")
 
         # 3. Resolve Chrome Binary
         shell_path = config.get("engine_path")
@@ -266,10 +290,22 @@ class ChromeWebView(Webview):
 
         # 5. Initialize Bridge & Start Adapter
         self.logger.info(f"Using Chrome Shell (v3): {shell_path}")
-        self.adapter = ChromeAdapter(shell_path, config)
+        if config.get("chrome_shared_process"):
+            # PERFORMANCE: Every window shares one Electron process and IPC
+            # connection; frames are routed by window id
+            shell = ChromeAdapter.shared(shell_path, config)
+        else:
+            shell = ChromeAdapter(shell_path, config)
+            shell.start()
+        self.adapter = shell.open_channel(config)
         self.bridge = ChromeBridge(self.adapter)
-
-        self.adapter.start()
+        if config.get("chrome_shared_process") and navigate_url.startswith(
+            "pytron://app/"
+        ):
+            # The shell resolves pytron://<window id>/ against this window's root
+            navigate_url = navigate_url.replace(
+                "pytron://app/", f"pytron://{self.adapter.window_id}/", 1
+            )
         self.adapter.bind_raw(self._handle_ipc_message)
 
         # Mock Window Object
@@ -425,6 +461,15 @@ class ChromeWebView(Webview):
         # Sometimes init flag is overridden by window style defaults in Electron
         self.bridge.adapter.send({"action": "set_resizable", "resizable": True})
 
+        # Bound the shell's pytron:// memory store the same way as the native VAP
+        self.bridge.adapter.send(
+            {
+                "action": "vap_config",
+                "max_bytes": self.config.get("vap_max_bytes", DEFAULT_VAP_MAX_BYTES),
+                "ttl": self.config.get("vap_ttl"),
+            }
+        )
+
     @property
     def hwnd(self):
         """Override to return Electron HWND instead of native engine HWND."""
@@ -433,9 +478,6 @@ class ChromeWebView(Webview):
         return 0
 
     def _handle_ipc_message(self, msg):
-        import inspect
-        import asyncio
-
         msg_type = msg.get("type")
         payload = msg.get("payload")
 
@@ -443,6 +485,10 @@ class ChromeWebView(Webview):
         if msg_type == "lifecycle":
             self.logger.info(f"Chrome Lifecycle Event: {payload}")
 
+        if msg_type == "vap_stats":
+            self._vap_stats = payload
+            return
+
         # HWND Sync
         if (
             msg_type == "lifecycle"
@@ -467,34 +513,77 @@ class ChromeWebView(Webview):
                 args = inner_payload
                 seq = None
 
-            if event in self._bound_functions:
-                func = self._bound_functions[event]
-                try:
-                    result = func(*args) if isinstance(args, list) else func(args)
+            if event == "__pytron_batch":
+                self._handle_ipc_batch(args, seq)
+                return
+
+            # PERFORMANCE: Never run handlers on the reader thread. The dispatcher
+            # hands them to the thread pool / event loop, exactly like the native
+            # engine, and replies carry the seq so they may arrive out of order.
+            if event in self._dispatchers:
+                if not isinstance(args, list):
+                    args = [args]
+                timer = self._call_timer(event, args)
+                respond = self._responder(event, seq, timer)
+                self._dispatchers[event](args, respond, seq, timer)
+
+    def _responder(self, name, seq, timer=None):
+        def _respond(status, result):
+            if not seq:
+                return
+            encoding = time.perf_counter()
+            status, payload = self._encode_reply(name, status, result)
+            sending = time.perf_counter()
+            self.bridge.webview_return(self.w, seq.encode("utf-8"), status, payload)
+            if timer is not None:
+                timer.record(
+                    status, result, sending - encoding, time.perf_counter() - sending
+                )
 
-                    if inspect.iscoroutine(result):
-                        try:
-                            result = asyncio.run(result)
-                        except RuntimeError:
-                            pass
+        return _respond
 
-                    safe_obj = pytron_serialize(result, None)
-                    serialized_json = json.dumps(safe_obj)
+    def _handle_ipc_batch(self, calls, seq):
+        """
+        PERFORMANCE: Calls made by the frontend in the same microtask arrive as
+        one message of [seq, event, args] triples. They are dispatched together
+        and answered with a single reply.
+        """
+        calls = calls or []
+        timers = [self._call_timer(event, args) for _, event, args in calls]
+
+        def _finish(entries):
+            if not seq:
+                return
+            encoding = time.perf_counter()
+            payload = self._encode_batch(entries)
+            sending = time.perf_counter()
+            self.bridge.webview_return(self.w, seq.encode("utf-8"), 0, payload)
+            self._record_batch(
+                timers, entries, sending - encoding, time.perf_counter() - sending
+            )
 
-                    if seq:
-                        self.bridge.webview_return(
-                            self.w, seq.encode("utf-8"), 0, serialized_json
-                        )
-                except Exception as e:
-                    self.logger.error(f"Mojo IPC Error in {event}: {e}")
-                    if seq:
-                        safe_err = pytron_serialize(str(e), None)
-                        self.bridge.webview_return(
-                            self.w, seq.encode("utf-8"), 1, json.dumps(safe_err)
-                        )
+        self._run_batch(
+            [
+                (call_seq, event, self._call_starter(event, args, call_seq, timer))
+                for (call_seq, event, args), timer in zip(calls, timers)
+            ],
+            _finish,
+        )
 
-    def bind(self, name, func, run_in_thread=True, secure=False):
+    def bind(
+        self,
+        name,
+        func,
+        run_in_thread=True,
+        secure=False,
+        gate=None,
+        cache=None,
+        validator=None,
+    ):
         self._bound_functions[name] = func
+        self._dispatchers[name] = self._make_dispatcher(
+            name, func, run_in_thread, gate, cache, validator
+        )
         self.bridge.webview_bind(self.w, name.encode("utf-8"), None, None)
 
     # --- Feature Overrides (Compatibility Layer) ---
@@ -502,19 +591,14 @@ class ChromeWebView(Webview):
     def center(self):
         self.bridge.adapter.send({"action": "center"})
 
-    def serve_data(self, key, data, mime="application/octet-stream"):
+    def serve_data(self, key, data, mime="application/octet-stream", ttl=None):
         """Sends binary data to the Node process for pytron:// serving."""
-        import base64
-
         try:
-            b64_data = base64.b64encode(data).decode("utf-8")
-            self.bridge.adapter.send(
-                {
-                    "action": "serve_data",
-                    "key": key,
-                    "data": b64_data,
-                    "mime": mime,
-                }
+            # PERFORMANCE: Binary frame, so the blob is neither base64-encoded
+            # here nor decoded again in the shell
+            self.bridge.adapter.send_binary(
+                {"action": "serve_data", "key": key, "mime": mime, "ttl": ttl},
+                data,
             )
         except Exception as e:
             self.logger.error(f"Failed to serve data for key {key}: {e}")
@@ -522,6 +606,18 @@ class ChromeWebView(Webview):
     def unserve_data(self, key):
         self.bridge.adapter.send({"action": "unserve_data", "key": key})
 
+    def vap_stats(self):
+        """
+        Returns the last stats snapshot reported by the shell's pytron:// store
+        (None until the first report) and asks the shell for a fresh one.
+        """
+        self.bridge.adapter.send({"action": "vap_stats"})
+        return self._vap_stats
+
+    def ipc_stats(self):
+        """Outbound IPC queue depth, write coalescing and backpressure counters."""
+        return self.bridge.adapter.ipc_stats()
+
     def set_icon(self, icon_path):
         pass
 
@@ -535,7 +631,11 @@ class ChromeWebView(Webview):
         self.bridge.webview_hide(self.w)
 
     def close(self, force=False):
+        if not force and self._recycle:
+            self._recycle(self)
+            return
         self.bridge.webview_destroy(self.w)
+        self.adapter.unbind_raw()
 
     def set_title(self, title):
         self.bridge.webview_set_title(self.w, title.encode("utf-8"))
@@ -544,6 +644,7 @@ class ChromeWebView(Webview):
         self.bridge.webview_set_size(self.w, w, h, 0)
 
     def navigate(self, url):
+        self._cancel_calls()
         self.bridge.webview_navigate(self.w, url.encode("utf-8"))
 
     def eval(self, js):
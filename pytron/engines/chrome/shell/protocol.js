@@ -0,0 +1,177 @@
+// pytron:// file serving: byte ranges, ETag revalidation and Cache-Control.
+// Kept free of Electron imports so it can be exercised with plain Node.
+const fs = require('fs');
+const path = require('path');
+const { Readable } = require('stream');
+
+const IMMUTABLE_CACHE = 'public, max-age=31536000, immutable';
+const REVALIDATE_CACHE = 'no-cache';
+
+// Bundler output like index-4f9a2c1b.js, app.3b8e0d97f1.css (hex, webpack)
+// or index-BXq3fA_z.js (Rollup/Vite): the last dot/dash segment of the name
+// must be hex with letters and digits, or 8 mixed-case base64url characters.
+// Anything else (settings-backup22.js, report-20240101.js) is revalidated.
+const HEX_HASH = /^(?=.*\d)(?=.*[a-f])[0-9a-f]{8,}$/;
+const BASE64_HASH = /^(?=.*\d)(?=.*[a-z])(?=.*[A-Z])[A-Za-z0-9_]{8}$/;
+
+function getMimeType(filename) {
+    if (filename.endsWith('.js')) return 'text/javascript';
+    if (filename.endsWith('.css')) return 'text/css';
+    if (filename.endsWith('.html')) return 'text/html';
+    if (filename.endsWith('.json')) return 'application/json';
+    if (filename.endsWith('.png')) return 'image/png';
+    if (filename.endsWith('.jpg') || filename.endsWith('.jpeg')) return 'image/jpeg';
+    if (filename.endsWith('.svg')) return 'image/svg+xml';
+    if (filename.endsWith('.webp')) return 'image/webp';
+    if (filename.endsWith('.ico')) return 'image/x-icon';
+    if (filename.endsWith('.mp4')) return 'video/mp4';
+    if (filename.endsWith('.webm')) return 'video/webm';
+    if (filename.endsWith('.mp3')) return 'audio/mpeg';
+    if (filename.endsWith('.wasm')) return 'application/wasm';
+    return 'application/octet-stream';
+}
+
+const isHashedAsset = (filePath) => {
+    const name = path.basename(filePath);
+    const stem = name.slice(0, name.length - path.extname(name).length);
+    const separator = Math.max(stem.lastIndexOf('.'), stem.lastIndexOf('-'));
+    if (separator < 0) return false;
+    const hash = stem.slice(separator + 1);
+    return HEX_HASH.test(hash) || BASE64_HASH.test(hash);
+};
+
+// Parses a single 'bytes=' range. Returns null to send the whole body
+// (no header, multiple or malformed ranges), false if unsatisfiable.
+function parseRange(header, size) {
+    const match = /^bytes=(\d*)-(\d*)$/.exec((header || '').trim());
+    if (!match || (!match[1] && !match[2])) return null;
+    let start, end;
+    if (!match[1]) {
+        // bytes=-N: the last N bytes
+        const suffix = Number(match[2]);
+        if (suffix === 0) return false;
+        start = Math.max(0, size - suffix);
+        end = size - 1;
+    } else {
+        start = Number(match[1]);
+        end = match[2] ? Math.min(Number(match[2]), size - 1) : size - 1;
+    }
+    if (start >= size || start > end) return false;
+    return { start, end };
+}
+
+// Weak validator from size and modification time, so no hashing is needed
+const etagFor = (stat) => `W/"${stat.size.toString(16)}-${Math.floor(stat.mtimeMs).toString(16)}"`;
+
+const etagMatches = (ifNoneMatch, etag) => {
+    if (!ifNoneMatch) return false;
+    const bare = etag.replace(/^W\//, '');
+    return ifNoneMatch.split(',').some((tag) => {
+        tag = tag.trim();
+        return tag === '*' || tag.replace(/^W\//, '') === bare;
+    });
+};
+
+// Encodings with precompressed siblings, in order of preference
+const PRECOMPRESSED = [['br', '.br'], ['gzip', '.gz']];
+
+// True if an Accept-Encoding header allows `encoding` (i.e. not refused with q=0)
+const acceptsEncoding = (accept, encoding) => (accept || '').split(',').some((part) => {
+    const [name, ...params] = part.split(';').map((field) => field.trim());
+    const refused = params.some((param) => /^q=0(\.0*)?$/.test(param));
+    return name.toLowerCase() === encoding && !refused;
+});
+
+// Finds an up to date <file>.br or <file>.gz the client accepts
+function precompressedVariant(filePath, stat, accept) {
+    for (const [encoding, suffix] of PRECOMPRESSED) {
+        if (!acceptsEncoding(accept, encoding)) continue;
+        try {
+            const encoded = fs.statSync(filePath + suffix);
+            // A sibling older than the file it was built from is stale
+            if (encoded.isFile() && encoded.mtimeMs >= stat.mtimeMs) {
+                return { filePath: filePath + suffix, stat: encoded, encoding };
+            }
+        } catch (e) {
+            // No sibling for this encoding
+        }
+    }
+    return null;
+}
+
+// Answers a request for `body` (a Buffer, or a file path with its `stat`)
+// honouring Range and If-None-Match. Files are streamed, never read whole.
+function respond(request, { body, filePath, stat, mimeType, etag, cacheControl, encoding }) {
+    const size = body ? body.length : stat.size;
+    const headers = {
+        'content-type': mimeType,
+        'accept-ranges': 'bytes',
+        'cache-control': cacheControl,
+    };
+    if (encoding) {
+        headers['content-encoding'] = encoding;
+    }
+    if (etag) {
+        headers['etag'] = etag;
+        if (etagMatches(request.headers.get('if-none-match'), etag)) {
+            return new Response(null, { status: 304, headers });
+        }
+    }
+
+    const range = parseRange(request.headers.get('range'), size);
+    if (range === false) {
+        headers['content-range'] = `bytes */${size}`;
+        return new Response(null, { status: 416, headers });
+    }
+    const { start, end } = range || { start: 0, end: size - 1 };
+    headers['content-length'] = String(end - start + 1);
+    if (range) {
+        headers['content-range'] = `bytes ${start}-${end}/${size}`;
+    }
+
+    let payload;
+    if (body) {
+        payload = body.subarray(start, end + 1);
+    } else if (size === 0) {
+        payload = Buffer.alloc(0);
+    } else {
+        payload = Readable.toWeb(fs.createReadStream(filePath, { start, end }));
+    }
+    return new Response(payload, { status: range ? 206 : 200, headers });
+}
+
+// Serves a file under the project root, or returns null if there is none
+function serveFile(request, filePath) {
+    let stat;
+    try {
+        stat = fs.statSync(filePath);
+    } catch (e) {
+        return null;
+    }
+    if (!stat.isFile()) return null;
+    const mimeType = getMimeType(filePath);
+    const cacheControl = isHashedAsset(filePath) ? IMMUTABLE_CACHE : REVALIDATE_CACHE;
+
+    // PERFORMANCE: Serve a precompressed sibling (.br/.gz) when the webview
+    // accepts it. Ranges always address the uncompressed bytes.
+    const variant = request.headers.get('range')
+        ? null
+        : precompressedVariant(filePath, stat, request.headers.get('accept-encoding'));
+    const response = variant
+        ? respond(request, {
+            ...variant,
+            mimeType,
+            cacheControl,
+            // Each representation gets its own validator
+            etag: etagFor(variant.stat).replace(/"$/, `-${variant.encoding}"`),
+        })
+        : respond(request, { filePath, stat, mimeType, cacheControl, etag: etagFor(stat) });
+    response.headers.set('vary', 'Accept-Encoding');
+    return response;
+}
+
+// Serves an in-memory (VAP) asset; these change under the same key, so never cache
+const serveBuffer = (request, buffer, mimeType) =>
+    respond(request, { body: buffer, mimeType, cacheControl: 'no-store' });
+
+module.exports = { getMimeType, parseRange, isHashedAsset, etagFor, serveFile, serveBuffer };
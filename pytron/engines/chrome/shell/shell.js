@@ -2,6 +2,7 @@ const { app, BrowserWindow, ipcMain, protocol, shell, session } = require('elect
 const path = require('path');
 const net = require('net');
 const fs = require('fs');
+const { serveFile, serveBuffer } = require('./protocol');
 
 // Disable GPU if requested or for compatibility (user can toggle via flags if needed)
 if (process.argv.includes('--disable-gpu')) {
@@ -29,25 +30,19 @@ const log = (msg) => {
 
 log("--- MOJO SHELL BOOTING V7 (UNRESTRICTED) ---");
 
-// Determine Root
+// Determine Root (fallback until a window's init brings its own)
 const rootArg = process.argv.find(arg => arg.startsWith('--pytron-root='));
-let PROJECT_ROOT = rootArg ? rootArg.split('=')[1] : null;
-if (PROJECT_ROOT && PROJECT_ROOT.startsWith('"') && PROJECT_ROOT.endsWith('"')) {
-    PROJECT_ROOT = PROJECT_ROOT.substring(1, PROJECT_ROOT.length - 1);
+let DEFAULT_ROOT = rootArg ? rootArg.split('=')[1] : null;
+if (DEFAULT_ROOT && DEFAULT_ROOT.startsWith('"') && DEFAULT_ROOT.endsWith('"')) {
+    DEFAULT_ROOT = DEFAULT_ROOT.substring(1, DEFAULT_ROOT.length - 1);
 }
+// Project roots by window id. pytron:// requests don't say which window made
+// them, so a shared shell serves each window from pytron://<window id>/;
+// any other host (pytron://app/) resolves against the first window's root.
+const projectRoots = new Map();
 
-// Helper for MIME types
-function getMimeType(filename) {
-    if (filename.endsWith('.js')) return 'text/javascript';
-    if (filename.endsWith('.css')) return 'text/css';
-    if (filename.endsWith('.html')) return 'text/html';
-    if (filename.endsWith('.json')) return 'application/json';
-    if (filename.endsWith('.png')) return 'image/png';
-    if (filename.endsWith('.jpg') || filename.endsWith('.jpeg')) return 'image/jpeg';
-    if (filename.endsWith('.svg')) return 'image/svg+xml';
-    if (filename.endsWith('.webp')) return 'image/webp';
-    if (filename.endsWith('.ico')) return 'image/x-icon';
-    return 'application/octet-stream';
+function rootFor(host) {
+    return projectRoots.get(host) || projectRoots.values().next().value || DEFAULT_ROOT;
 }
 
 const WINDOW_CONFIG = {
@@ -66,12 +61,261 @@ const WINDOW_CONFIG = {
     }
 };
 
-let mainWindow;
+// BrowserWindows by Pytron window id. Frames from Python carry a `window`
+// field (DEFAULT_WINDOW when absent), so one shell process can host every
+// window of an app.
+const DEFAULT_WINDOW = 'main';
+const windows = new Map();
+const windowScripts = new Map(); // window id -> init_script / bind stubs
 let clientIn = null;  // We Read
 let clientOut = null; // We Write
 let client = null;    // Legacy TCP or Unix Socket
-let buffer = Buffer.alloc(0);
-let initScripts = [];
+// Incoming frames: <u32 LE length><body>. With BINARY_FRAME_FLAG set in the
+// length word the body is <u32 LE header length><JSON header><raw bytes>, and
+// the raw bytes reach the command as a Buffer (command.data), no base64 step.
+const BINARY_FRAME_FLAG = 0x80000000;
+let inbox = [];      // Received chunks not yet parsed
+let inboxBytes = 0;
+let frameBytes = 4;  // Bytes needed before the next frame can be parsed
+// Results may carry {__pytron_type__: 'ndarray'} descriptors whose raw bytes
+// live in servedData; the page swaps them for ready-made TypedArrays.
+const HYDRATE_SCRIPT = `
+    window.__pytron_hydrate = (function() {
+        const TYPES = {
+            int8: Int8Array, uint8: Uint8Array, int16: Int16Array, uint16: Uint16Array,
+            int32: Int32Array, uint32: Uint32Array, int64: BigInt64Array, uint64: BigUint64Array,
+            float32: Float32Array, float64: Float64Array, bool: Uint8Array
+        };
+        const load = async (d) => {
+            let buf;
+            if (d.data !== undefined) {
+                const bin = atob(d.data);
+                const bytes = new Uint8Array(bin.length);
+                for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                buf = bytes.buffer;
+            } else {
+                buf = await (await fetch(d.url)).arrayBuffer();
+            }
+            const arr = new TYPES[d.dtype](buf);
+            arr.dtype = d.dtype;
+            arr.shape = d.shape;
+            return arr;
+        };
+        const isArray = (v) => v !== null && typeof v === 'object' && v.__pytron_type__ === 'ndarray';
+        const isStream = (v) => v.__pytron_type__ === 'stream';
+        return (value) => {
+            if (value === null || typeof value !== 'object') return value;
+            if (isArray(value)) return load(value);
+            if (isStream(value)) return window.__pytron_stream(value.id);
+            const jobs = [];
+            const visit = (node) => {
+                for (const k in node) {
+                    const child = node[k];
+                    if (child === null || typeof child !== 'object') continue;
+                    if (isArray(child)) jobs.push(load(child).then(a => { node[k] = a; }));
+                    else if (isStream(child)) node[k] = window.__pytron_stream(child.id);
+                    else visit(child);
+                }
+            };
+            visit(value);
+            return jobs.length ? Promise.all(jobs).then(() => value) : value;
+        };
+    })();
+`;
+// Calls made in the same microtask are sent as one '__pytron_batch' message and
+// answered with one reply carrying [seq, status, value] entries. A trailing
+// AbortSignal argument cancels the call in Python ('__pytron_cancel', sent
+// without an id, so Python sends no reply).
+const BATCH_SCRIPT = `
+    window.__pytron_enqueue = (function() {
+        let queue = null;
+        const newSeq = () => Math.random().toString(36).substr(2, 9);
+        const emit = (event, payload) => {
+            if (window.__pytron_native_bridge) {
+                window.__pytron_native_bridge.emit(event, payload);
+            } else if (window.pytron && window.pytron.emit) {
+                window.pytron.emit(event, payload);
+            }
+        };
+        const settle = (seq, status, value) => {
+            const p = window._pytron_promises[seq];
+            if (!p) return;
+            delete window._pytron_promises[seq];
+            if (status === 0) p.resolve(value); else p.reject(value);
+        };
+        const cancel = (seq, reason) => {
+            const p = window._pytron_promises[seq];
+            if (!p) return;
+            delete window._pytron_promises[seq];
+            p.reject(reason);
+            // Not sent yet: dropping it from the queue is enough
+            const queued = queue ? queue.findIndex(c => c[0] === seq) : -1;
+            if (queued >= 0) return queue.splice(queued, 1);
+            emit('__pytron_cancel', { data: [[seq]] });
+        };
+        const flush = () => {
+            const calls = queue;
+            queue = null;
+            if (!calls.length) return;
+            if (calls.length === 1) return emit(calls[0][1], { data: calls[0][2], id: calls[0][0] });
+            const seq = newSeq();
+            window._pytron_promises[seq] = {
+                resolve: (v) => Promise.resolve(v).then(entries => entries.forEach(e => settle(e[0], e[1], e[2]))),
+                reject: (err) => calls.forEach(c => settle(c[0], 1, err))
+            };
+            emit('__pytron_batch', { data: calls, id: seq });
+        };
+        // Whatever is still pending when the page goes away is abandoned
+        window.addEventListener('pagehide', () => {
+            const pending = Object.keys(window._pytron_promises || {});
+            if (pending.length) emit('__pytron_cancel', { data: [pending] });
+        });
+        return (name, args) => {
+            const seq = newSeq();
+            const last = args[args.length - 1];
+            const signal = typeof AbortSignal !== 'undefined' && last instanceof AbortSignal ? args.pop() : null;
+            if (signal && signal.aborted) return Promise.reject(signal.reason);
+            const promise = new Promise((resolve, reject) => {
+                window._pytron_promises = window._pytron_promises || {};
+                window._pytron_promises[seq] = { resolve, reject };
+                if (!queue) {
+                    queue = [];
+                    queueMicrotask(flush);
+                }
+                queue.push([seq, name, args]);
+            });
+            if (signal) signal.addEventListener('abort', () => cancel(seq, signal.reason), { once: true });
+            return promise;
+        };
+    })();
+`;
+// Generator handlers answer with a stream descriptor; see the comment inside.
+const STREAM_SCRIPT = `
+    // --- STREAMED RESULTS ---
+    // Generator handlers answer with {__pytron_type__: 'stream', id}; hydrate turns
+    // that into an async iterator fed by 'pytron:stream' events. Credits go back
+    // in halves of the window Python starts with, so it never runs far ahead.
+    window.__pytron_stream = window.__pytron_stream || (function() {
+        const WINDOW = 16;
+        const streams = {};
+        const call = (method, args) => (window.__pytron_enqueue || window.__pytron_native_bridge)(method, args);
+        const state = (id) => streams[id] || (streams[id] = { chunks: [], done: false, error: undefined, wake: null, used: 0 });
+        window.addEventListener('pytron:stream', (e) => {
+            const d = e.detail;
+            const s = state(d.id);
+            if ('chunk' in d) s.chunks.push(d.chunk);
+            else if ('error' in d) s.error = d.error;
+            else s.done = true;
+            if (s.wake) { s.wake(); s.wake = null; }
+        });
+        return (id) => {
+            const s = state(id);
+            const finished = () => s.done || s.error !== undefined;
+            return {
+                [Symbol.asyncIterator]() { return this; },
+                async next() {
+                    while (!s.chunks.length) {
+                        if (finished()) {
+                            delete streams[id];
+                            if (s.error !== undefined) throw s.error;
+                            return { value: undefined, done: true };
+                        }
+                        await new Promise((resolve) => { s.wake = resolve; });
+                    }
+                    const value = s.chunks.shift();
+                    if (++s.used >= WINDOW / 2 && !finished()) {
+                        call('__pytron_stream_credit', [id, s.used]);
+                        s.used = 0;
+                    }
+                    return { value: await (window.__pytron_hydrate ? window.__pytron_hydrate(value) : value), done: false };
+                },
+                async return() {
+                    // Stopped early (break, or an error in the loop body)
+                    if (!finished()) call('__pytron_cancel', [[id]]);
+                    delete streams[id];
+                    return { value: undefined, done: true };
+                }
+            };
+        };
+    })();
+`;
+// Mirrors dict/list state values so 'pytron:state-patch' (RFC 6902) can be
+// applied in the page and re-dispatched as a full 'pytron:state-update'.
+const STATE_SCRIPT = `
+    (function() {
+        const mirror = {};
+        const resyncing = {};
+        const unescape = (s) => s.replace(/~1/g, '/').replace(/~0/g, '~');
+        const applyPatch = (doc, ops) => {
+            // Copy each container once per patch so listeners get fresh references
+            const fresh = new WeakSet();
+            const own = (node) => {
+                if (fresh.has(node)) return node;
+                const copy = Array.isArray(node) ? node.slice() : Object.assign({}, node);
+                fresh.add(copy);
+                return copy;
+            };
+            for (const op of ops) {
+                const parts = op.path.split('/').slice(1).map(unescape);
+                if (!parts.length) { doc = op.value; continue; }
+                doc = own(doc);
+                let node = doc;
+                for (let i = 0; i < parts.length - 1; i++) node = node[parts[i]] = own(node[parts[i]]);
+                const last = parts[parts.length - 1];
+                if (Array.isArray(node)) {
+                    const index = last === '-' ? node.length : Number(last);
+                    if (op.op === 'add') node.splice(index, 0, op.value);
+                    else if (op.op === 'remove') node.splice(index, 1);
+                    else node[index] = op.value;
+                } else if (op.op === 'remove') {
+                    delete node[last];
+                } else {
+                    node[last] = op.value;
+                }
+            }
+            return doc;
+        };
+        const publish = (key, value, version) => {
+            window.dispatchEvent(new CustomEvent('pytron:state-update', { detail: { key: key, value: value, version: version } }));
+        };
+        window.addEventListener('pytron:state-update', (e) => {
+            const d = e.detail;
+            if (d && d.version !== undefined) mirror[d.key] = { value: d.value, version: d.version };
+            else if (d) delete mirror[d.key];
+        });
+        window.addEventListener('pytron:state-patch', (e) => {
+            const d = e.detail;
+            if (resyncing[d.key]) return resyncing[d.key].push(d);
+            const cur = mirror[d.key];
+            if (cur && cur.version >= d.version) return;
+            if (cur && cur.version === d.base) return publish(d.key, applyPatch(cur.value, d.patch), d.version);
+            // Unknown base (e.g. after a reload): fetch a snapshot, then replay newer patches
+            resyncing[d.key] = [d];
+            window.pytron_state_get(d.key).then((snap) => {
+                let value = snap.value, version = snap.version;
+                for (const p of resyncing[d.key]) {
+                    if (p.base === version) { value = applyPatch(value, p.patch); version = p.version; }
+                }
+                delete resyncing[d.key];
+                publish(d.key, value, version);
+            }, () => { delete resyncing[d.key]; });
+        });
+    })();
+`;
+const BASE_INIT_SCRIPTS = [HYDRATE_SCRIPT, BATCH_SCRIPT, STREAM_SCRIPT, STATE_SCRIPT];
+
+function scriptsFor(windowId) {
+    if (!windowScripts.has(windowId)) windowScripts.set(windowId, [...BASE_INIT_SCRIPTS]);
+    return windowScripts.get(windowId);
+}
+// Memory budget for pytron:// assets served from Python (mirrors each
+// window's VAPStore), by window id
+const vapConfigs = new Map();
+
+function vapConfigFor(windowId) {
+    if (!vapConfigs.has(windowId)) vapConfigs.set(windowId, { maxBytes: 256 * 1024 * 1024, ttl: null });
+    return vapConfigs.get(windowId);
+}
 let isAppReady = false;
 let pendingCommands = [];
 
@@ -111,20 +355,7 @@ function connectToPytron() {
             });
 
             // Setup Reader on clientIn
-            clientIn.on('data', (chunk) => {
-                buffer = Buffer.concat([buffer, chunk]);
-                while (buffer.length >= 4) {
-                    const msgLen = buffer.readUInt32LE(0);
-                    if (buffer.length >= 4 + msgLen) {
-                        const bodyBytes = buffer.slice(4, 4 + msgLen);
-                        const bodyString = bodyBytes.toString('utf-8');
-                        handlePythonCommand(bodyString);
-                        buffer = buffer.slice(4 + msgLen);
-                    } else {
-                        break;
-                    }
-                }
-            });
+            clientIn.on('data', onPythonData);
 
             clientIn.on('error', (err) => log(`Pipe-IN Error: ${err.message}`));
             clientOut.on('error', (err) => log(`Pipe-OUT Error: ${err.message} (Code: ${err.code})`));
@@ -168,21 +399,87 @@ function connectToPytron() {
     }
 }
 
-function setupClientListeners(socket) {
-    socket.on('data', (chunk) => {
-        buffer = Buffer.concat([buffer, chunk]);
-        while (buffer.length >= 4) {
-            const msgLen = buffer.readUInt32LE(0);
-            if (buffer.length >= 4 + msgLen) {
-                const bodyBytes = buffer.slice(4, 4 + msgLen);
-                const bodyString = bodyBytes.toString('utf-8');
-                handlePythonCommand(bodyString);
-                buffer = buffer.slice(4 + msgLen);
-            } else {
-                break;
-            }
+function onPythonData(chunk) {
+    inbox.push(chunk);
+    inboxBytes += chunk.length;
+    // PERFORMANCE: Only join chunks once a whole frame has arrived, so large
+    // payloads aren't re-copied on every chunk
+    while (inboxBytes >= frameBytes) {
+        const buf = inbox.length === 1 ? inbox[0] : Buffer.concat(inbox, inboxBytes);
+        const bodyLen = buf.readUInt32LE(0) & 0x7FFFFFFF;
+        if (buf.length < 4 + bodyLen) {
+            inbox = [buf];
+            frameBytes = 4 + bodyLen;
+            return;
         }
-    });
+        const rest = buf.subarray(4 + bodyLen);
+        inbox = rest.length ? [rest] : [];
+        inboxBytes = rest.length;
+        frameBytes = 4;
+        handleFrame(buf, 0);
+    }
+}
+
+// Dispatches the complete frame at `offset` in `buf`; returns the next offset
+function handleFrame(buf, offset) {
+    const word = buf.readUInt32LE(offset);
+    const end = offset + 4 + (word & 0x7FFFFFFF);
+    const body = buf.subarray(offset + 4, end);
+    if (!(word & BINARY_FRAME_FLAG)) {
+        handlePythonCommand(body.toString('utf-8'));
+        return end;
+    }
+    const headerLen = body.readUInt32LE(0);
+    const command = JSON.parse(body.toString('utf-8', 4, 4 + headerLen));
+    switch (command.action) {
+        case 'shm_attach': attachRing(command); return end;
+        case 'shm_doorbell': readRing(command.end); return end;
+    }
+    const data = body.subarray(4 + headerLen);
+    // Copy small payloads out so they don't pin a larger joined buffer
+    command.data = data.length * 2 < buf.length ? Buffer.from(data) : data;
+    handlePythonCommand(command);
+    return end;
+}
+
+// Optional shared-memory ring (pytron/engines/chrome/shm.py). Python copies
+// whole frames into the ring, then sends a doorbell frame over the socket with
+// the new write position. We read up to it from the segment's backing file
+// and publish our read position so Python can reuse the space.
+let ring = null;
+
+function attachRing(cmd) {
+    try {
+        ring = { fd: fs.openSync(cmd.path, 'r+'), pos: 0, ...cmd };
+        log(`Attached shared memory ring: ${cmd.path} (${cmd.capacity} bytes)`);
+        sendToPython('shm', { attached: true });
+    } catch (e) {
+        log(`Shared memory unavailable: ${e.message}`);
+        sendToPython('shm', { attached: false, error: e.message });
+    }
+}
+
+function readRing(end) {
+    const length = end - ring.pos;
+    const frames = Buffer.allocUnsafe(length);
+    let done = 0;
+    while (done < length) {
+        const offset = (ring.pos + done) % ring.capacity;
+        const count = Math.min(length - done, ring.capacity - offset);
+        done += fs.readSync(ring.fd, frames, done, count, ring.data_offset + offset);
+    }
+    ring.pos = end;
+    const pos = Buffer.alloc(8);
+    pos.writeBigUInt64LE(BigInt(end));
+    fs.writeSync(ring.fd, pos, 0, 8, ring.read_offset);
+
+    // The ring only ever holds whole frames
+    let offset = 0;
+    while (offset < frames.length) offset = handleFrame(frames, offset);
+}
+
+function setupClientListeners(socket) {
+    socket.on('data', onPythonData);
     socket.on('error', (err) => log(`Socket Error: ${err.message}`));
     socket.on('close', () => {
         log("Socket Closed. Exiting.");
@@ -190,12 +487,12 @@ function setupClientListeners(socket) {
     });
 }
 
-function sendToPython(type, payload) {
+function sendToPython(type, payload, windowId) {
     const target = clientOut || client;
 
     if (target && !target.destroyed) {
         try {
-            const bodyStr = JSON.stringify({ type, payload });
+            const bodyStr = JSON.stringify({ type, payload, window: windowId });
             const bodyBuf = Buffer.from(bodyStr, 'utf8');
             const headerBuf = Buffer.alloc(4);
             headerBuf.writeUInt32LE(bodyBuf.length, 0);
@@ -207,7 +504,8 @@ function sendToPython(type, payload) {
 }
 
 function handlePythonCommand(cmd) {
-    if (isDebug) log(`Executing: ${cmd.substring(0, 100)}...`);
+    // `cmd` is a JSON string, or an already parsed binary frame header
+    if (isDebug) log(`Executing: ${typeof cmd === 'string' ? cmd.substring(0, 100) : cmd.action}...`);
 
     if (!isAppReady) {
         log("Queueing command (App not ready)");
@@ -216,17 +514,19 @@ function handlePythonCommand(cmd) {
     }
 
     try {
-        const command = JSON.parse(cmd);
+        const command = typeof cmd === 'string' ? JSON.parse(cmd) : cmd;
+        const windowId = command.window || DEFAULT_WINDOW;
+        const mainWindow = windows.get(windowId);
         switch (command.action) {
             case 'init':
                 if (command.options && command.options.root) {
-                    PROJECT_ROOT = command.options.root;
-                    log(`Updating PROJECT_ROOT to: ${PROJECT_ROOT}`);
+                    projectRoots.set(windowId, command.options.root);
+                    log(`Project root of ${windowId}: ${command.options.root}`);
                 }
-                createWindow(command.options);
+                createWindow(windowId, command.options);
                 break;
             case 'init_script':
-                initScripts.push(command.js);
+                scriptsFor(windowId).push(command.js);
                 if (mainWindow) mainWindow.webContents.executeJavaScript(command.js).catch(e => log(`Init Err: ${e.message}`));
                 break;
             case 'navigate':
@@ -283,20 +583,9 @@ function handlePythonCommand(cmd) {
             case 'hide': if (mainWindow) mainWindow.hide(); break;
             case 'bind':
                 const stub = `
-                    window["${command.name}"] = (...args) => {
-                        const seq = Math.random().toString(36).substr(2, 9);
-                        return new Promise((resolve, reject) => {
-                            window._pytron_promises = window._pytron_promises || {};
-                            window._pytron_promises[seq] = { resolve, reject };
-                            if (window.__pytron_native_bridge) {
-                                window.__pytron_native_bridge.emit("${command.name}", { data: args, id: seq });
-                            } else if (window.pytron && window.pytron.emit) {
-                                window.pytron.emit("${command.name}", { data: args, id: seq });
-                            }
-                        });
-                    };
+                    window["${command.name}"] = (...args) => window.__pytron_enqueue("${command.name}", args);
                 `;
-                initScripts.push(stub);
+                scriptsFor(windowId).push(stub);
                 if (mainWindow) mainWindow.webContents.executeJavaScript(stub).catch(() => { });
                 break;
             case 'reply':
@@ -304,21 +593,35 @@ function handlePythonCommand(cmd) {
                     const js = `
                         if (window._pytron_promises && window._pytron_promises["${command.id}"]) {
                             const p = window._pytron_promises["${command.id}"];
-                            if (${command.status} === 0) p.resolve(${JSON.stringify(command.result)});
-                            else p.reject(${JSON.stringify(command.result)});
                             delete window._pytron_promises["${command.id}"];
+                            const v = ${command.data ? command.data.toString('utf-8') : JSON.stringify(command.result)};
+                            if (${command.status} === 0) p.resolve(window.__pytron_hydrate ? window.__pytron_hydrate(v) : v);
+                            else p.reject(v);
                         }
                     `;
                     mainWindow.webContents.executeJavaScript(js).catch(() => { });
                 }
                 break;
-            case 'close': app.quit(); break;
+            case 'close':
+                // Closing the last window ends the shell
+                if (windows.size <= 1) app.quit();
+                else if (mainWindow) mainWindow.close();
+                break;
             case 'serve_data':
-                // command: { action: 'serve_data', key: '...', data: 'BASE64...', mime: '...' }
+                // command: { action: 'serve_data', key: '...', data: Buffer | 'BASE64...', mime: '...' }
                 if (global.serveAsset) {
-                    global.serveAsset(command.key, command.data, command.mime);
+                    global.serveAsset(command.key, command.data, command.mime, command.ttl, windowId);
                 }
                 break;
+            case 'vap_stats':
+                if (global.vapStats) sendToPython('vap_stats', global.vapStats(windowId), command.window);
+                break;
+            case 'vap_config': {
+                const vapConfig = vapConfigFor(windowId);
+                if (command.max_bytes) vapConfig.maxBytes = command.max_bytes;
+                vapConfig.ttl = command.ttl || null;
+                break;
+            }
             case 'unserve_data':
                 if (global.unserveAsset) {
                     global.unserveAsset(command.key);
@@ -334,8 +637,8 @@ function handlePythonCommand(cmd) {
     } catch (e) { log(`Execution Error: ${e.message}`); }
 }
 
-async function createWindow(options = {}) {
-    if (mainWindow) return;
+async function createWindow(windowId, options = {}) {
+    if (windows.has(windowId)) return;
 
     log("Creating BrowserWindow...");
     const config = { ...WINDOW_CONFIG, ...options };
@@ -377,7 +680,9 @@ async function createWindow(options = {}) {
 
     config.show = false; // Always start false, show on ready
 
-    mainWindow = new BrowserWindow(config);
+    const mainWindow = new BrowserWindow(config);
+    mainWindow.pytronId = windowId;
+    windows.set(windowId, mainWindow);
 
     // SEND HWND TO PYTHON (Critical for Taskbar/Native Ops)
     try {
@@ -388,7 +693,7 @@ async function createWindow(options = {}) {
         } else if (handle.length === 4) {
             hwndStr = handle.readUInt32LE(0).toString();
         }
-        sendToPython('lifecycle', { event: 'window_created', hwnd: hwndStr });
+        sendToPython('lifecycle', { event: 'window_created', hwnd: hwndStr }, windowId);
     } catch (e) {
         log(`HWND Error: ${e.message}`);
     }
@@ -417,8 +722,8 @@ async function createWindow(options = {}) {
 
     mainWindow.once('ready-to-show', () => {
         log("Event: ready-to-show. Processing start state.");
-        applyInitScripts();
-        sendToPython('lifecycle', 'ready');
+        applyInitScripts(windowId);
+        sendToPython('lifecycle', 'ready', windowId);
 
         if (options.start_hidden) {
             log("Starting Hidden");
@@ -438,17 +743,29 @@ async function createWindow(options = {}) {
         }
     });
 
-    mainWindow.on('close', () => sendToPython('lifecycle', 'close'));
-    ipcMain.on('pytron-message', (event, arg) => sendToPython('ipc', arg));
+    mainWindow.on('close', () => sendToPython('lifecycle', 'close', windowId));
+    mainWindow.on('closed', () => {
+        windows.delete(windowId);
+        windowScripts.delete(windowId);
+        projectRoots.delete(windowId);
+        vapConfigs.delete(windowId);
+    });
 }
 
-function applyInitScripts() {
-    if (!mainWindow) return;
-    initScripts.forEach(js => {
-        mainWindow.webContents.executeJavaScript(js).catch(() => { });
+function applyInitScripts(windowId) {
+    const win = windows.get(windowId);
+    if (!win) return;
+    scriptsFor(windowId).forEach(js => {
+        win.webContents.executeJavaScript(js).catch(() => { });
     });
 }
 
+// Renderer -> Python, tagged with the window the message came from
+ipcMain.on('pytron-message', (event, arg) => {
+    const win = BrowserWindow.fromWebContents(event.sender);
+    sendToPython('ipc', arg, win ? win.pytronId : undefined);
+});
+
 const gotTheLock = app.requestSingleInstanceLock()
 if (!gotTheLock) {
     app.quit()
@@ -459,18 +776,59 @@ if (!gotTheLock) {
         // 2. Intercept requests to pytron://
         // We register the handler on the SPECIFIC session partition used by the window.
         // The global 'protocol' module only affects session.defaultSession.
+        // Map keeps insertion order: re-inserting on every hit makes it an LRU
+        // Keys are unique across windows; each window's assets count against
+        // its own budget
         const servedData = new Map();
+        const servedBytes = new Map();
+        const vapStats = { hits: 0, misses: 0, evictions: 0, expirations: 0 };
+        global.vapStats = (windowId) => {
+            let entries = 0;
+            for (const asset of servedData.values()) if (asset.windowId === windowId) entries++;
+            return { ...vapStats, entries, bytes: servedBytes.get(windowId) || 0, max_bytes: vapConfigFor(windowId).maxBytes };
+        };
+
+        const dropAsset = (key) => {
+            const asset = servedData.get(key);
+            if (!asset) return false;
+            servedData.delete(key);
+            servedBytes.set(asset.windowId, servedBytes.get(asset.windowId) - asset.buffer.length);
+            return true;
+        };
+
+        const lookupAsset = (key) => {
+            const asset = servedData.get(key);
+            if (!asset) return null;
+            if (asset.expiresAt && asset.expiresAt <= Date.now()) {
+                dropAsset(key);
+                vapStats.expirations++;
+                return null;
+            }
+            servedData.delete(key);
+            servedData.set(key, asset);
+            return asset;
+        };
 
         // Export internal serve function for IPC usage
-        global.serveAsset = (key, dataBase64, mimeType) => {
-            const buffer = Buffer.from(dataBase64, 'base64');
-            servedData.set(key, { buffer, mimeType });
+        global.serveAsset = (key, data, mimeType, ttl, windowId = DEFAULT_WINDOW) => {
+            const buffer = Buffer.isBuffer(data) ? data : Buffer.from(data, 'base64');
+            const vapConfig = vapConfigFor(windowId);
+            const lifetime = ttl || vapConfig.ttl;
+            dropAsset(key);
+            servedData.set(key, { buffer, mimeType, windowId, expiresAt: lifetime ? Date.now() + lifetime * 1000 : null });
+            servedBytes.set(windowId, (servedBytes.get(windowId) || 0) + buffer.length);
+            // Evict the window's least recently used, but never the asset we were just asked to serve
+            for (const [oldest, asset] of servedData) {
+                if (servedBytes.get(windowId) <= vapConfig.maxBytes || oldest === key) break;
+                if (asset.windowId !== windowId) continue;
+                dropAsset(oldest);
+                vapStats.evictions++;
+            }
             log(`[Protocol] Memory Asset Served: ${key} (${mimeType})`);
         };
 
         global.unserveAsset = (key) => {
-            if (servedData.has(key)) {
-                servedData.delete(key);
+            if (dropAsset(key)) {
                 log(`[Protocol] Memory Asset Removed: ${key}`);
             }
         };
@@ -478,39 +836,43 @@ if (!gotTheLock) {
         const handler = (request) => {
             let urlPath = request.url.replace('pytron://', '');
             urlPath = urlPath.split('?')[0];
+            // A window's own host (pytron://w2/) is served like pytron://app/
+            const host = new URL(request.url).hostname;
+            const prefix = projectRoots.has(host) ? `${host}/` : 'app/';
+            const relPath = urlPath.startsWith(prefix) ? urlPath.substring(prefix.length) : urlPath;
 
             // 1. Check Memory Store (O(1) Lookup for Dynamic Assets)
-            if (servedData.has(urlPath)) {
-                const asset = servedData.get(urlPath);
-                return new Response(asset.buffer, {
-                    headers: { 'content-type': asset.mimeType }
-                });
+            // Standard schemes normalize 'pytron://key' to 'pytron://key/'
+            const memoryKey = servedData.has(urlPath) ? urlPath : relPath.replace(/\/$/, '');
+            const asset = lookupAsset(memoryKey);
+            if (asset) {
+                vapStats.hits++;
+                return serveBuffer(request, asset.buffer, asset.mimeType);
             }
 
             // 2. Fallback to Disk (Project Root)
-            if (!PROJECT_ROOT) {
+            const projectRoot = rootFor(host);
+            if (!projectRoot) {
                 return new Response("Project Root Not Set", { status: 500 });
             }
 
-            // Normalize urlPath: Remove leading 'app/' or '/'
-            let normalizedPath = urlPath;
-            if (normalizedPath.startsWith('app/')) {
-                normalizedPath = normalizedPath.substring(4);
-            } else if (normalizedPath.startsWith('/')) {
+            // Normalize urlPath: Remove leading 'app/' (or window host) or '/'
+            let normalizedPath = relPath;
+            if (normalizedPath.startsWith('/')) {
                 normalizedPath = normalizedPath.substring(1);
             }
 
-            let filePath = path.join(PROJECT_ROOT, normalizedPath);
+            let filePath = path.join(projectRoot, normalizedPath);
             // log(`[Protocol] Request: ${request.url} -> ${filePath}`);
 
             try {
-                if (fs.existsSync(filePath) && fs.lstatSync(filePath).isFile()) {
-                    const data = fs.readFileSync(filePath);
-                    return new Response(data, {
-                        headers: { 'content-type': getMimeType(filePath) }
-                    });
+                // PERFORMANCE: Range requests stream a slice; unchanged files answer 304
+                const response = serveFile(request, filePath);
+                if (response) {
+                    return response;
                 }
                 // log(`[Protocol] File Not Found: ${filePath}`);
+                vapStats.misses++;
                 return new Response("Not Found", { status: 404 });
             } catch (e) {
                 log(`[Protocol] Error serving ${urlPath}: ${e.message}`);
@@ -0,0 +1,98 @@
+import os
+import struct
+import logging
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+logger = logging.getLogger("Pytron.ChromeAdapter")
+
+DEFAULT_SHM_SIZE = 64 * 1024 * 1024
+
+# Layout: [write position u64][pad][read position u64][pad][data ...]
+# Positions are monotonically increasing byte counts; offset = pos % capacity.
+# Each lives on its own cache line since the two sides write them.
+WRITE_POS_OFFSET = 0
+READ_POS_OFFSET = 64
+DATA_OFFSET = 128
+
+
+class ShmRing:
+    """
+    Single-producer/single-consumer byte ring in POSIX shared memory.
+
+    Python writes whole frames into the ring and rings a doorbell over the
+    IPC socket with the new write position; the shell reads up to that
+    position from the backing file and publishes its read position back.
+    Only offered where the segment has a file path the shell can open
+    (/dev/shm on Linux).
+    """
+
+    def __init__(self, size=DEFAULT_SHM_SIZE):
+        if shared_memory is None:
+            raise RuntimeError("multiprocessing.shared_memory is unavailable")
+        self._shm = shared_memory.SharedMemory(create=True, size=DATA_OFFSET + size)
+        self.capacity = size
+        self.path = os.path.join("/dev/shm", self._shm.name)
+        if not os.path.exists(self.path):
+            self.close()
+            raise RuntimeError("Shared memory segment has no file path")
+        self._buf = self._shm.buf
+        self._write_pos = 0
+
+    @classmethod
+    def create(cls, size):
+        """Returns a ring, or None if shared memory isn't available here."""
+        try:
+            return cls(size)
+        except Exception as e:
+            logger.info(f"Shared memory IPC unavailable ({e}), using the socket")
+            return None
+
+    def describe(self):
+        """Attach parameters sent to the shell."""
+        return {
+            "path": self.path,
+            "capacity": self.capacity,
+            "data_offset": DATA_OFFSET,
+            "read_offset": READ_POS_OFFSET,
+        }
+
+    def free(self):
+        (read_pos,) = struct.unpack_from("<Q", self._buf, READ_POS_OFFSET)
+        return self.capacity - (self._write_pos - read_pos)
+
+    def write(self, pieces, size):
+        """
+        Copies `pieces` (total `size` bytes) into the ring. Returns the new
+        write position for the doorbell, or None if there isn't room.
+        """
+        if size > self.free():
+            return None
+        pos = self._write_pos
+        for piece in pieces:
+            view = memoryview(piece)
+            remaining = len(view)
+            start = 0
+            while remaining:
+                offset = pos % self.capacity
+                count = min(remaining, self.capacity - offset)
+                self._buf[DATA_OFFSET + offset : DATA_OFFSET + offset + count] = view[
+                    start : start + count
+                ]
+                pos += count
+                start += count
+                remaining -= count
+        self._write_pos = pos
+        struct.pack_into("<Q", self._buf, WRITE_POS_OFFSET, pos)
+        return pos
+
+    def close(self):
+        self._buf = None
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except Exception:
+            pass
@@ -0,0 +1,83 @@
+use std::sync::{Arc, Mutex};
+
+/// Batch size counters, shared with Python through `NativeWebview::script_stats`.
+#[derive(Default, Clone)]
+pub struct BatchStats {
+    pub flushes: u64,
+    pub scripts: u64,
+    pub bytes: u64,
+    pub last_batch: usize,
+    pub max_batch: usize,
+}
+
+pub type SharedBatchStats = Arc<Mutex<BatchStats>>;
+
+/// PERFORMANCE: Scripts that deliver call results and events are queued while
+/// the event loop drains its events, then evaluated as a single script once
+/// per iteration instead of one `evaluate_script` each.
+#[derive(Default)]
+pub struct ScriptBatch {
+    pending: Vec<String>,
+    pending_bytes: usize,
+}
+
+impl ScriptBatch {
+    pub fn push(&mut self, script: String) {
+        self.pending_bytes += script.len();
+        self.pending.push(script);
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.pending.is_empty()
+    }
+
+    /// Joins everything queued into one script and records the batch size.
+    /// Each part runs in its own try block so one failure can't drop the rest.
+    pub fn take(&mut self, stats: &Mutex<BatchStats>) -> Option<String> {
+        if self.pending.is_empty() {
+            return None;
+        }
+        let mut script = String::with_capacity(self.pending_bytes + self.pending.len() * 32);
+        for part in &self.pending {
+            script.push_str("try{");
+            script.push_str(part);
+            script.push_str("}catch(e){console.error(e)}\n");
+        }
+        if let Ok(mut stats) = stats.lock() {
+            stats.flushes += 1;
+            stats.scripts += self.pending.len() as u64;
+            stats.bytes += script.len() as u64;
+            stats.last_batch = self.pending.len();
+            stats.max_batch = stats.max_batch.max(self.pending.len());
+        }
+        self.pending.clear();
+        self.pending_bytes = 0;
+        Some(script)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn joins_queued_scripts_into_one() {
+        let stats = Mutex::new(BatchStats::default());
+        let mut batch = ScriptBatch::default();
+        assert!(batch.take(&stats).is_none());
+
+        for i in 0..3 {
+            batch.push(format!("f({})", i));
+        }
+        let script = batch.take(&stats).unwrap();
+        assert_eq!(script.matches("try{f(").count(), 3);
+        assert!(script.find("f(0)").unwrap() < script.find("f(2)").unwrap());
+        assert!(batch.is_empty());
+
+        batch.push("g()".into());
+        batch.take(&stats);
+        let stats = stats.lock().unwrap();
+        assert_eq!((stats.flushes, stats.scripts), (2, 4));
+        assert_eq!((stats.last_batch, stats.max_batch), (1, 3));
+    }
+}
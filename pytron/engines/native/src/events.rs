@@ -2,6 +2,7 @@ use pyo3::prelude::*;
 
 pub enum UserEvent {
     Eval(String),
+    Emit(String, String), // Event name, JSON detail
     Bind(String, PyObject),   
     Dispatch(PyObject, String, String), // Func, Seq, MethodName
     DispatchData(PyObject, String, String, String), // Func, Seq, Args, MethodName
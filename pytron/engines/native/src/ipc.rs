@@ -1,7 +1,10 @@
 use pyo3::prelude::*;
+use pyo3::buffer::PyBuffer;
 use std::sync::{Arc, Mutex};
 use std::thread;
 
+use crate::utils::{extract_buffer, extract_payload};
+
 #[cfg(target_os = "windows")]
 use windows::{
     core::PCWSTR,
@@ -20,6 +23,10 @@ const PIPE_TYPE_BYTE: u32 = 0x00000000;
 const PIPE_READMODE_BYTE: u32 = 0x00000000;
 const PIPE_WAIT: u32 = 0x00000000;
 
+/// Set in a frame's length word to mark a binary frame:
+/// <u32 LE header len><JSON header><raw bytes>.
+const BINARY_FRAME_FLAG: u32 = 0x80000000;
+
 #[pyclass]
 pub struct ChromeIPC {
     #[cfg(target_os = "windows")]
@@ -207,18 +214,59 @@ impl ChromeIPC {
         Ok(())
     }
 
-    fn send(&self, py: Python<'_>, data: String) -> PyResult<()> {
+    fn send(&self, py: Python<'_>, data: &Bound<'_, PyAny>) -> PyResult<()> {
         if !*self.connected.lock().unwrap() {
             return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Not connected"));
         }
 
-        let body = data.into_bytes();
+        // Accepts pre-encoded UTF-8 bytes (no re-encode) or a str
+        let body = extract_payload(data)?;
         let msg_len = body.len() as u32;
         let header = msg_len.to_le_bytes();
         let mut full_msg = Vec::with_capacity(4 + body.len());
         full_msg.extend_from_slice(&header);
         full_msg.extend_from_slice(&body);
 
+        self.write_frame(py, full_msg)
+    }
+
+    fn send_binary(&self, py: Python<'_>, header: &Bound<'_, PyAny>, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        if !*self.connected.lock().unwrap() {
+            return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Not connected"));
+        }
+
+        let head = extract_payload(header)?;
+        let buffer = PyBuffer::<u8>::get(data)?;
+        let body_len = 4 + head.len() + buffer.len_bytes();
+        if body_len >= BINARY_FRAME_FLAG as usize {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Binary frame too large"));
+        }
+
+        // PERFORMANCE: Copy the payload straight from the Python buffer into the frame
+        let mut full_msg = Vec::with_capacity(4 + body_len);
+        full_msg.extend_from_slice(&(body_len as u32 | BINARY_FRAME_FLAG).to_le_bytes());
+        full_msg.extend_from_slice(&(head.len() as u32).to_le_bytes());
+        full_msg.extend_from_slice(&head);
+        let start = full_msg.len();
+        full_msg.resize(start + buffer.len_bytes(), 0);
+        buffer.copy_to_slice(py, &mut full_msg[start..])?;
+
+        self.write_frame(py, full_msg)
+    }
+
+    /// Writes already-framed bytes (possibly several coalesced frames) in one
+    /// call. Used by the Python writer thread, which does its own framing.
+    fn write(&self, py: Python<'_>, data: &Bound<'_, PyAny>) -> PyResult<()> {
+        if !*self.connected.lock().unwrap() {
+            return Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Not connected"));
+        }
+        let full_msg = extract_buffer(data)?;
+        self.write_frame(py, full_msg)
+    }
+}
+
+impl ChromeIPC {
+    fn write_frame(&self, py: Python<'_>, full_msg: Vec<u8>) -> PyResult<()> {
         #[cfg(target_os = "windows")]
         {
             let h_in_val = self.handle_in.lock().unwrap().ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>("Pipe not connected"))?;
@@ -1,9 +1,11 @@
 use pyo3::prelude::*;
 
+pub mod batch;
 pub mod events;
 pub mod state;
 pub mod utils;
 pub mod protocol;
+pub mod vap;
 pub mod webview;
 pub mod ipc;
 
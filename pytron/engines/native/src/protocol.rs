@@ -1,14 +1,22 @@
 use std::borrow::Cow;
-use std::path::PathBuf;
+use std::fs::{File, Metadata};
+use std::io::{self, Read, Seek, SeekFrom};
+use std::path::{Path, PathBuf};
+use std::time::{SystemTime, UNIX_EPOCH};
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Arc, Mutex};
 use std::collections::HashMap;
 use pyo3::prelude::*;
+use crate::utils::extract_buffer;
+use crate::vap::SharedVapStore;
 use wry::http::{Response, header, StatusCode, Method, Request};
 
 pub fn handle_pytron_protocol(
     request: Request<Vec<u8>>,
     protocol_root: PathBuf,
     callbacks: Arc<Mutex<HashMap<String, PyObject>>>,
+    cache: Arc<ProtocolCache>,
+    vap: SharedVapStore,
 ) -> Response<Cow<'static, [u8]>> {
     let uri = request.uri();
     let method = request.method();
@@ -44,68 +52,23 @@ pub fn handle_pytron_protocol(
         final_path = final_path.join("index.html");
     }
 
-    match std::fs::read(&final_path) {
-        Ok(data) => {
-            let mime = mime_guess::from_path(&final_path).first_or_octet_stream();
-            let mime_str = mime.to_string();
-            let mut resp_data = data;
-
-            // Manual Bridge Injection
-            if mime.subtype() == "html" {
-                if let Ok(content) = String::from_utf8(resp_data.clone()) {
-                    let mut method_bindings = String::new();
-                    if let Ok(cbs) = callbacks.lock() {
-                        for name in cbs.keys() {
-                            method_bindings.push_str(&format!(
-                                "window['{}'] = (...args) => window.__pytron_native_bridge('{}', args);\n",
-                                name, name
-                            ));
-                        }
-                    }
-
-                    let bridge_script = format!(r#"
-                    <script>
-                    window.pytron_is_native = true;
-                    window.pytron = window.pytron || {{}};
-                    window.pytron.is_ready = true;
-                    window.__pytron_native_bridge = (method, args) => {{
-                        const seq = Math.random().toString(36).substring(2, 10);
-                        window.ipc.postMessage(JSON.stringify({{id: seq, method: method, params: args}}));
-                        return new Promise((resolve, reject) => {{
-                            window._rpc = window._rpc || {{}};
-                            window._rpc[seq] = {{resolve, reject}};
-                        }});
-                    }};
-                    window.pytron_close = () => window.__pytron_native_bridge('pytron_close', []);
-                    window.pytron_drag = () => window.__pytron_native_bridge('pytron_drag', []);
-                    window.pytron_log = (msg) => window.__pytron_native_bridge('pytron_log', [msg]);
-                    
-                    // Override alert to use native message box
-                    window.alert = (msg) => {{
-                        window.__pytron_native_bridge('pytron_message_box', ["Alert", String(msg), "info"]);
-                    }};
-                    {}
-                    </script>
-                    "#, method_bindings);
-
-                    let injected = if content.contains("</head>") {
-                        content.replace("</head>", &format!("{}</head>", bridge_script))
-                    } else {
-                        content.replace("<body>", &format!("<body>{}", bridge_script))
-                    };
-                    resp_data = injected.into_bytes();
-                }
-            }
+    let file_meta = std::fs::metadata(&final_path).ok().filter(|m| m.is_file());
+    let file_result = match file_meta {
+        Some(meta) => serve_file(&request, &final_path, &meta, &callbacks, &cache),
+        None => Err(io::Error::from(io::ErrorKind::NotFound)),
+    };
 
-            Response::builder()
-                .status(StatusCode::OK)
-                .header(header::CONTENT_TYPE, mime_str)
-                .header("Access-Control-Allow-Origin", "*")
-                .body(Cow::from(resp_data))
-                .unwrap()
-        }
+    match file_result {
+        Ok(response) => response,
         Err(_) => {
-            // Fallback to VAP
+            // PERFORMANCE: Served data lives in the Rust-owned store, so
+            // generated assets load without waiting for the GIL
+            let asset = vap.lock().ok().and_then(|mut store| store.get(decoded.as_ref()));
+            if let Some((data, mime)) = asset {
+                return serve_memory(&request, &data, mime);
+            }
+
+            // Fallback to a Python-side VAP
             let mut served_data: Option<(Vec<u8>, String)> = None;
             let func_opt = {
                 if let Ok(cbs) = callbacks.lock() {
@@ -118,8 +81,10 @@ pub fn handle_pytron_protocol(
             if let Some(func) = func_opt {
                  Python::with_gil(|py| {
                      if let Ok(res) = func.call1(py, (decoded.as_ref(),)) {
-                         if let Ok((data, mime)) = res.extract::<(Vec<u8>, String)>(py) {
-                             served_data = Some((data, mime));
+                         if let Ok((data, mime)) = res.bind(py).extract::<(Bound<PyAny>, String)>() {
+                             if let Ok(data) = extract_buffer(&data) {
+                                 served_data = Some((data, mime));
+                             }
                          }
                      }
                  });
@@ -138,3 +103,599 @@ pub fn handle_pytron_protocol(
         }
     }
 }
+
+// PERFORMANCE: Open-ended ranges ("bytes=N-", what <video> sends while seeking)
+// are answered in chunks so a seek never loads the rest of a large file.
+const MAX_RANGE_CHUNK: u64 = 8 * 1024 * 1024;
+// Responses can't be streamed through wry, so a request without Range for a
+// large file is answered like "bytes=0-" (first chunk, 206 + Content-Range):
+// media past one chunk, anything else past MAX_FULL_BODY.
+const MAX_FULL_BODY: u64 = 64 * 1024 * 1024;
+const IMMUTABLE_CACHE: &str = "public, max-age=31536000, immutable";
+const REVALIDATE_CACHE: &str = "no-cache";
+
+#[derive(Debug, PartialEq)]
+enum ByteRange {
+    Full,
+    Partial(u64, u64),
+    Unsatisfiable,
+}
+
+/// Parses a single `Range: bytes=...` header against a file of `size` bytes.
+/// Multiple or malformed ranges are ignored and the whole file is sent.
+fn parse_range(header: Option<&str>, size: u64) -> ByteRange {
+    let spec = match header.and_then(|h| h.trim().strip_prefix("bytes=")) {
+        Some(spec) if !spec.contains(',') => spec.trim(),
+        _ => return ByteRange::Full,
+    };
+    let (first, last) = match spec.split_once('-') {
+        Some(parts) => parts,
+        None => return ByteRange::Full,
+    };
+    let (start, end) = match (first.parse::<u64>(), last.parse::<u64>()) {
+        // bytes=-N: the last N bytes
+        (Err(_), Ok(suffix)) if first.is_empty() => {
+            if suffix == 0 {
+                return ByteRange::Unsatisfiable;
+            }
+            (size.saturating_sub(suffix), size.saturating_sub(1))
+        }
+        (Ok(start), Err(_)) if last.is_empty() => {
+            (start, (start.saturating_add(MAX_RANGE_CHUNK) - 1).min(size.saturating_sub(1)))
+        }
+        (Ok(start), Ok(end)) => (start, end.min(size.saturating_sub(1))),
+        _ => return ByteRange::Full,
+    };
+    if start >= size || start > end {
+        return ByteRange::Unsatisfiable;
+    }
+    ByteRange::Partial(start, end)
+}
+
+fn mtime_millis(meta: &Metadata) -> u128 {
+    meta.modified()
+        .ok()
+        .and_then(|t| t.duration_since(UNIX_EPOCH).ok())
+        .map(|d| d.as_millis())
+        .unwrap_or(0)
+}
+
+/// Weak validator from size and modification time, so no hashing is needed.
+fn etag_for(meta: &Metadata) -> String {
+    format!("W/\"{:x}-{:x}\"", meta.len(), mtime_millis(meta))
+}
+
+/// Injected pages also change with the bindings, so their validator includes a
+/// hash of the bridge script: stable across launches, unlike a counter, so a
+/// persistent webview cache never revalidates a page with other bindings.
+fn page_etag(meta: &Metadata, bridge_hash: u64) -> String {
+    format!("W/\"{:x}-{:x}-{:x}\"", meta.len(), mtime_millis(meta), bridge_hash)
+}
+
+/// FNV-1a: a fixed, dependency-free hash (std's SipHash keys aren't stable).
+fn fnv1a(data: &[u8]) -> u64 {
+    data.iter().fold(0xcbf29ce484222325, |hash, &byte| {
+        (hash ^ byte as u64).wrapping_mul(0x100000001b3)
+    })
+}
+
+/// True if a request without Range for this file gets only its first chunk.
+fn caps_full_body(mime: &mime_guess::Mime, size: u64) -> bool {
+    let media = mime.type_() == "video" || mime.type_() == "audio";
+    size > MAX_FULL_BODY || (media && size > MAX_RANGE_CHUNK)
+}
+
+fn etag_matches(if_none_match: &str, etag: &str) -> bool {
+    let bare = etag.trim_start_matches("W/");
+    if_none_match
+        .split(',')
+        .map(|tag| tag.trim())
+        .any(|tag| tag == "*" || tag.trim_start_matches("W/") == bare)
+}
+
+/// True for bundler output like `index-4f9a2c1b.js`, `app.3b8e0d97f1.css` (hex)
+/// or `index-BXq3fA_z.js` (Rollup/Vite): the last dot/dash segment of the stem
+/// is 8+ lowercase hex digits mixing letters and digits, or exactly 8 base64url
+/// characters mixing upper case, lower case and digits.
+fn is_hashed_asset(path: &Path) -> bool {
+    let stem = match path.file_stem().and_then(|s| s.to_str()) {
+        Some(stem) => stem,
+        None => return false,
+    };
+    let hash = match stem.rfind(|c| c == '.' || c == '-') {
+        Some(pos) => &stem[pos + 1..],
+        None => return false,
+    };
+    let has_digit = hash.chars().any(|c| c.is_ascii_digit());
+    let hex = hash.len() >= 8
+        && hash.chars().all(|c| c.is_ascii_digit() || ('a'..='f').contains(&c))
+        && hash.chars().any(|c| ('a'..='f').contains(&c));
+    let base64 = hash.len() == 8
+        && hash.chars().all(|c| c.is_ascii_alphanumeric() || c == '_')
+        && hash.chars().any(|c| c.is_ascii_lowercase())
+        && hash.chars().any(|c| c.is_ascii_uppercase());
+    has_digit && (hex || base64)
+}
+
+/// Encodings with precompressed siblings, in order of preference.
+const PRECOMPRESSED: [(&str, &str); 2] = [("br", "br"), ("gzip", "gz")];
+
+/// True if an Accept-Encoding header allows `encoding` (i.e. not refused with q=0).
+fn accepts_encoding(accept: &str, encoding: &str) -> bool {
+    accept.split(',').any(|part| {
+        let mut fields = part.split(';');
+        let name = fields.next().unwrap_or("").trim();
+        let refused = fields.any(|f| {
+            f.trim().strip_prefix("q=").and_then(|q| q.trim().parse::<f32>().ok()) == Some(0.0)
+        });
+        name.eq_ignore_ascii_case(encoding) && !refused
+    })
+}
+
+/// Finds an up to date `<file>.br` or `<file>.gz` the client accepts.
+fn precompressed_variant(path: &Path, meta: &Metadata, accept: &str) -> Option<(PathBuf, Metadata, &'static str)> {
+    for (encoding, suffix) in PRECOMPRESSED {
+        if !accepts_encoding(accept, encoding) {
+            continue;
+        }
+        let mut name = path.as_os_str().to_owned();
+        name.push(".");
+        name.push(suffix);
+        let candidate = PathBuf::from(name);
+        if let Ok(encoded) = std::fs::metadata(&candidate) {
+            // A sibling older than the file it was built from is stale
+            if encoded.is_file() && encoded.modified().ok() >= meta.modified().ok() {
+                return Some((candidate, encoded, encoding));
+            }
+        }
+    }
+    None
+}
+
+fn read_slice(path: &Path, start: u64, len: u64) -> io::Result<Vec<u8>> {
+    let mut file = File::open(path)?;
+    file.seek(SeekFrom::Start(start))?;
+    let mut data = Vec::with_capacity(len as usize);
+    file.take(len).read_to_end(&mut data)?;
+    Ok(data)
+}
+
+/// Serves a file from the protocol root with Range, ETag/If-None-Match and
+/// Cache-Control support. HTML gets the bridge injected and must be revalidated.
+fn serve_file(
+    request: &Request<Vec<u8>>,
+    path: &Path,
+    meta: &Metadata,
+    callbacks: &Arc<Mutex<HashMap<String, PyObject>>>,
+    cache: &ProtocolCache,
+) -> io::Result<Response<Cow<'static, [u8]>>> {
+    let mime = mime_guess::from_path(path).first_or_octet_stream();
+    let builder = Response::builder()
+        .header(header::CONTENT_TYPE, mime.to_string())
+        .header("Access-Control-Allow-Origin", "*");
+
+    let headers = request.headers();
+    let if_none_match = headers.get(header::IF_NONE_MATCH).and_then(|v| v.to_str().ok());
+
+    if mime.subtype() == "html" {
+        // The injected bindings change at runtime, so HTML is always revalidated
+        let (bridge_hash, data) = cache.page(path, meta, callbacks)?;
+        let etag = page_etag(meta, bridge_hash);
+        let builder = builder
+            .header(header::ETAG, &etag)
+            .header(header::CACHE_CONTROL, REVALIDATE_CACHE);
+        if if_none_match.map_or(false, |tags| etag_matches(tags, &etag)) {
+            return Ok(builder
+                .status(StatusCode::NOT_MODIFIED)
+                .body(Cow::from(Vec::new()))
+                .unwrap());
+        }
+        return Ok(builder
+            .status(StatusCode::OK)
+            .body(Cow::from(data.as_ref().clone()))
+            .unwrap());
+    }
+
+    let cache_control = if is_hashed_asset(path) {
+        IMMUTABLE_CACHE
+    } else {
+        REVALIDATE_CACHE
+    };
+
+    // PERFORMANCE: Serve a precompressed sibling (.br/.gz) when the webview
+    // accepts it. Ranges always address the uncompressed bytes.
+    let variant = match headers.get(header::ACCEPT_ENCODING).and_then(|v| v.to_str().ok()) {
+        Some(accept) if !headers.contains_key(header::RANGE) => {
+            precompressed_variant(path, meta, accept)
+        }
+        _ => None,
+    };
+    let (path, meta, encoding) = match &variant {
+        Some((encoded, encoded_meta, encoding)) => (encoded.as_path(), encoded_meta, Some(*encoding)),
+        None => (path, meta, None),
+    };
+
+    let size = meta.len();
+    let mut etag = etag_for(meta);
+    let mut builder = builder
+        .header(header::CACHE_CONTROL, cache_control)
+        .header(header::ACCEPT_RANGES, "bytes")
+        .header(header::VARY, "Accept-Encoding");
+    if let Some(encoding) = encoding {
+        // Each representation gets its own validator
+        etag = format!("{}-{}\"", etag.trim_end_matches('"'), encoding);
+        builder = builder.header(header::CONTENT_ENCODING, encoding);
+    }
+    let builder = builder.header(header::ETAG, &etag);
+
+    if if_none_match.map_or(false, |tags| etag_matches(tags, &etag)) {
+        return Ok(builder
+            .status(StatusCode::NOT_MODIFIED)
+            .body(Cow::from(Vec::new()))
+            .unwrap());
+    }
+
+    let range = headers.get(header::RANGE).and_then(|v| v.to_str().ok());
+    let mut byte_range = parse_range(range, size);
+    if byte_range == ByteRange::Full && caps_full_body(&mime, size) {
+        byte_range = parse_range(Some("bytes=0-"), size);
+    }
+    match byte_range {
+        ByteRange::Full => Ok(builder
+            .status(StatusCode::OK)
+            .body(Cow::from(std::fs::read(path)?))
+            .unwrap()),
+        ByteRange::Partial(start, end) => {
+            let data = read_slice(path, start, end - start + 1)?;
+            Ok(builder
+                .status(StatusCode::PARTIAL_CONTENT)
+                .header(header::CONTENT_RANGE, format!("bytes {}-{}/{}", start, end, size))
+                .body(Cow::from(data))
+                .unwrap())
+        }
+        ByteRange::Unsatisfiable => Ok(builder
+            .status(StatusCode::RANGE_NOT_SATISFIABLE)
+            .header(header::CONTENT_RANGE, format!("bytes */{}", size))
+            .body(Cow::from(Vec::new()))
+            .unwrap()),
+    }
+}
+
+/// Serves an in-memory VAP asset, honouring Range. Keys can be re-served with
+/// new content, so these are never cached.
+fn serve_memory(request: &Request<Vec<u8>>, data: &[u8], mime: String) -> Response<Cow<'static, [u8]>> {
+    let builder = Response::builder()
+        .header(header::CONTENT_TYPE, mime)
+        .header("Access-Control-Allow-Origin", "*")
+        .header(header::CACHE_CONTROL, "no-store")
+        .header(header::ACCEPT_RANGES, "bytes");
+    let size = data.len() as u64;
+    let range = request.headers().get(header::RANGE).and_then(|v| v.to_str().ok());
+    match parse_range(range, size) {
+        ByteRange::Full => builder.status(StatusCode::OK).body(Cow::from(data.to_vec())).unwrap(),
+        ByteRange::Partial(start, end) => builder
+            .status(StatusCode::PARTIAL_CONTENT)
+            .header(header::CONTENT_RANGE, format!("bytes {}-{}/{}", start, end, size))
+            .body(Cow::from(data[start as usize..=end as usize].to_vec()))
+            .unwrap(),
+        ByteRange::Unsatisfiable => builder
+            .status(StatusCode::RANGE_NOT_SATISFIABLE)
+            .header(header::CONTENT_RANGE, format!("bytes */{}", size))
+            .body(Cow::from(Vec::new()))
+            .unwrap(),
+    }
+}
+
+/// Builds the bridge script with a shim for every bound method.
+fn build_bridge_script(callbacks: &Arc<Mutex<HashMap<String, PyObject>>>) -> String {
+    let mut method_bindings = String::new();
+    if let Ok(cbs) = callbacks.lock() {
+        for name in cbs.keys() {
+            method_bindings.push_str(&format!(
+                "window['{}'] = (...args) => window.__pytron_native_bridge('{}', args);\n",
+                name, name
+            ));
+        }
+    }
+
+    format!(r#"
+    <script>
+    window.pytron_is_native = true;
+    window.pytron = window.pytron || {{}};
+    window.pytron.is_ready = true;
+    // Keep the (batching) bridge from the initialization script if present
+    window.__pytron_native_bridge = window.__pytron_native_bridge || ((method, args) => {{
+        const seq = Math.random().toString(36).substring(2, 10);
+        window.ipc.postMessage(JSON.stringify({{id: seq, method: method, params: args}}));
+        return new Promise((resolve, reject) => {{
+            window._rpc = window._rpc || {{}};
+            window._rpc[seq] = {{resolve, reject}};
+        }});
+    }});
+    window.pytron_close = () => window.__pytron_native_bridge('pytron_close', []);
+    window.pytron_drag = () => window.__pytron_native_bridge('pytron_drag', []);
+    window.pytron_log = (msg) => window.__pytron_native_bridge('pytron_log', [msg]);
+    
+    // Override alert to use native message box
+    window.alert = (msg) => {{
+        window.__pytron_native_bridge('pytron_message_box', ["Alert", String(msg), "info"]);
+    }};
+    {}
+    </script>
+    "#, method_bindings)
+}
+
+/// Splices the bridge script into an HTML page.
+fn inject_bridge(data: Vec<u8>, bridge_script: &str) -> Vec<u8> {
+    let content = match String::from_utf8(data) {
+        Ok(content) => content,
+        Err(e) => return e.into_bytes(),
+    };
+    let injected = if content.contains("</head>") {
+        content.replace("</head>", &format!("{}</head>", bridge_script))
+    } else {
+        content.replace("<body>", &format!("<body>{}", bridge_script))
+    };
+    injected.into_bytes()
+}
+
+struct CachedPage {
+    modified: Option<SystemTime>,
+    len: u64,
+    generation: u64,
+    bridge_hash: u64,
+    data: Arc<Vec<u8>>,
+}
+
+/// PERFORMANCE: The generated bridge script and the injected HTML pages are
+/// reused across requests. Pages are keyed by path and checked against the
+/// file's mtime and size; everything is dropped when a binding changes.
+#[derive(Default)]
+pub struct ProtocolCache {
+    generation: AtomicU64,
+    bridge: Mutex<Option<Arc<String>>>,
+    pages: Mutex<HashMap<PathBuf, CachedPage>>,
+}
+
+impl ProtocolCache {
+    pub fn new() -> Arc<Self> {
+        Arc::new(Self::default())
+    }
+
+    /// Called whenever a method is bound: the shims in the bridge change.
+    pub fn invalidate(&self) {
+        if let Ok(mut bridge) = self.bridge.lock() {
+            *bridge = None;
+            self.generation.fetch_add(1, Ordering::SeqCst);
+        }
+        if let Ok(mut pages) = self.pages.lock() {
+            pages.clear();
+        }
+    }
+
+    /// The bridge script and the generation it belongs to. The script is built
+    /// under the lock so an invalidation can't be overwritten by a stale build.
+    fn bridge_script(&self, callbacks: &Arc<Mutex<HashMap<String, PyObject>>>) -> (u64, Arc<String>) {
+        let mut bridge = self.bridge.lock().unwrap_or_else(|e| e.into_inner());
+        let generation = self.generation.load(Ordering::SeqCst);
+        let script = bridge
+            .get_or_insert_with(|| Arc::new(build_bridge_script(callbacks)))
+            .clone();
+        (generation, script)
+    }
+
+    /// The page at `path` with the bridge injected, and the hash of that bridge.
+    /// Read from disk only when the file or the bindings changed since it was
+    /// last served.
+    fn page(
+        &self,
+        path: &Path,
+        meta: &Metadata,
+        callbacks: &Arc<Mutex<HashMap<String, PyObject>>>,
+    ) -> io::Result<(u64, Arc<Vec<u8>>)> {
+        let modified = meta.modified().ok();
+        let current = self.generation.load(Ordering::SeqCst);
+        if let Ok(pages) = self.pages.lock() {
+            if let Some(page) = pages.get(path) {
+                if page.generation == current && page.modified == modified && page.len == meta.len() {
+                    return Ok((page.bridge_hash, page.data.clone()));
+                }
+            }
+        }
+
+        let (generation, script) = self.bridge_script(callbacks);
+        let bridge_hash = fnv1a(script.as_bytes());
+        let data = Arc::new(inject_bridge(std::fs::read(path)?, &script));
+        if let Ok(mut pages) = self.pages.lock() {
+            pages.insert(
+                path.to_path_buf(),
+                CachedPage { modified, len: meta.len(), generation, bridge_hash, data: data.clone() },
+            );
+        }
+        Ok((bridge_hash, data))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::vap::VapStore;
+
+    fn asset_tree(name: &str) -> PathBuf {
+        let root = std::env::temp_dir()
+            .join(format!("pytron-protocol-{}-{}", std::process::id(), name));
+        std::fs::create_dir_all(root.join("assets")).unwrap();
+        std::fs::write(root.join("index.html"), "<html><head></head><body></body></html>").unwrap();
+        std::fs::write(root.join("video.mp4"), (0..=255u8).collect::<Vec<u8>>()).unwrap();
+        std::fs::write(root.join("assets/index-4f9a2c1b.js"), "console.log(1)").unwrap();
+        root
+    }
+
+    fn get(root: &Path, path: &str, headers: &[(&str, &str)]) -> Response<Cow<'static, [u8]>> {
+        get_with_vap(root, path, headers, VapStore::shared())
+    }
+
+    fn get_with_vap(
+        root: &Path,
+        path: &str,
+        headers: &[(&str, &str)],
+        vap: SharedVapStore,
+    ) -> Response<Cow<'static, [u8]>> {
+        let mut builder = Request::builder().uri(format!("pytron://app/{}", path));
+        for (name, value) in headers {
+            builder = builder.header(*name, *value);
+        }
+        let callbacks = Arc::new(Mutex::new(HashMap::new()));
+        handle_pytron_protocol(
+            builder.body(Vec::new()).unwrap(),
+            root.to_path_buf(),
+            callbacks,
+            ProtocolCache::new(),
+            vap,
+        )
+    }
+
+    #[test]
+    fn parses_ranges() {
+        assert_eq!(parse_range(None, 100), ByteRange::Full);
+        assert_eq!(parse_range(Some("bytes=10-19"), 100), ByteRange::Partial(10, 19));
+        assert_eq!(parse_range(Some("bytes=90-"), 100), ByteRange::Partial(90, 99));
+        assert_eq!(parse_range(Some("bytes=-5"), 100), ByteRange::Partial(95, 99));
+        assert_eq!(parse_range(Some("bytes=50-500"), 100), ByteRange::Partial(50, 99));
+        assert_eq!(parse_range(Some("bytes=0-1,5-6"), 100), ByteRange::Full);
+        assert_eq!(parse_range(Some("bytes=100-"), 100), ByteRange::Unsatisfiable);
+        assert_eq!(
+            parse_range(Some("bytes=0-"), 1 << 40),
+            ByteRange::Partial(0, MAX_RANGE_CHUNK - 1)
+        );
+    }
+
+    #[test]
+    fn detects_hashed_assets() {
+        assert!(is_hashed_asset(Path::new("assets/index-4f9a2c1b.js")));
+        assert!(is_hashed_asset(Path::new("app.3b8e0d97f1.css")));
+        assert!(!is_hashed_asset(Path::new("main.js")));
+        assert!(!is_hashed_asset(Path::new("my-component.js")));
+        assert!(is_hashed_asset(Path::new("index-BXq3fA_z.js")));
+        assert!(!is_hashed_asset(Path::new("settings-backup2.js")));
+        assert!(!is_hashed_asset(Path::new("settings-backup22.js")));
+        assert!(!is_hashed_asset(Path::new("report-20240101.js")));
+    }
+
+    #[test]
+    fn serves_byte_ranges() {
+        let root = asset_tree("ranges");
+        let resp = get(&root, "video.mp4", &[("Range", "bytes=16-31")]);
+        assert_eq!(resp.status(), StatusCode::PARTIAL_CONTENT);
+        assert_eq!(resp.headers()[header::CONTENT_RANGE], "bytes 16-31/256");
+        assert_eq!(resp.body().as_ref(), &(16..32u8).collect::<Vec<u8>>()[..]);
+
+        let resp = get(&root, "video.mp4", &[("Range", "bytes=300-")]);
+        assert_eq!(resp.status(), StatusCode::RANGE_NOT_SATISFIABLE);
+        assert_eq!(resp.headers()[header::CONTENT_RANGE], "bytes */256");
+    }
+
+    #[test]
+    fn revalidates_with_etag() {
+        let root = asset_tree("etag");
+        let resp = get(&root, "video.mp4", &[]);
+        assert_eq!(resp.status(), StatusCode::OK);
+        assert_eq!(resp.body().len(), 256);
+        assert_eq!(resp.headers()[header::CACHE_CONTROL], REVALIDATE_CACHE);
+        let etag = resp.headers()[header::ETAG].to_str().unwrap().to_string();
+
+        let resp = get(&root, "video.mp4", &[("If-None-Match", etag.as_str())]);
+        assert_eq!(resp.status(), StatusCode::NOT_MODIFIED);
+        assert!(resp.body().is_empty());
+
+        let resp = get(&root, "assets/index-4f9a2c1b.js", &[]);
+        assert_eq!(resp.headers()[header::CACHE_CONTROL], IMMUTABLE_CACHE);
+
+        let resp = get(&root, "index.html", &[]);
+        assert_eq!(resp.headers()[header::CACHE_CONTROL], REVALIDATE_CACHE);
+        assert!(String::from_utf8_lossy(resp.body()).contains("pytron_is_native"));
+    }
+
+    #[test]
+    fn serves_precompressed_siblings() {
+        let root = asset_tree("encoded");
+        std::fs::write(root.join("app.js"), "console.log('plain')").unwrap();
+        std::fs::write(root.join("app.js.gz"), b"\x1f\x8bgzipped").unwrap();
+        std::fs::write(root.join("app.js.br"), b"brotli").unwrap();
+
+        let resp = get(&root, "app.js", &[("Accept-Encoding", "gzip, deflate, br")]);
+        assert_eq!(resp.headers()[header::CONTENT_ENCODING], "br");
+        assert_eq!(resp.body().as_ref(), b"brotli");
+        assert!(resp.headers()[header::ETAG].to_str().unwrap().ends_with("-br\""));
+
+        let resp = get(&root, "app.js", &[("Accept-Encoding", "gzip, br;q=0")]);
+        assert_eq!(resp.headers()[header::CONTENT_ENCODING], "gzip");
+
+        // No Accept-Encoding, or a range request: the plain file
+        for headers in [&[][..], &[("Accept-Encoding", "br"), ("Range", "bytes=0-6")][..]] {
+            let resp = get(&root, "app.js", headers);
+            assert!(resp.headers().get(header::CONTENT_ENCODING).is_none());
+            assert!(resp.body().starts_with(b"console"));
+        }
+    }
+
+    #[test]
+    fn serves_from_the_rust_vap_store() {
+        let root = asset_tree("vap");
+        let vap = VapStore::shared();
+        vap.lock().unwrap().put("chart".into(), vec![1, 2, 3, 4], "image/png".into(), None);
+
+        let resp = get_with_vap(&root, "chart", &[], vap.clone());
+        assert_eq!(resp.status(), StatusCode::OK);
+        assert_eq!(resp.headers()[header::CONTENT_TYPE], "image/png");
+        assert_eq!(resp.body().as_ref(), &[1, 2, 3, 4]);
+
+        let resp = get_with_vap(&root, "chart", &[("Range", "bytes=1-2")], vap.clone());
+        assert_eq!(resp.status(), StatusCode::PARTIAL_CONTENT);
+        assert_eq!(resp.body().as_ref(), &[2, 3]);
+        assert_eq!(vap.lock().unwrap().hits, 2);
+
+        let resp = get_with_vap(&root, "missing", &[], vap);
+        assert_eq!(resp.status(), StatusCode::NOT_FOUND);
+    }
+
+    #[test]
+    fn caches_injected_pages() {
+        let root = asset_tree("pages");
+        let page = root.join("index.html");
+        let callbacks = Arc::new(Mutex::new(HashMap::new()));
+        let cache = ProtocolCache::new();
+
+        let meta = std::fs::metadata(&page).unwrap();
+        let (bridge_hash, first) = cache.page(&page, &meta, &callbacks).unwrap();
+        let (_, again) = cache.page(&page, &meta, &callbacks).unwrap();
+        assert!(Arc::ptr_eq(&first, &again));
+
+        // A new binding rebuilds the bridge and the page; the validator only
+        // depends on the script, so identical bindings keep the same ETag
+        cache.invalidate();
+        let (next, rebuilt) = cache.page(&page, &meta, &callbacks).unwrap();
+        assert_eq!(next, bridge_hash);
+        assert!(!Arc::ptr_eq(&first, &rebuilt));
+
+        // So does editing the file
+        std::fs::write(&page, "<html><head></head><body>v2</body></html>").unwrap();
+        let meta = std::fs::metadata(&page).unwrap();
+        let (_, edited) = cache.page(&page, &meta, &callbacks).unwrap();
+        assert!(String::from_utf8_lossy(&edited).contains("v2"));
+        assert_ne!(
+            page_etag(&meta, fnv1a(b"window.a = 1")),
+            page_etag(&meta, fnv1a(b"window.b = 1"))
+        );
+    }
+
+    #[test]
+    fn caps_large_bodies() {
+        let video = mime_guess::from_ext("mp4").first_or_octet_stream();
+        let script = mime_guess::from_ext("js").first_or_octet_stream();
+        assert!(caps_full_body(&video, MAX_RANGE_CHUNK + 1));
+        assert!(!caps_full_body(&video, MAX_RANGE_CHUNK));
+        assert!(!caps_full_body(&script, MAX_FULL_BODY));
+        assert!(caps_full_body(&script, MAX_FULL_BODY + 1));
+    }
+}
@@ -1,4 +1,7 @@
 use std::panic;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use pyo3::buffer::PyBuffer;
 
 pub fn setup_panic_hook() {
     static ONCE: std::sync::Once = std::sync::Once::new();
@@ -32,3 +35,20 @@ pub fn load_icon(path: &std::path::Path) -> Result<tray_icon::Icon, Box<dyn std:
     let rgba_bytes = rgba.into_raw();
     Ok(tray_icon::Icon::from_rgba(rgba_bytes, width, height)?)
 }
+
+/// Accepts either a `str` or pre-encoded UTF-8 `bytes` payload from Python.
+pub fn extract_payload(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(b) = obj.downcast::<PyBytes>() {
+        return Ok(b.as_bytes().to_vec());
+    }
+    Ok(obj.extract::<String>()?.into_bytes())
+}
+
+/// Copies `bytes` or any byte-formatted buffer (e.g. a `memoryview` over a
+/// numpy array) into an owned body in a single memcpy.
+pub fn extract_buffer(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(b) = obj.downcast::<PyBytes>() {
+        return Ok(b.as_bytes().to_vec());
+    }
+    PyBuffer::<u8>::get(obj)?.to_vec(obj.py())
+}
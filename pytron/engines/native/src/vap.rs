@@ -0,0 +1,173 @@
+use std::collections::{BTreeMap, HashMap};
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
+
+/// Default memory budget, matching pytron.vap.DEFAULT_VAP_MAX_BYTES.
+pub const DEFAULT_VAP_MAX_BYTES: usize = 256 * 1024 * 1024;
+
+struct VapEntry {
+    data: Arc<Vec<u8>>,
+    mime: String,
+    expires_at: Option<Instant>,
+    tick: u64,
+}
+
+/// Rust-owned Virtual Asset Provider store (pytron://<key>).
+///
+/// `serve_data` copies the bytes in once; the protocol handler then answers
+/// requests from here without taking the GIL. Bounded by a byte budget with
+/// least-recently-used eviction and an optional per-entry time-to-live, like
+/// the Python VAPStore it replaces.
+pub struct VapStore {
+    entries: HashMap<String, VapEntry>,
+    // Recency order: use tick -> key, oldest first
+    order: BTreeMap<u64, String>,
+    tick: u64,
+    bytes: usize,
+    pub max_bytes: usize,
+    pub ttl: Option<Duration>,
+    pub hits: u64,
+    pub misses: u64,
+    pub evictions: u64,
+    pub expirations: u64,
+}
+
+pub type SharedVapStore = Arc<Mutex<VapStore>>;
+
+impl Default for VapStore {
+    fn default() -> Self {
+        Self::new(DEFAULT_VAP_MAX_BYTES, None)
+    }
+}
+
+impl VapStore {
+    pub fn new(max_bytes: usize, ttl: Option<Duration>) -> Self {
+        VapStore {
+            entries: HashMap::new(),
+            order: BTreeMap::new(),
+            tick: 0,
+            bytes: 0,
+            max_bytes,
+            ttl,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+            expirations: 0,
+        }
+    }
+
+    pub fn shared() -> SharedVapStore {
+        Arc::new(Mutex::new(Self::default()))
+    }
+
+    fn next_tick(&mut self) -> u64 {
+        self.tick += 1;
+        self.tick
+    }
+
+    fn drop_entry(&mut self, key: &str) -> Option<VapEntry> {
+        let entry = self.entries.remove(key)?;
+        self.order.remove(&entry.tick);
+        self.bytes -= entry.data.len();
+        Some(entry)
+    }
+
+    pub fn put(&mut self, key: String, data: Vec<u8>, mime: String, ttl: Option<Duration>) {
+        self.drop_entry(&key);
+        let expires_at = ttl.or(self.ttl).map(|ttl| Instant::now() + ttl);
+        let tick = self.next_tick();
+        self.bytes += data.len();
+        self.order.insert(tick, key.clone());
+        self.entries.insert(key, VapEntry { data: Arc::new(data), mime, expires_at, tick });
+
+        // Evict oldest first, but never the entry we were just asked to serve
+        while self.bytes > self.max_bytes && self.entries.len() > 1 {
+            let oldest = match self.order.values().next() {
+                Some(oldest) => oldest.clone(),
+                None => break,
+            };
+            self.drop_entry(&oldest);
+            self.evictions += 1;
+        }
+    }
+
+    /// Returns the bytes and mime type, marking the entry as recently used.
+    pub fn get(&mut self, key: &str) -> Option<(Arc<Vec<u8>>, String)> {
+        let expired = match self.entries.get(key) {
+            Some(entry) => entry.expires_at.map_or(false, |at| at <= Instant::now()),
+            None => {
+                self.misses += 1;
+                return None;
+            }
+        };
+        if expired {
+            self.drop_entry(key);
+            self.expirations += 1;
+            self.misses += 1;
+            return None;
+        }
+
+        let tick = self.next_tick();
+        let entry = self.entries.get_mut(key)?;
+        self.order.remove(&entry.tick);
+        self.order.insert(tick, key.to_string());
+        entry.tick = tick;
+        self.hits += 1;
+        Some((entry.data.clone(), entry.mime.clone()))
+    }
+
+    pub fn remove(&mut self, key: &str) -> bool {
+        self.drop_entry(key).is_some()
+    }
+
+    pub fn contains(&self, key: &str) -> bool {
+        self.entries.contains_key(key)
+    }
+
+    pub fn clear(&mut self) {
+        self.entries.clear();
+        self.order.clear();
+        self.bytes = 0;
+    }
+
+    pub fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    pub fn bytes(&self) -> usize {
+        self.bytes
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn evicts_least_recently_used() {
+        let mut store = VapStore::new(10, None);
+        store.put("a".into(), vec![0; 4], "image/png".into(), None);
+        store.put("b".into(), vec![0; 4], "image/png".into(), None);
+        assert!(store.get("a").is_some());
+        store.put("c".into(), vec![0; 4], "image/png".into(), None);
+
+        assert!(store.contains("a"));
+        assert!(!store.contains("b"));
+        assert_eq!(store.bytes(), 8);
+        assert_eq!(store.evictions, 1);
+
+        // An entry larger than the budget is still served
+        store.put("big".into(), vec![0; 64], "image/png".into(), None);
+        assert_eq!(store.len(), 1);
+        assert_eq!(store.get("big").unwrap().0.len(), 64);
+    }
+
+    #[test]
+    fn expires_entries() {
+        let mut store = VapStore::new(1024, None);
+        store.put("k".into(), vec![1], "text/plain".into(), Some(Duration::from_millis(0)));
+        assert!(store.get("k").is_none());
+        assert_eq!(store.expirations, 1);
+        assert_eq!(store.bytes(), 0);
+    }
+}
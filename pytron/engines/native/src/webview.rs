@@ -1,7 +1,9 @@
 use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyDict};
 use std::collections::HashMap;
 use std::sync::{Arc, Mutex};
 use std::path::PathBuf;
+use std::time::Duration;
 
 use tao::{
     event::{Event, WindowEvent},
@@ -16,8 +18,10 @@ use wry::WebViewBuilderExtWindows;
 
 use crate::events::UserEvent;
 use crate::state::RuntimeState;
-use crate::utils::{setup_panic_hook, SendWrapper, load_icon};
-use crate::protocol::handle_pytron_protocol;
+use crate::utils::{setup_panic_hook, SendWrapper, load_icon, extract_payload, extract_buffer};
+use crate::protocol::{handle_pytron_protocol, ProtocolCache};
+use crate::vap::{SharedVapStore, VapStore};
+use crate::batch::{ScriptBatch, SharedBatchStats};
 
 #[pyclass]
 pub struct NativeWebview {
@@ -26,6 +30,9 @@ pub struct NativeWebview {
     state_ptr: Mutex<Option<usize>>, 
     hwnd: usize,
     callbacks: Arc<Mutex<HashMap<String, PyObject>>>,
+    protocol_cache: Arc<ProtocolCache>,
+    vap: SharedVapStore,
+    script_stats: SharedBatchStats,
 }
 
 unsafe impl Send for NativeWebview {}
@@ -80,9 +87,19 @@ impl NativeWebview {
         // --- Custom Protocol Handler ---
         let protocol_root = root.clone();
         let cbs_for_protocol = callbacks.clone();
+        let protocol_cache = ProtocolCache::new();
+        let cache_for_protocol = protocol_cache.clone();
+        let vap = VapStore::shared();
+        let vap_for_protocol = vap.clone();
         
         builder = builder.with_custom_protocol("pytron".into(), move |request| {
-            handle_pytron_protocol(request, protocol_root.clone(), cbs_for_protocol.clone())
+            handle_pytron_protocol(
+                request,
+                protocol_root.clone(),
+                cbs_for_protocol.clone(),
+                cache_for_protocol.clone(),
+                vap_for_protocol.clone(),
+            )
         });
         
         #[cfg(target_os = "windows")]
@@ -161,24 +178,247 @@ impl NativeWebview {
 
             window.pytron = window.pytron || {};
             window.pytron.is_ready = true;
-            window.__pytron_native_bridge = (method, args) => {
-                const seq = Math.random().toString(36).substring(2, 10);
-                window.ipc.postMessage(JSON.stringify({id: seq, method: method, params: args}));
-                return new Promise((resolve, reject) => {
-                    window._rpc = window._rpc || {};
-                    window._rpc[seq] = {resolve, reject};
+            // --- BATCHED BRIDGE ---
+            // Calls made in the same microtask travel as one '__pytron_batch'
+            // message and come back as one frame of [seq, status, value] entries.
+            // A trailing AbortSignal argument cancels the call in Python.
+            window.__pytron_native_bridge = (function() {
+                // Answered by Rust itself, so they can't ride in a batch
+                const DIRECT = new Set([
+                    'pytron_drag', 'drag', 'pytron_close', 'close', 'app_quit',
+                    'system_notification', 'pytron_system_notification',
+                    'set_taskbar_progress', 'pytron_set_taskbar_progress',
+                    'pytron_message_box', 'message_box'
+                ]);
+                let queue = null;
+                const newSeq = () => Math.random().toString(36).substring(2, 10);
+                const post = (seq, method, params) => window.ipc.postMessage(JSON.stringify({id: seq, method: method, params: params}));
+                const settle = (seq, status, value) => {
+                    const p = window._rpc[seq];
+                    if (!p) return;
+                    delete window._rpc[seq];
+                    if (status === 0) p.resolve(value); else p.reject(value);
+                };
+                const cancel = (seq, reason) => {
+                    const p = window._rpc[seq];
+                    if (!p) return;
+                    delete window._rpc[seq];
+                    p.reject(reason);
+                    // Not sent yet: dropping it from the queue is enough
+                    const queued = queue ? queue.findIndex(c => c[0] === seq) : -1;
+                    if (queued >= 0) return queue.splice(queued, 1);
+                    // Fire-and-forget: without an id Python sends no reply
+                    post(null, '__pytron_cancel', [[seq]]);
+                };
+                const flush = () => {
+                    const calls = queue;
+                    queue = null;
+                    if (!calls.length) return;
+                    if (calls.length === 1) return post(...calls[0]);
+                    const seq = newSeq();
+                    window._rpc[seq] = {
+                        resolve: (v) => Promise.resolve(v).then(entries => entries.forEach(e => settle(e[0], e[1], e[2]))),
+                        reject: (err) => calls.forEach(c => settle(c[0], 1, err))
+                    };
+                    post(seq, '__pytron_batch', calls);
+                };
+                // Whatever is still pending when the page goes away is abandoned
+                window.addEventListener('pagehide', () => {
+                    const pending = Object.keys(window._rpc || {});
+                    if (pending.length) post(null, '__pytron_cancel', [pending]);
                 });
-            };
+                return (method, args) => {
+                    const seq = newSeq();
+                    const last = args[args.length - 1];
+                    const signal = last instanceof AbortSignal ? args.pop() : null;
+                    if (signal && signal.aborted) return Promise.reject(signal.reason);
+                    const promise = new Promise((resolve, reject) => {
+                        window._rpc = window._rpc || {};
+                        window._rpc[seq] = {resolve, reject};
+                    });
+                    if (DIRECT.has(method)) {
+                        post(seq, method, args);
+                    } else {
+                        if (!queue) {
+                            queue = [];
+                            queueMicrotask(flush);
+                        }
+                        queue.push([seq, method, args]);
+                    }
+                    if (signal) signal.addEventListener('abort', () => cancel(seq, signal.reason), {once: true});
+                    return promise;
+                };
+            })();
             window.pytron_close = () => window.__pytron_native_bridge('pytron_close', []);
             window.pytron_drag = () => window.__pytron_native_bridge('pytron_drag', []);
             window.pytron_log = (msg) => window.__pytron_native_bridge('pytron_log', [msg]);
 
+            // --- TYPED ARRAYS ---
+            // Results may carry {__pytron_type__: 'ndarray'} descriptors whose raw
+            // bytes live in the VAP store; swap them for ready-made TypedArrays.
+            window.__pytron_hydrate = (function() {
+                const TYPES = {
+                    int8: Int8Array, uint8: Uint8Array, int16: Int16Array, uint16: Uint16Array,
+                    int32: Int32Array, uint32: Uint32Array, int64: BigInt64Array, uint64: BigUint64Array,
+                    float32: Float32Array, float64: Float64Array, bool: Uint8Array
+                };
+                const load = async (d) => {
+                    let buf;
+                    if (d.data !== undefined) {
+                        const bin = atob(d.data);
+                        const bytes = new Uint8Array(bin.length);
+                        for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                        buf = bytes.buffer;
+                    } else {
+                        buf = await (await fetch((window.__pytron_vap_base || 'pytron://app/') + d.key)).arrayBuffer();
+                    }
+                    const arr = new TYPES[d.dtype](buf);
+                    arr.dtype = d.dtype;
+                    arr.shape = d.shape;
+                    return arr;
+                };
+                const isArray = (v) => v !== null && typeof v === 'object' && v.__pytron_type__ === 'ndarray';
+                const isStream = (v) => v.__pytron_type__ === 'stream';
+                return (value) => {
+                    if (value === null || typeof value !== 'object') return value;
+                    if (isArray(value)) return load(value);
+                    if (isStream(value)) return window.__pytron_stream(value.id);
+                    const jobs = [];
+                    const visit = (node) => {
+                        for (const k in node) {
+                            const child = node[k];
+                            if (child === null || typeof child !== 'object') continue;
+                            if (isArray(child)) jobs.push(load(child).then(a => { node[k] = a; }));
+                            else if (isStream(child)) node[k] = window.__pytron_stream(child.id);
+                            else visit(child);
+                        }
+                    };
+                    visit(value);
+                    return jobs.length ? Promise.all(jobs).then(() => value) : value;
+                };
+            })();
+
+            // --- STREAMED RESULTS ---
+            // Generator handlers answer with {__pytron_type__: 'stream', id}; hydrate turns
+            // that into an async iterator fed by 'pytron:stream' events. Credits go back
+            // in halves of the window Python starts with, so it never runs far ahead.
+            window.__pytron_stream = window.__pytron_stream || (function() {
+                const WINDOW = 16;
+                const streams = {};
+                const call = (method, args) => (window.__pytron_enqueue || window.__pytron_native_bridge)(method, args);
+                const state = (id) => streams[id] || (streams[id] = { chunks: [], done: false, error: undefined, wake: null, used: 0 });
+                window.addEventListener('pytron:stream', (e) => {
+                    const d = e.detail;
+                    const s = state(d.id);
+                    if ('chunk' in d) s.chunks.push(d.chunk);
+                    else if ('error' in d) s.error = d.error;
+                    else s.done = true;
+                    if (s.wake) { s.wake(); s.wake = null; }
+                });
+                return (id) => {
+                    const s = state(id);
+                    const finished = () => s.done || s.error !== undefined;
+                    return {
+                        [Symbol.asyncIterator]() { return this; },
+                        async next() {
+                            while (!s.chunks.length) {
+                                if (finished()) {
+                                    delete streams[id];
+                                    if (s.error !== undefined) throw s.error;
+                                    return { value: undefined, done: true };
+                                }
+                                await new Promise((resolve) => { s.wake = resolve; });
+                            }
+                            const value = s.chunks.shift();
+                            if (++s.used >= WINDOW / 2 && !finished()) {
+                                call('__pytron_stream_credit', [id, s.used]);
+                                s.used = 0;
+                            }
+                            return { value: await (window.__pytron_hydrate ? window.__pytron_hydrate(value) : value), done: false };
+                        },
+                        async return() {
+                            // Stopped early (break, or an error in the loop body)
+                            if (!finished()) call('__pytron_cancel', [[id]]);
+                            delete streams[id];
+                            return { value: undefined, done: true };
+                        }
+                    };
+                };
+            })();
+
+            // --- STATE PATCHES ---
+            // Mirrors dict/list state values so 'pytron:state-patch' (RFC 6902)
+            // can be applied here and re-dispatched as a full 'pytron:state-update'.
+            (function() {
+                const mirror = {};
+                const resyncing = {};
+                const unescape = (s) => s.replace(/~1/g, '/').replace(/~0/g, '~');
+                const applyPatch = (doc, ops) => {
+                    // Copy each container once per patch so listeners get fresh references
+                    const fresh = new WeakSet();
+                    const own = (node) => {
+                        if (fresh.has(node)) return node;
+                        const copy = Array.isArray(node) ? node.slice() : Object.assign({}, node);
+                        fresh.add(copy);
+                        return copy;
+                    };
+                    for (const op of ops) {
+                        const parts = op.path.split('/').slice(1).map(unescape);
+                        if (!parts.length) { doc = op.value; continue; }
+                        doc = own(doc);
+                        let node = doc;
+                        for (let i = 0; i < parts.length - 1; i++) node = node[parts[i]] = own(node[parts[i]]);
+                        const last = parts[parts.length - 1];
+                        if (Array.isArray(node)) {
+                            const index = last === '-' ? node.length : Number(last);
+                            if (op.op === 'add') node.splice(index, 0, op.value);
+                            else if (op.op === 'remove') node.splice(index, 1);
+                            else node[index] = op.value;
+                        } else if (op.op === 'remove') {
+                            delete node[last];
+                        } else {
+                            node[last] = op.value;
+                        }
+                    }
+                    return doc;
+                };
+                const publish = (key, value, version) => {
+                    window.dispatchEvent(new CustomEvent('pytron:state-update', { detail: { key: key, value: value, version: version } }));
+                };
+                window.addEventListener('pytron:state-update', (e) => {
+                    const d = e.detail;
+                    if (d && d.version !== undefined) mirror[d.key] = { value: d.value, version: d.version };
+                    else if (d) delete mirror[d.key];
+                });
+                window.addEventListener('pytron:state-patch', (e) => {
+                    const d = e.detail;
+                    if (resyncing[d.key]) return resyncing[d.key].push(d);
+                    const cur = mirror[d.key];
+                    if (cur && cur.version >= d.version) return;
+                    if (cur && cur.version === d.base) return publish(d.key, applyPatch(cur.value, d.patch), d.version);
+                    // Unknown base (e.g. after a reload): fetch a snapshot, then replay newer patches
+                    resyncing[d.key] = [d];
+                    window.__pytron_native_bridge('pytron_state_get', [d.key]).then((snap) => {
+                        let value = snap.value, version = snap.version;
+                        for (const p of resyncing[d.key]) {
+                            if (p.base === version) { value = applyPatch(value, p.patch); version = p.version; }
+                        }
+                        delete resyncing[d.key];
+                        publish(d.key, value, version);
+                    }, () => { delete resyncing[d.key]; });
+                });
+            })();
+
             // Override alert to use native message box
             window.alert = (msg) => {
                 window.__pytron_native_bridge('pytron_message_box', ["Alert", String(msg), "info"]);
             };
         "#);
 
+        // Where the bridge fetches VAP blobs from (mirrors the protocol scheme above)
+        let vap_base = if cfg!(target_os = "windows") { "https://pytron.localhost/" } else { "pytron://app/" };
+        builder = builder.with_initialization_script(&format!("window.__pytron_vap_base = '{}';", vap_base));
+
         builder = builder.with_ipc_handler(move |request| {
             let msg = request.body().clone();
             if let Ok(val) = serde_json::from_str::<serde_json::Value>(&msg) {
@@ -260,6 +500,9 @@ impl NativeWebview {
             state_ptr: Mutex::new(Some(state as usize)),
             hwnd,
             callbacks,
+            protocol_cache,
+            vap,
+            script_stats: SharedBatchStats::default(),
         })
     }
 
@@ -272,6 +515,7 @@ impl NativeWebview {
             let cbs_arc = state.callbacks.clone();
             let w_el = SendWrapper::new(el);
             let w_state = SendWrapper::new(state);
+            let script_stats = self.script_stats.clone();
 
             // Spawn Menu Event Listener Thread
             let proxy_for_menu = self.proxy.clone();
@@ -288,6 +532,7 @@ impl NativeWebview {
             py.allow_threads(move || {
                 let el = w_el.take();
                 let mut state = w_state.take();
+                let mut batch = ScriptBatch::default();
                 
                 el.run(move |event, _, control_flow| {
                     *control_flow = ControlFlow::Wait;
@@ -309,7 +554,18 @@ impl NativeWebview {
                              
                              match ue {
                                 UserEvent::Quit => *control_flow = ControlFlow::Exit,
-                                UserEvent::Eval(js) => { let _ = state.webview.evaluate_script(&js); }
+                                UserEvent::Eval(js) => {
+                                    // Arbitrary JS stays out of the batch (a syntax error would sink it),
+                                    // but must still run after anything queued before it
+                                    if let Some(pending) = batch.take(&script_stats) {
+                                        let _ = state.webview.evaluate_script(&pending);
+                                    }
+                                    let _ = state.webview.evaluate_script(&js);
+                                }
+                                UserEvent::Emit(name, detail) => {
+                                    let name = serde_json::to_string(&name).unwrap_or_default();
+                                    batch.push(format!("window.dispatchEvent(new CustomEvent({}, {{ detail: {} }}));", name, detail));
+                                }
                                 UserEvent::SetTitle(t) => { state.window.set_title(&t); }
                                 UserEvent::SetSize(w, h, _) => { state.window.set_inner_size(tao::dpi::LogicalSize::new(w, h)); }
                                 
@@ -333,8 +589,8 @@ impl NativeWebview {
                                 }
 
                                 UserEvent::Return(seq, status, res) => {
-                                    let js = format!(r#"if (window._rpc && window._rpc['{seq}']) {{ if ({status} === 0) window._rpc['{seq}'].resolve({res}); else window._rpc['{seq}'].reject({res}); delete window._rpc['{seq}']; }}"#, seq=seq, status=status, res=res);
-                                    let _ = state.webview.evaluate_script(&js);
+                                    let js = format!(r#"if (window._rpc && window._rpc['{seq}']) {{ const p = window._rpc['{seq}']; delete window._rpc['{seq}']; const v = {res}; if ({status} === 0) p.resolve(window.__pytron_hydrate ? window.__pytron_hydrate(v) : v); else p.reject(v); }}"#, seq=seq, status=status, res=res);
+                                    batch.push(js);
                                 }
                                 UserEvent::SetVisible(v) => { 
                                     state.window.set_visible(v); 
@@ -477,6 +733,14 @@ impl NativeWebview {
                             }
                         }
                         
+                        // PERFORMANCE: One evaluate_script per loop iteration for every
+                        // result and event that arrived during it
+                        Event::MainEventsCleared => {
+                            if let Some(script) = batch.take(&script_stats) {
+                                let _ = state.webview.evaluate_script(&script);
+                            }
+                        }
+
                         Event::WindowEvent { event: WindowEvent::CloseRequested, .. } => {
                              if state.prevent_close {
                                  let mut found: Option<PyObject> = None;
@@ -505,13 +769,86 @@ impl NativeWebview {
     pub fn set_size(&self, w: i32, h: i32, hints: u32) { let _ = self.proxy.send_event(UserEvent::SetSize(w, h, hints)); }
     pub fn navigate(&self, u: String) { let _ = self.proxy.send_event(UserEvent::Navigate(u)); }
     pub fn eval(&self, j: String) { let _ = self.proxy.send_event(UserEvent::Eval(j)); }
+    /// Queues a CustomEvent dispatch; `detail` is a JSON payload (str or bytes).
+    pub fn emit(&self, event: String, detail: &Bound<'_, PyAny>) -> PyResult<()> {
+        let detail = String::from_utf8(extract_payload(detail)?)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid UTF-8 payload: {}", e)))?;
+        let _ = self.proxy.send_event(UserEvent::Emit(event, detail));
+        Ok(())
+    }
     pub fn bind(&self, n: String, f: PyObject) { 
         if let Ok(mut cbs) = self.callbacks.lock() {
             Python::with_gil(|py| { cbs.insert(n.clone(), f.clone_ref(py)); });
         }
+        // The injected bridge lists every binding
+        self.protocol_cache.invalidate();
         let _ = self.proxy.send_event(UserEvent::Bind(n, f)); 
     }
-    pub fn return_result(&self, s: String, st: i32, r: String) { let _ = self.proxy.send_event(UserEvent::Return(s, st, r)); }
+    pub fn return_result(&self, s: String, st: i32, r: &Bound<'_, PyAny>) -> PyResult<()> {
+        // Results arrive as UTF-8 JSON bytes from pytron_dumps (str still accepted)
+        let res = String::from_utf8(extract_payload(r)?)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid UTF-8 result: {}", e)))?;
+        let _ = self.proxy.send_event(UserEvent::Return(s, st, res));
+        Ok(())
+    }
+
+    // --- Virtual Asset Provider (Rust-owned, served without the GIL) ---
+    #[pyo3(signature = (key, data, mime, ttl=None))]
+    pub fn vap_put(&self, key: String, data: &Bound<'_, PyAny>, mime: String, ttl: Option<f64>) -> PyResult<()> {
+        let bytes = extract_buffer(data)?;
+        let ttl = ttl.filter(|t| *t > 0.0).map(Duration::from_secs_f64);
+        if let Ok(mut store) = self.vap.lock() {
+            store.put(key, bytes, mime, ttl);
+        }
+        Ok(())
+    }
+    pub fn vap_get<'py>(&self, py: Python<'py>, key: &str) -> Option<(Bound<'py, PyBytes>, String)> {
+        let asset = self.vap.lock().ok().and_then(|mut store| store.get(key));
+        asset.map(|(data, mime)| (PyBytes::new(py, &data), mime))
+    }
+    pub fn vap_remove(&self, key: &str) -> bool {
+        self.vap.lock().map(|mut store| store.remove(key)).unwrap_or(false)
+    }
+    pub fn vap_contains(&self, key: &str) -> bool {
+        self.vap.lock().map(|store| store.contains(key)).unwrap_or(false)
+    }
+    pub fn vap_clear(&self) {
+        if let Ok(mut store) = self.vap.lock() { store.clear(); }
+    }
+    #[pyo3(signature = (max_bytes, ttl=None))]
+    pub fn vap_configure(&self, max_bytes: usize, ttl: Option<f64>) {
+        if let Ok(mut store) = self.vap.lock() {
+            store.max_bytes = max_bytes;
+            store.ttl = ttl.filter(|t| *t > 0.0).map(Duration::from_secs_f64);
+        }
+    }
+    pub fn vap_stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let stats = PyDict::new(py);
+        if let Ok(store) = self.vap.lock() {
+            stats.set_item("entries", store.len())?;
+            stats.set_item("bytes", store.bytes())?;
+            stats.set_item("max_bytes", store.max_bytes)?;
+            stats.set_item("hits", store.hits)?;
+            stats.set_item("misses", store.misses)?;
+            stats.set_item("evictions", store.evictions)?;
+            stats.set_item("expirations", store.expirations)?;
+        }
+        Ok(stats)
+    }
+
+    /// Sizes of the batched scripts the event loop has evaluated.
+    pub fn script_stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let stats = PyDict::new(py);
+        if let Ok(batch) = self.script_stats.lock() {
+            stats.set_item("flushes", batch.flushes)?;
+            stats.set_item("scripts", batch.scripts)?;
+            stats.set_item("bytes", batch.bytes)?;
+            stats.set_item("last_batch", batch.last_batch)?;
+            stats.set_item("max_batch", batch.max_batch)?;
+        }
+        Ok(stats)
+    }
+
     pub fn terminate(&self) { let _ = self.proxy.send_event(UserEvent::Quit); }
     pub fn show(&self) { let _ = self.proxy.send_event(UserEvent::SetVisible(true)); }
     pub fn hide(&self) { let _ = self.proxy.send_event(UserEvent::SetVisible(false)); }
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+import contextvars
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Window whose frontend made the call running in the current thread/task
+_current_window = contextvars.ContextVar("pytron_current_window", default=None)
+
+
+def current_window():
+    """
+    Returns the window that called the exposed function currently running,
+    or None outside of a call. Works in sync and async handlers alike, so
+    handlers on the app-wide loop can still tell windows apart.
+    """
+    return _current_window.get()
+
+
+def start_event_loop(name="Pytron-Loop", use_uvloop=True):
+    """
+    PERFORMANCE: Creates an event loop (uvloop when installed) and runs it
+    forever on a daemon thread. Returns the loop once it is running.
+    """
+    if use_uvloop and uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    running = threading.Event()
+
+    def _run():
+        asyncio.set_event_loop(loop)
+        loop.call_soon(running.set)
+        loop.run_forever()
+
+    threading.Thread(target=_run, name=name, daemon=True).start()
+    running.wait()
+    return loop
+
+
+def stop_event_loop(loop):
+    """Stops a loop started by start_event_loop(); safe from any thread."""
+    if loop is not None and not loop.is_closed():
+        loop.call_soon_threadsafe(loop.stop)
@@ -34,3 +34,15 @@ class DependencyError(PytronError):
     """Raised when a required dependency is missing."""
 
     pass
+
+
+class CallCancelled(BridgeError):
+    """Raised inside an exposed function whose call the frontend abandoned."""
+
+    pass
+
+
+class ArgumentError(BridgeError):
+    """Raised when the frontend passes arguments that don't match the type hints."""
+
+    pass
@@ -119,11 +119,20 @@ class Inspector:
                         "dimensions": config.get("dimensions", [0, 0]),
                     }
                 )
+                # Outbound IPC metrics (Chrome queue, native script batches)
+                ipc = w.ipc_stats() if hasattr(w, "ipc_stats") else None
+                if ipc is not None:
+                    win_data[-1]["ipc"] = ipc
 
             return {
                 "state": self.app.state.to_dict(),
                 "stats": self.get_stats(),
                 "windows": win_data,
+                "window_pool": self.app.window_pool_stats(),
+                "executors": self.app.executors.stats(),
+                "call_caches": self.app.cache_stats(),
+                "call_stats": self.app.call_stats(),
+                "slow_calls": self.app.slow_calls(),
                 "plugins": getattr(self.app, "plugin_statuses", []),
                 "ipc_history": list(self.ipc_history),
             }
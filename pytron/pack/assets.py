@@ -1,7 +1,27 @@
 import os
+import gzip
 from pathlib import Path
 from ..console import log
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Text formats worth compressing; images and media are compressed already
+COMPRESSIBLE_SUFFIXES = {
+    ".js",
+    ".mjs",
+    ".css",
+    ".html",
+    ".json",
+    ".svg",
+    ".wasm",
+    ".txt",
+    ".xml",
+}
+MIN_COMPRESS_SIZE = 1024
+
 
 def get_smart_assets(
     script_dir: Path,
@@ -129,3 +149,39 @@ def get_smart_assets(
             log(f"Auto-including asset: {rel_path}", style="dim")
 
     return add_data
+
+
+def precompress_assets(src_dir: Path, out_dir: Path):
+    """Writes .br/.gz siblings of compressible files in `src_dir` under `out_dir`.
+
+    The tree under `out_dir` mirrors `src_dir`, so it can be bundled to the same
+    destination. A sibling is only kept if it saves at least 10%. Brotli needs
+    the optional `brotli` package; gzip is always produced.
+    Returns the number of files written.
+    """
+    encoders = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.insert(0, (".br", lambda raw: brotli.compress(raw, quality=11)))
+    else:
+        log("brotli not installed, precompressing with gzip only", style="dim")
+
+    written = 0
+    src_dir = Path(src_dir)
+    for root, _, files in os.walk(src_dir):
+        for filename in files:
+            file_path = Path(root) / filename
+            if file_path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+                continue
+            raw = file_path.read_bytes()
+            if len(raw) < MIN_COMPRESS_SIZE:
+                continue
+            target_dir = Path(out_dir) / file_path.parent.relative_to(src_dir)
+            for suffix, encode in encoders:
+                data = encode(raw)
+                if len(data) > len(raw) * 0.9:
+                    continue
+                target_dir.mkdir(parents=True, exist_ok=True)
+                (target_dir / (filename + suffix)).write_bytes(data)
+                written += 1
+
+    return written
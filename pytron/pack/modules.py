@@ -5,7 +5,7 @@ import shutil
 from pathlib import Path
 from .pipeline import BuildModule, BuildContext
 from ..console import log, console
-from .assets import get_smart_assets
+from .assets import get_smart_assets, precompress_assets
 from .metadata import MetadataEditor
 
 
@@ -51,6 +51,22 @@ class AssetModule(BuildModule):
             rel_path = frontend_dist.relative_to(context.script_dir)
             context.add_data.append(f"{frontend_dist}{os.pathsep}{rel_path}")
 
+            # PERFORMANCE: .br/.gz siblings the pytron:// handlers serve directly
+            if getattr(context, "precompress", False) or context.settings.get(
+                "precompress_assets", False
+            ):
+                compressed_dir = context.build_dir / "pytron_assets" / "precompressed"
+                shutil.rmtree(compressed_dir, ignore_errors=True)
+                try:
+                    count = precompress_assets(frontend_dist, compressed_dir)
+                    if count:
+                        log(f"Precompressed {count} frontend assets", style="dim")
+                        context.add_data.append(
+                            f"{compressed_dir}{os.pathsep}{rel_path}"
+                        )
+                except Exception as e:
+                    log(f"Warning: Precompressing assets failed: {e}", style="warning")
+
         # 3. Smart Assets
         # (This is a simplified version of what was in package.py)
         if getattr(context, "smart_assets", False):
@@ -71,8 +71,11 @@ class SupervisedApp:
         self.logger = logging.getLogger(f"Pytron.Plugin.{plugin_name}.Supervisor")
         self.storage = PluginStorage(app, plugin_name)
 
-    def expose(self, func, name=None, secure=False):
-        """Wraps the exposed function in an error handler."""
+    def expose(self, func, name=None, secure=False, **limits):
+        """
+        Wraps the exposed function in an error handler. Executor, concurrency
+        and caching options are passed through to App.expose.
+        """
         func_name = name or func.__name__
 
         def safe_wrapper(*args, **kwargs):
@@ -85,7 +88,7 @@ class SupervisedApp:
                 self.logger.debug(traceback.format_exc())
                 return {"error": "Plugin Execution Failed", "message": str(e)}
 
-        return self._app.expose(safe_wrapper, name=name, secure=secure)
+        return self._app.expose(safe_wrapper, name=name, secure=secure, **limits)
 
     def __getattr__(self, name):
         # Delegate everything else (state, broadcast, etc.) to the real app
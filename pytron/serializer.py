@@ -5,6 +5,11 @@ import datetime
 import uuid
 import decimal
 import pathlib
+import enum
+import dataclasses
+import array
+import struct
+import sys
 
 # Optional dependencies
 try:
@@ -72,22 +77,12 @@ class PytronJSONEncoder(json.JSONEncoder):
             return {"real": obj.real, "imag": obj.imag}
 
         # 4. Enums
-        try:
-            import enum
-
-            if isinstance(obj, enum.Enum):
-                return obj.value
-        except ImportError:
-            pass
+        if isinstance(obj, enum.Enum):
+            return obj.value
 
         # 5. Dataclasses
-        try:
-            import dataclasses
-
-            if dataclasses.is_dataclass(obj):
-                return dataclasses.asdict(obj)
-        except ImportError:
-            pass
+        if dataclasses.is_dataclass(obj):
+            return dataclasses.asdict(obj)
 
         # 6. Universal Fallback: Try __dict__ / vars() for generic arbitrary objects
         if hasattr(obj, "__dict__"):
@@ -136,88 +131,208 @@ class PytronJSONEncoder(json.JSONEncoder):
             return super().default(obj)
 
 
-def pytron_serialize(obj, vap_provider=None):
-    """
-    Helper to serialize objects to JSON-compatible primitives.
-    OPTIMIZED: Avoids double serialization (dumps/loads) by recursively
-    converting complex types into primitives.
-    """
-    if obj is None or isinstance(obj, (str, int, float, bool)):
-        return obj
+# --- Type Dispatch ---
+# PERFORMANCE: Instead of walking a long isinstance chain for every value, each
+# concrete type is resolved once (via its MRO, like functools.singledispatch)
+# and the result is cached.
+#
+# Registered converters are *shallow*: they take (obj, vap_provider) and return
+# a value one step closer to JSON, whose children may still need converting.
+# pytron_serialize() recurses into that value, while pytron_dumps() hands it
+# back to the C JSON encoder, so both paths share the same rules. The C encoder
+# never asks about subclasses of the types it encodes itself (dict, list,
+# tuple, str, int, float), so while converters are registered for any of those
+# pytron_dumps() pre-walks with pytron_serialize() instead. Dict keys are
+# written as str(key); the C encoder would spell True/None/floats differently
+# (and reject tuples), so values holding such keys take the same pre-walk.
 
-    # Handle Pydantic Models
-    if pydantic and isinstance(obj, pydantic.BaseModel):
-        try:
-            return pytron_serialize(obj.model_dump(), vap_provider)
-        except AttributeError:
-            return pytron_serialize(obj.dict(), vap_provider)
-
-    # Handle PIL Images
-    if Image and isinstance(obj, Image.Image):
-        buffered = io.BytesIO()
-        obj.save(buffered, format="PNG")
-        if vap_provider:
-            asset_id = f"gen_img_{uuid.uuid4().hex[:8]}"
-            vap_provider(asset_id, buffered.getvalue(), "image/png")
-            return f"pytron://{asset_id}"
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
-        return f"data:image/png;base64,{img_str}"
-
-    if isinstance(obj, bytes):
-        if vap_provider:
-            asset_id = f"gen_bin_{uuid.uuid4().hex[:8]}"
-            vap_provider(asset_id, obj, "application/octet-stream")
-            return f"pytron://{asset_id}"
-        return base64.b64encode(obj).decode("utf-8")
-
-    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
-        return obj.isoformat()
-    if isinstance(obj, datetime.timedelta):
-        return obj.total_seconds()
-    if isinstance(obj, uuid.UUID):
-        return str(obj)
-    if isinstance(obj, decimal.Decimal):
-        return float(obj)
-    if isinstance(obj, pathlib.Path):
-        return str(obj)
-    if isinstance(obj, set):
-        return [pytron_serialize(i, vap_provider) for i in obj]
-    if isinstance(obj, complex):
-        return {"real": obj.real, "imag": obj.imag}
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+_JSON_NATIVE_TYPES = (dict, list, tuple, str, int, float)
+# Key types the C encoder writes exactly as str(key)
+_PLAIN_KEY_TYPES = frozenset((str, int))
 
-    # Dataclasses
-    try:
-        import dataclasses
+_registry = {}
+_converter_cache = {}
+_dispatch_cache = {}
+# User-registered classes the C encoder would encode without asking
+_native_overrides = set()
+
+
+def _register(converter, *types):
+    for cls in types:
+        _registry[cls] = converter
+
+
+def _identity(obj, vap_provider):
+    return obj
 
-        if dataclasses.is_dataclass(obj):
-            return pytron_serialize(dataclasses.asdict(obj), vap_provider)
-    except ImportError:
-        pass
 
-    # Enums
+def _convert_pydantic(obj, vap_provider):
     try:
-        import enum
+        return obj.model_dump()
+    except AttributeError:
+        return obj.dict()
 
-        if isinstance(obj, enum.Enum):
-            return obj.value
-    except ImportError:
-        pass
 
-    # Dictionaries
-    if isinstance(obj, dict):
-        return {str(k): pytron_serialize(v, vap_provider) for k, v in obj.items()}
+def _convert_pil_image(obj, vap_provider):
+    buffered = io.BytesIO()
+    obj.save(buffered, format="PNG")
+    if vap_provider:
+        asset_id = f"gen_img_{uuid.uuid4().hex[:8]}"
+        vap_provider(asset_id, buffered.getvalue(), "image/png")
+        return f"pytron://{asset_id}"
+    img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+    return f"data:image/png;base64,{img_str}"
+
+
+def _convert_bytes(obj, vap_provider):
+    if vap_provider:
+        asset_id = f"gen_bin_{uuid.uuid4().hex[:8]}"
+        vap_provider(asset_id, obj, "application/octet-stream")
+        return f"pytron://{asset_id}"
+    return base64.b64encode(obj).decode("utf-8")
+
+
+def _convert_isoformat(obj, vap_provider):
+    return obj.isoformat()
+
+
+def _convert_timedelta(obj, vap_provider):
+    return obj.total_seconds()
+
+
+def _convert_str(obj, vap_provider):
+    return str(obj)
+
+
+def _convert_float(obj, vap_provider):
+    return float(obj)
+
+
+def _convert_complex(obj, vap_provider):
+    return {"real": obj.real, "imag": obj.imag}
+
+
+def _convert_enum(obj, vap_provider):
+    return obj.value
+
+
+def _convert_list(obj, vap_provider):
+    return list(obj)
+
+
+def _convert_dataclass(obj, vap_provider):
+    # Walk fields directly: dataclasses.asdict() deep-copies every value first.
+    return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+
+
+# --- Typed Arrays ---
+# PERFORMANCE: Numeric buffers (numpy arrays, memoryviews, array.array) are sent
+# as raw little-endian bytes through the VAP instead of as JSON number lists.
+# The frontend bridge turns the descriptor back into a TypedArray.
+
+_TYPED_ARRAY_DTYPES = {
+    ("i", 1): "int8",
+    ("u", 1): "uint8",
+    ("i", 2): "int16",
+    ("u", 2): "uint16",
+    ("i", 4): "int32",
+    ("u", 4): "uint32",
+    ("i", 8): "int64",
+    ("u", 8): "uint64",
+    ("f", 4): "float32",
+    ("f", 8): "float64",
+    ("b", 1): "bool",
+}
 
-    # Iterables
-    if isinstance(obj, (list, tuple)):
-        return [pytron_serialize(i, vap_provider) for i in obj]
+# struct format character -> dtype kind
+_STRUCT_KINDS = {
+    **dict.fromkeys("bhilqn", "i"),
+    **dict.fromkeys("BHILQNc", "u"),
+    **dict.fromkeys("fd", "f"),
+    "?": "b",
+}
 
+
+def _typed_array(buffer, dtype, shape, vap_provider):
+    descriptor = {"__pytron_type__": "ndarray", "dtype": dtype, "shape": list(shape)}
+    if vap_provider:
+        # Snapshot: the VAP serves the bytes later, by when the caller may have
+        # changed the array the view borrows from
+        asset_id = f"gen_arr_{uuid.uuid4().hex[:8]}"
+        vap_provider(asset_id, bytes(buffer), "application/octet-stream")
+        descriptor["key"] = asset_id
+        descriptor["url"] = f"pytron://{asset_id}"
+    else:
+        descriptor["data"] = base64.b64encode(buffer).decode("ascii")
+    return descriptor
+
+
+def _convert_memoryview(obj, vap_provider):
+    fmt = obj.format
+    if fmt[:1] in "@=<":
+        fmt = fmt[1:]
+    dtype = _TYPED_ARRAY_DTYPES.get((_STRUCT_KINDS.get(fmt), obj.itemsize))
+    if dtype is None or sys.byteorder != "little" or obj.format[:1] in ">!":
+        try:
+            return obj.tolist()
+        except NotImplementedError:
+            # memoryview only unpacks native formats itself
+            return [
+                v[0] if len(v) == 1 else list(v)
+                for v in struct.iter_unpack(obj.format, obj.tobytes())
+            ]
+    # A C-contiguous view is copied (at most) once, by _typed_array
+    buffer = obj.cast("B") if obj.c_contiguous else obj.tobytes()
+    return _typed_array(buffer, dtype, obj.shape, vap_provider)
+
+
+def _convert_array(obj, vap_provider):
+    return _convert_memoryview(memoryview(obj), vap_provider)
+
+
+def _convert_bytearray(obj, vap_provider):
+    # Snapshot: the caller may keep mutating the bytearray after returning it.
+    return _convert_bytes(bytes(obj), vap_provider)
+
+
+def _convert_ndarray(obj, vap_provider):
+    numpy = sys.modules["numpy"]
+    dtype = _TYPED_ARRAY_DTYPES.get((obj.dtype.kind, obj.dtype.itemsize))
+    if dtype is None:
+        return obj.tolist()
+    if obj.dtype.byteorder == ">" or (
+        obj.dtype.byteorder == "=" and sys.byteorder != "little"
+    ):
+        obj = obj.astype(obj.dtype.newbyteorder("<"))
+    # ascontiguousarray() is a no-op for arrays that are already C-contiguous,
+    # so the common case is copied only once, into the VAP store
+    contiguous = numpy.ascontiguousarray(obj)
+    return _typed_array(
+        memoryview(contiguous).cast("B"), dtype, obj.shape, vap_provider
+    )
+
+
+def _convert_numpy_scalar(obj, vap_provider):
+    return obj.item()
+
+
+def _resolve_numpy_converter(cls):
+    # numpy is never imported here: if an instance exists, so does the module.
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return None
+    if issubclass(cls, numpy.ndarray):
+        return _convert_ndarray
+    if issubclass(cls, numpy.generic):
+        return _convert_numpy_scalar
+    return None
+
+
+def _convert_fallback(obj, vap_provider):
     # Universal Fallback: Try __dict__
     if hasattr(obj, "__dict__"):
-        return {
-            k: pytron_serialize(v, vap_provider)
-            for k, v in vars(obj).items()
-            if not k.startswith("_")
-        }
+        return {k: v for k, v in vars(obj).items() if not k.startswith("_")}
 
     # Slots Fallback
     if hasattr(obj, "__slots__"):
@@ -228,7 +343,7 @@ def pytron_serialize(obj, vap_provider=None):
         for key in slots:
             if not key.startswith("_"):
                 try:
-                    data[key] = pytron_serialize(getattr(obj, key), vap_provider)
+                    data[key] = getattr(obj, key)
                 except Exception:
                     pass
         return data
@@ -238,3 +353,201 @@ def pytron_serialize(obj, vap_provider=None):
         return str(obj)
     except Exception:
         return None
+
+
+_register(_identity, str, int, float, bool, type(None))
+if pydantic:
+    _register(_convert_pydantic, pydantic.BaseModel)
+if Image:
+    _register(_convert_pil_image, Image.Image)
+_register(_convert_bytes, bytes)
+_register(_convert_bytearray, bytearray)
+_register(_convert_memoryview, memoryview)
+_register(_convert_array, array.array)
+_register(_convert_isoformat, datetime.datetime, datetime.date, datetime.time)
+_register(_convert_timedelta, datetime.timedelta)
+_register(_convert_str, uuid.UUID, pathlib.PurePath)
+_register(_convert_float, decimal.Decimal)
+_register(_convert_complex, complex)
+_register(_convert_enum, enum.Enum)
+_register(_convert_list, set, frozenset)
+
+
+def _resolve_converter(cls):
+    for base in cls.__mro__:
+        if base is object:
+            continue
+        converter = _registry.get(base)
+        if converter is not None:
+            return converter
+    converter = _resolve_numpy_converter(cls)
+    if converter is not None:
+        return converter
+    if dataclasses.is_dataclass(cls):
+        return _convert_dataclass
+    return _convert_fallback
+
+
+def _get_converter(cls):
+    converter = _converter_cache.get(cls)
+    if converter is None:
+        converter = _converter_cache[cls] = _resolve_converter(cls)
+    return converter
+
+
+def _serialize_dict(obj, vap_provider):
+    return {str(k): pytron_serialize(v, vap_provider) for k, v in obj.items()}
+
+
+def _serialize_iterable(obj, vap_provider):
+    return [pytron_serialize(i, vap_provider) for i in obj]
+
+
+def _resolve_handler(cls):
+    """Builds the deep handler used by pytron_serialize for a concrete type."""
+    converter = _get_converter(cls)
+    if converter is _identity:
+        return _identity
+    # Containers only recurse if nothing more specific was registered for them
+    if converter is _convert_fallback:
+        if issubclass(cls, dict):
+            return _serialize_dict
+        if issubclass(cls, (list, tuple)):
+            return _serialize_iterable
+    if converter is _convert_list:
+        return _serialize_iterable
+
+    def _handler(obj, vap_provider):
+        return pytron_serialize(converter(obj, vap_provider), vap_provider)
+
+    return _handler
+
+
+def register_serializer(cls, func=None):
+    """
+    Register a converter for instances of `cls` (and its subclasses).
+    Can be used as a decorator: @register_serializer(MyType)
+
+    The converter receives the object and may return anything pytron_serialize
+    understands; its result is serialized recursively.
+    """
+    if func is None:
+
+        def decorator(f):
+            register_serializer(cls, f)
+            return f
+
+        return decorator
+
+    if cls in _PRIMITIVE_TYPES:
+        raise TypeError(f"Cannot override serialization of builtin type {cls!r}")
+
+    def _converter(obj, vap_provider):
+        return func(obj)
+
+    _registry[cls] = _converter
+    if issubclass(cls, _JSON_NATIVE_TYPES):
+        _native_overrides.add(cls)
+    # Any cached resolution may now be stale (e.g. subclasses of `cls`)
+    _converter_cache.clear()
+    _dispatch_cache.clear()
+    return func
+
+
+def pytron_serialize(obj, vap_provider=None):
+    """
+    Helper to serialize objects to JSON-compatible primitives.
+    OPTIMIZED: Avoids double serialization (dumps/loads) by recursively
+    converting complex types into primitives, dispatching on the concrete type.
+    """
+    cls = type(obj)
+    if cls in _PRIMITIVE_TYPES:
+        return obj
+
+    handler = _dispatch_cache.get(cls)
+    if handler is None:
+        handler = _dispatch_cache[cls] = _resolve_handler(cls)
+    return handler(obj, vap_provider)
+
+
+def _has_loose_keys(obj):
+    """
+    True if a dict in `obj` has a key the C encoder would not write as str(key).
+    Type checks run through map() so lists of scalars are scanned at C speed.
+    """
+    if isinstance(obj, dict):
+        if not _PLAIN_KEY_TYPES.issuperset(map(type, obj)):
+            return True
+        values = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        values = obj
+    else:
+        return False
+    if _PRIMITIVE_TYPES.issuperset(map(type, values)):
+        return False
+    return any(map(_has_loose_keys, values))
+
+
+class _LooseKeys(Exception):
+    pass
+
+
+def _reserialize(obj, vap_provider, converted):
+    """
+    pytron_serialize() that reuses the values pytron_dumps() already converted
+    (id -> (obj, value)), so converters with side effects (VAP uploads) don't
+    run twice.
+    """
+    done = converted.get(id(obj))
+    if done is not None and done[0] is obj:
+        return _reserialize(done[1], vap_provider, converted)
+    cls = type(obj)
+    if cls in _PRIMITIVE_TYPES:
+        return obj
+    handler = _dispatch_cache.get(cls)
+    if handler is None:
+        handler = _dispatch_cache[cls] = _resolve_handler(cls)
+    if handler is _identity:
+        return obj
+    if handler is _serialize_dict:
+        return {
+            str(k): _reserialize(v, vap_provider, converted) for k, v in obj.items()
+        }
+    if handler is _serialize_iterable:
+        return [_reserialize(i, vap_provider, converted) for i in obj]
+    value = _get_converter(cls)(obj, vap_provider)
+    return _reserialize(value, vap_provider, converted)
+
+
+def pytron_dumps(obj, vap_provider=None):
+    """
+    Encodes `obj` straight to UTF-8 JSON bytes in a single traversal.
+    Follows the same conversion rules as pytron_serialize, but lets the C JSON
+    encoder walk the value and only calls back into Python for non-JSON types.
+    """
+    if _native_overrides:
+        return json.dumps(
+            pytron_serialize(obj, vap_provider), separators=(",", ":")
+        ).encode("utf-8")
+
+    # Keeps each converted object alive, so its id can't be reused meanwhile
+    converted = {}
+
+    def _default(o):
+        value = _get_converter(type(o))(o, vap_provider)
+        converted[id(o)] = (o, value)
+        if _has_loose_keys(value):
+            raise _LooseKeys
+        return value
+
+    if not _has_loose_keys(obj):
+        try:
+            encoder = json.JSONEncoder(default=_default, separators=(",", ":"))
+            return encoder.encode(obj).encode("utf-8")
+        except _LooseKeys:
+            pass
+    # Keys like True, None or tuples: stringify them as pytron_serialize does.
+    # Rare enough to pay for a second pass.
+    return json.dumps(
+        _reserialize(obj, vap_provider, converted), separators=(",", ":")
+    ).encode("utf-8")
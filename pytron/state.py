@@ -1,17 +1,151 @@
+import copy
+import time
 import threading
 
+# Default maximum number of JSON Patch operations before a full value is sent
+DEFAULT_PATCH_LIMIT = 64
+# Largest dict/list value (counted in items, nested ones included) kept for
+# diffing. Copying and diffing cost O(size) per update, so bigger values are
+# always sent whole
+DEFAULT_PATCH_MAX_ITEMS = 10000
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class _TooLarge(Exception):
+    pass
+
+
+def _snapshot(value, budget):
+    """
+    Copies the dicts and lists of `value` (other leaves are deep-copied,
+    scalars shared), spending one unit of budget[0] per item. Raises
+    _TooLarge once the budget runs out.
+    """
+    if isinstance(value, dict):
+        budget[0] -= len(value)
+        if budget[0] < 0:
+            raise _TooLarge
+        return {k: _snapshot(v, budget) for k, v in value.items()}
+    if isinstance(value, list):
+        budget[0] -= len(value)
+        if budget[0] < 0:
+            raise _TooLarge
+        return [_snapshot(v, budget) for v in value]
+    if isinstance(value, _SCALARS):
+        return value
+    return copy.deepcopy(value)
+
+
+def _escape_pointer(key):
+    # RFC 6901: '~' -> '~0', '/' -> '~1'
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _same(a, b):
+    return a is b or (type(a) is type(b) and a == b)
+
+
+def _diff(old, new, path, ops, limit):
+    """
+    Appends RFC 6902 operations turning `old` into `new` to `ops`.
+    Returns False as soon as more than `limit` operations would be needed.
+    """
+    if old is new:
+        return True
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape_pointer(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif not _diff(old[key], value, child, ops, limit):
+                return False
+            if len(ops) > limit:
+                return False
+    elif isinstance(old, list) and isinstance(new, list):
+        # Skip the unchanged head and tail so a single insert/delete stays one op
+        start, old_end, new_end = 0, len(old), len(new)
+        while start < old_end and start < new_end and _same(old[start], new[start]):
+            start += 1
+        while (
+            old_end > start
+            and new_end > start
+            and _same(old[old_end - 1], new[new_end - 1])
+        ):
+            old_end -= 1
+            new_end -= 1
+        common = min(old_end, new_end) - start
+        for offset in range(common):
+            index = start + offset
+            if not _diff(old[index], new[index], f"{path}/{index}", ops, limit):
+                return False
+        for index in range(start + common, new_end):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        for _ in range(start + common, old_end):
+            ops.append({"op": "remove", "path": f"{path}/{start + common}"})
+    elif type(old) is not type(new) or old != new:
+        ops.append({"op": "replace", "path": path, "value": new})
+    return len(ops) <= limit
+
 
 class ReactiveState:
     """
     A magic object that syncs its attributes to the frontend automatically.
+
+    By default every assignment is emitted immediately. With a flush interval
+    (see set_flush_interval) assignments are coalesced instead: once per tick,
+    each window receives the latest value of every changed key in a single eval.
+
+    Changes to dict/list values are sent as versioned JSON Patch operations
+    ('pytron:state-patch') when they take at most `patch_limit` operations;
+    the bridge applies them and re-dispatches 'pytron:state-update'. Diffing
+    keeps a copy of each emitted value and walks it on the next update, so
+    values over `patch_max_items` items are always sent whole instead.
     """
 
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        flush_interval=None,
+        patch_limit=DEFAULT_PATCH_LIMIT,
+        patch_max_items=DEFAULT_PATCH_MAX_ITEMS,
+    ):
         # Use super().__setattr__ to avoid triggering our own hook for internal vars
         super().__setattr__("_app", app)
         super().__setattr__("_data", {})
         # Re-entrant lock to allow nested access from same thread
         super().__setattr__("_lock", threading.RLock())
+        # Coalescing mode: pending key -> latest value, flushed off the lock
+        super().__setattr__("_flush_interval", flush_interval)
+        super().__setattr__("_pending", {})
+        super().__setattr__("_dirty", threading.Event())
+        super().__setattr__("_emit_lock", threading.Lock())
+        super().__setattr__("_flusher", None)
+        # Structural diffs: key -> (last emitted value, version)
+        super().__setattr__("_patch_limit", patch_limit)
+        super().__setattr__("_patch_max_items", patch_max_items)
+        super().__setattr__("_sent", {})
+
+    def set_patch_limit(self, limit, max_items=None):
+        """
+        Maximum JSON Patch size before a full value is sent. 0 disables patches.
+        max_items, if given, is the largest value (in items) still diffed.
+        """
+        super().__setattr__("_patch_limit", limit)
+        if max_items is not None:
+            super().__setattr__("_patch_max_items", max_items)
+
+    def set_flush_interval(self, seconds):
+        """
+        Enables coalesced updates, emitted at most once every `seconds`
+        (e.g. 1/60 for one update per frame). Pass None to emit immediately.
+        """
+        with self._lock:
+            super().__setattr__("_flush_interval", seconds)
+        if not seconds:
+            self.flush()
 
     def __setattr__(self, key, value):
         # Store the value and broadcast in a thread-safe manner to ensure order
@@ -21,12 +155,17 @@ class ReactiveState:
                 return
             self._data[key] = value
 
+            if self._flush_interval:
+                self._schedule({key: value})
+                return
+
             app_ref = getattr(self, "_app", None)
             if app_ref and app_ref.is_running:
-                # PERFORMANCE: Only send the delta (key/value)
+                # PERFORMANCE: Only send the delta (key/value, or a patch)
+                event, payload = self._event(key, value)
                 for window in list(app_ref.windows):
                     try:
-                        window.emit("pytron:state-update", {"key": key, "value": value})
+                        window.emit(event, payload)
                     except Exception as e:
                         # Silently ignore errors during shutdown
                         if app_ref.is_running:
@@ -57,20 +196,114 @@ class ReactiveState:
         if not isinstance(mapping, dict):
             raise TypeError("mapping must be a dict")
 
-        lock = getattr(self, "_lock", None)
-        if lock is not None:
-            with lock:
-                self._data.update(mapping)
-        else:
+        app_ref = getattr(self, "_app", None)
+        with self._lock:
             self._data.update(mapping)
+            if self._flush_interval:
+                self._schedule(mapping)
+                return
+            if not app_ref:
+                return
+            events = [self._event(key, value) for key, value in mapping.items()]
 
-        app_ref = getattr(self, "_app", None)
-        if app_ref:
-            for key, value in mapping.items():
-                for window in list(app_ref.windows):
-                    try:
-                        window.emit("pytron:state-update", {"key": key, "value": value})
-                    except Exception as e:
-                        print(
-                            f"[Pytron] Error emitting state update for key '{key}': {e}"
-                        )
+        for event, payload in events:
+            for window in list(app_ref.windows):
+                try:
+                    window.emit(event, payload)
+                except Exception as e:
+                    print(
+                        f"[Pytron] Error emitting state update for key '{payload['key']}': {e}"
+                    )
+
+    def snapshot(self, key):
+        """
+        Returns {"value", "version"} for `key` as last emitted to the frontend.
+        Used by the bridge to resync before applying patches.
+        """
+        with self._lock:
+            if key in self._sent:
+                value, version = self._sent[key]
+                if value is None:
+                    # No copy kept (patches off, or too large): it was sent whole
+                    value = self._data.get(key)
+                return {"value": value, "version": version}
+            return {"value": self._data.get(key), "version": 0}
+
+    def _event(self, key, value):
+        """
+        Builds the (event, payload) for emitting `value` under `key` and records
+        it as sent. Caller holds self._lock.
+        """
+        previous = self._sent.get(key)
+        version = previous[1] + 1 if previous else 1
+        container = isinstance(value, (dict, list))
+        sent = None
+        if container and self._patch_limit:
+            # A copy, so in-place edits to the live value still show up in the
+            # next diff (and snapshot() returns what the frontend actually has)
+            try:
+                sent = _snapshot(value, [self._patch_max_items])
+            except Exception:
+                pass
+        if container:
+            self._sent[key] = (sent, version)
+        else:
+            self._sent.pop(key, None)
+
+        if container and previous and previous[0] is not None and self._patch_limit:
+            ops = []
+            if _diff(previous[0], value, "", ops, self._patch_limit):
+                return "pytron:state-patch", {
+                    "key": key,
+                    "patch": ops,
+                    "base": previous[1],
+                    "version": version,
+                }
+
+        payload = {"key": key, "value": value}
+        if container:
+            payload["version"] = version
+        return "pytron:state-update", payload
+
+    # --- Coalescing ---
+
+    def _schedule(self, changes):
+        # Caller holds self._lock
+        self._pending.update(changes)
+        self._dirty.set()
+        if self._flusher is None:
+            flusher = threading.Thread(
+                target=self._flush_loop, daemon=True, name="PytronStateFlusher"
+            )
+            super().__setattr__("_flusher", flusher)
+            flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            self._dirty.wait()
+            time.sleep(self._flush_interval or 0)
+            self.flush()
+
+    def flush(self):
+        """Emits pending coalesced updates now: one eval per window."""
+        # _emit_lock keeps successive flushes in order without blocking writers
+        with self._emit_lock:
+            app_ref = getattr(self, "_app", None)
+            with self._lock:
+                if not self._pending:
+                    self._dirty.clear()
+                    return
+                changes = self._pending
+                super().__setattr__("_pending", {})
+                self._dirty.clear()
+                if not (app_ref and app_ref.is_running):
+                    return
+                events = [self._event(key, value) for key, value in changes.items()]
+
+            for window in list(app_ref.windows):
+                try:
+                    window.emit_many(events)
+                except Exception as e:
+                    # Silently ignore errors during shutdown
+                    if app_ref.is_running:
+                        print(f"[Pytron] Error emitting state updates: {e}")
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+
+# Event carrying chunks to the frontend: {id, chunk} | {id, done} | {id, error}
+STREAM_EVENT = "pytron:stream"
+# Chunks a stream may send before the frontend grants more. The bridges hand
+# credits back in halves of this window as the page consumes chunks.
+DEFAULT_STREAM_CREDITS = 16
+# Seconds a producer waits for credits before the stream is ended with an
+# error, so a page that stops reading without cancelling can't hold it forever
+DEFAULT_STREAM_IDLE_TIMEOUT = 60
+
+
+class StreamCredits:
+    """
+    Credit-based flow control for one streamed result. The producer spends a
+    credit per chunk and waits when it runs out; the frontend grants more
+    as it consumes, so a fast generator can't flood a slow page.
+    """
+
+    def __init__(
+        self, credits=DEFAULT_STREAM_CREDITS, idle_timeout=DEFAULT_STREAM_IDLE_TIMEOUT
+    ):
+        self._credits = credits
+        self.idle_timeout = idle_timeout
+        self._cond = threading.Condition()
+        self._waiters = []  # (loop, future) of async producers
+
+    def grant(self, count):
+        with self._cond:
+            self._credits += count
+        self.wake()
+
+    def wake(self):
+        """Wakes waiting producers (after a grant, or to let them see a cancel)."""
+        with self._cond:
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+    def take(self, token):
+        """
+        Spends a credit, blocking until one is granted. False once cancelled;
+        TimeoutError if none is granted within idle_timeout seconds.
+        """
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._credits > 0 or token.cancelled, self.idle_timeout
+            )
+            if token.cancelled:
+                return False
+            if not ready:
+                raise self._stalled()
+            self._credits -= 1
+            return True
+
+    async def take_async(self, token):
+        """Like take(), for async generators running on an event loop."""
+        while True:
+            with self._cond:
+                if token.cancelled:
+                    return False
+                if self._credits > 0:
+                    self._credits -= 1
+                    return True
+                future = asyncio.get_running_loop().create_future()
+                self._waiters.append((future.get_loop(), future))
+            try:
+                await asyncio.wait_for(future, self.idle_timeout)
+            except asyncio.TimeoutError:
+                raise self._stalled() from None
+
+    def _stalled(self):
+        return TimeoutError(f"Stream stalled: no credits for {self.idle_timeout}s")
@@ -0,0 +1,132 @@
+import time
+import threading
+from collections import OrderedDict
+
+# Default memory budget for generated assets (images, blobs, typed arrays)
+DEFAULT_VAP_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _nbytes(data):
+    nbytes = getattr(data, "nbytes", None)  # memoryview / buffer views
+    return nbytes if nbytes is not None else len(data)
+
+
+class VAPStore:
+    """
+    In-memory store behind the Virtual Asset Provider (pytron://<key>).
+    Bounded by a byte budget with least-recently-used eviction and an
+    optional per-entry time-to-live.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_VAP_MAX_BYTES, ttl=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (data, mime, size, expires_at)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def put(self, key, data, mime_type, ttl=None):
+        size = _nbytes(data)
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (data, mime_type, size, expires_at)
+            self._bytes += size
+            # Evict oldest first, but never the entry we were just asked to serve
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[2]
+                self.evictions += 1
+
+    def get(self, key):
+        """Returns (data, mime_type) or None. Marks the entry as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[3] is not None and entry[3] <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= entry[2]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def remove(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+            return entry is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class NativeVAPStore:
+    """
+    VAPStore interface over the store owned by the native engine.
+
+    Bytes are copied into Rust once on put(); the pytron:// protocol handler
+    then answers requests for them without taking the GIL, so asset loads
+    don't stall while Python is busy.
+    """
+
+    def __init__(self, native, max_bytes=DEFAULT_VAP_MAX_BYTES, ttl=None):
+        self.native = native
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        native.vap_configure(max_bytes, ttl)
+
+    def put(self, key, data, mime_type, ttl=None):
+        self.native.vap_put(key, data, mime_type, ttl)
+
+    def get(self, key):
+        """Returns (bytes, mime_type) or None. Marks the entry as recently used."""
+        return self.native.vap_get(key)
+
+    def remove(self, key):
+        return self.native.vap_remove(key)
+
+    def clear(self):
+        self.native.vap_clear()
+
+    def __contains__(self, key):
+        return self.native.vap_contains(key)
+
+    def __len__(self):
+        return self.native.vap_stats()["entries"]
+
+    def stats(self):
+        return self.native.vap_stats()
@@ -10,6 +10,7 @@ import mimetypes
 import logging
 import os
 import base64
+import uuid
 from collections import deque
 
 # Import Native Engine
@@ -25,12 +26,29 @@ except ImportError:
         pytron_native = None
 
 import urllib.parse
-from .serializer import pytron_serialize
-from .exceptions import ConfigError
+from .serializer import pytron_dumps
+from .vap import VAPStore, NativeVAPStore, DEFAULT_VAP_MAX_BYTES
+from .exceptions import ConfigError, CallCancelled, ArgumentError
+from .cancellation import CancelToken, _current_token
+from .eventloop import _current_window, start_event_loop
+from .streams import (
+    StreamCredits,
+    STREAM_EVENT,
+    DEFAULT_STREAM_CREDITS,
+    DEFAULT_STREAM_IDLE_TIMEOUT,
+)
+from .apputils.executors import STREAM_EXECUTOR
 
 IS_ANDROID = False
 
 
+def _accepts_cancel_token(func):
+    try:
+        return "cancel_token" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 # -------------------------------------------------------------------
 # Browser wrapper (Native PyO3 Version)
 # -------------------------------------------------------------------
@@ -61,9 +79,17 @@ class Webview:
             self.thread_pool = __import__(
                 "concurrent.futures"
             ).futures.ThreadPoolExecutor(max_workers=5)
+        # Per-function IPC latency histograms, shared by the app's windows
+        self.call_timings = self.app.call_timings if self.app else None
 
         self._bound_functions = {}
-        self._served_data = {}
+        self._dispatchers = {}
+        # seq -> CancelToken of calls still running
+        self._inflight = {}
+        # stream id -> StreamCredits of streamed results still producing
+        self._streams = {}
+        # Set by the app's window pool: close() hands the window back to it
+        self._recycle = None
 
         # 3. Native Engine Initialization
         # 3. Native Engine Initialization
@@ -120,6 +146,18 @@ class Webview:
             # Fallback if pyd wasn't updated yet? No, we will rebuild.
             raise ImportError("Native Engine signature mismatch. Please rebuild.")
 
+        # PERFORMANCE: Bounded LRU store so generated assets can't grow without limit.
+        # Kept in the native engine when it has one, so serving needs no GIL.
+        vap_max_bytes = config.get("vap_max_bytes", DEFAULT_VAP_MAX_BYTES)
+        if hasattr(self.native, "vap_put"):
+            self._served_data = NativeVAPStore(
+                self.native, max_bytes=vap_max_bytes, ttl=config.get("vap_ttl")
+            )
+        else:
+            self._served_data = VAPStore(
+                max_bytes=vap_max_bytes, ttl=config.get("vap_ttl")
+            )
+
         # 4. Bindings
         self._init_bindings()
 
@@ -156,15 +194,11 @@ class Webview:
         if not config.get("start_hidden", False):
             self.show()
 
-        # 7. Event Loop (Asyncio)
-        self.loop = asyncio.new_event_loop()
-
-        def start_loop():
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_forever()
-
-        t = threading.Thread(target=start_loop, daemon=True)
-        t.start()
+        # 7. Event Loop (Asyncio): the app-wide one unless disabled
+        if self.app and self.app.shared_loop:
+            self.loop = self.app.loop
+        else:
+            self.loop = start_event_loop(f"Pytron-Loop-{self.id}")
 
         # 8. JS Init (Legacy shim)
         init_js = f"""
@@ -211,8 +245,17 @@ class Webview:
         self.bind("pytron_maximize", self.maximize, run_in_thread=False)
         self.bind("pytron_center", self.center, run_in_thread=False)
         self.bind("pytron_sync_state", self._sync_state, run_in_thread=False)
+        self.bind("pytron_state_get", self._state_get, run_in_thread=False)
         self.bind("__pytron_vap_get", self._get_binary_asset, run_in_thread=True)
-        self.bind("pytron_serve_asset", self._serve_asset_callback, run_in_thread=False)
+        self.bind("__pytron_cancel", self._cancel_calls, run_in_thread=False)
+        self.bind(
+            "__pytron_stream_credit", self._grant_stream_credit, run_in_thread=False
+        )
+        # The native VAP store answers the protocol handler without calling back
+        if not isinstance(self._served_data, NativeVAPStore):
+            self.bind(
+                "pytron_serve_asset", self._serve_asset_callback, run_in_thread=False
+            )
         self.bind(
             "pytron_set_slim_titlebar", self.set_slim_titlebar, run_in_thread=False
         )
@@ -235,9 +278,13 @@ class Webview:
         # Avoid logging for frequent state/asset syncs
         self._spammy_methods = {
             "pytron_sync_state",
+            "pytron_state_get",
             "pytron_serve_asset",
             "__pytron_vap_get",
         }
+        # Chrome has no native engine: its batches arrive via _handle_ipc_batch
+        if self.native is not None:
+            self.native.bind("__pytron_batch", self._batch_callback)
         self.bind("close", self.close, run_in_thread=False)
         self.bind("hide", self.hide, run_in_thread=False)
         self.bind("show", self.show, run_in_thread=False)
@@ -258,10 +305,7 @@ class Webview:
 
     def _serve_asset_callback(self, key):
         """Called by Native Engine Protocol Handler to fetch VAP assets."""
-        if key in self._served_data:
-            data, mime = self._served_data[key]
-            return (data, mime)
-        return None
+        return self._served_data.get(key)
 
     def set_slim_titlebar(self, enable=True):
         if hasattr(self.native, "set_decorations"):
@@ -275,8 +319,19 @@ class Webview:
         return getattr(self, "_hwnd_cache", 0)
 
     # ... Bindings Logic ... (omitted for brevity, assume existing)
-    def bind(self, name, python_func, run_in_thread=True, secure=False):
-        is_async = inspect.iscoroutinefunction(python_func)
+    def bind(
+        self,
+        name,
+        python_func,
+        run_in_thread=True,
+        secure=False,
+        gate=None,
+        cache=None,
+        validator=None,
+    ):
+        _dispatch = self._make_dispatcher(
+            name, python_func, run_in_thread, gate, cache, validator
+        )
 
         # The Wrapper that Rust calls: (seq, args_json, ptr)
         def _native_callback(seq, req, arg_ptr):
@@ -284,51 +339,428 @@ class Webview:
                 args = json.loads(req) if req else []
             except Exception:
                 args = []
+            timer = self._call_timer(name, args)
+
+            # Response Helper: encodes straight to UTF-8 JSON bytes (single pass)
+            def _respond(status, result):
+                # Fire-and-forget messages (e.g. cancels) carry no seq to answer
+                if not seq:
+                    return
+                vap = self.serve_data if status == 0 else None
+                encoding = time.perf_counter()
+                status, payload = self._encode_reply(name, status, result, vap)
+                sending = time.perf_counter()
+                self.native.return_result(seq, status, payload)
+                if timer is not None:
+                    timer.record(
+                        status,
+                        result,
+                        sending - encoding,
+                        time.perf_counter() - sending,
+                    )
+
+            _dispatch(args, _respond, seq, timer)
+
+        self._dispatchers[name] = _dispatch
+        # Register with Rust
+        self.native.bind(name, _native_callback)
+
+    def _encode_reply(self, name, status, result, vap=None):
+        """
+        Encodes the reply to a call. A result that can't be encoded (circular
+        reference, failing converter) is answered as an error instead, so the
+        frontend's promise still settles.
+        """
+        try:
+            return status, pytron_dumps(result, vap)
+        except Exception as e:
+            self.logger.error(f"Could not encode result of {name}: {e}")
+            return 1, pytron_dumps(f"Could not encode result: {e}", None)
 
+    def _encode_batch(self, entries, vap=None):
+        """
+        Encodes the (seq, method, status, result) entries of a batch as a reply
+        of [seq, status, result] triples. Each result is encoded on its own, so
+        one that can't be encoded only turns its own entry into an error.
+        """
+        parts = []
+        for seq, method, status, result in entries:
+            status, payload = self._encode_reply(method, status, result, vap)
+            parts.append(b"[%s,%d,%s]" % (pytron_dumps(seq, None), status, payload))
+        return b"[" + b",".join(parts) + b"]"
+
+    def _call_timer(self, name, args):
+        """CallTimer for one incoming call, or None when timings are off."""
+        if self.call_timings is None or name.startswith("inspector_"):
+            return None
+        return self.call_timings.timer(name, args)
+
+    def _record_batch(self, timers, entries, serialize, transport):
+        """Records batched calls, splitting the shared reply's cost evenly."""
+        share = len(entries) or 1
+        for timer, (_, _, status, result) in zip(timers, entries):
+            if timer is not None:
+                timer.record(status, result, serialize / share, transport / share)
+
+    def _make_dispatcher(
+        self,
+        name,
+        python_func,
+        run_in_thread=True,
+        gate=None,
+        cache=None,
+        validator=None,
+    ):
+        """
+        Builds dispatch(args, respond, seq=None, timer=None) for a bound function. Async
+        functions run on self.loop (their CallGate only limiting how many), sync
+        ones through their CallGate if they have one, else on the thread pool (or
+        inline when run_in_thread=False); respond(status, result) is invoked
+        exactly once.
+
+        Calls with a seq can be cancelled by the frontend: async handlers get
+        their task cancelled, sync ones see it on their CancelToken (passed as
+        `cancel_token` if they accept it, else via pytron.current_token()).
+        With a CallCache, identical calls share one run (and its kept result).
+        A CallTimer, if given, is stamped when the handler starts and stops.
+        A validator (see compile_validator) checks and coerces the arguments
+        first, so the cache keys and handler see typed values.
+        Generator and async generator functions stream their chunks instead
+        (see _start_stream); gates and caches don't apply to them.
+        """
+        is_async = inspect.iscoroutinefunction(python_func)
+        streaming = inspect.isgeneratorfunction(
+            python_func
+        ) or inspect.isasyncgenfunction(python_func)
+        if streaming:
+            gate = cache = None
+        wants_token = _accepts_cancel_token(python_func)
+        if gate is not None and gate.processes:
+            wants_token = False
+
+        def _dispatch(args, respond, seq=None, timer=None):
             # Internal logging
             if not name.startswith("inspector_") and name not in self._spammy_methods:
                 self.logger.debug(f"IPC Call: {name}({args})")
 
-            # Result serializer
-            def _serialize_result(res):
-                return pytron_serialize(res, vap_provider=self.serve_data)
-
-            # Response Helper
-            def _respond(status, result):
-                res_str = json.dumps(result)
-                self.native.return_result(seq, status, res_str)
+            token = CancelToken()
+            kwargs = {"cancel_token": token} if wants_token else {}
+            answered = []
+
+            def finish(status, result):
+                # A cancelled task may still return: answer only once
+                if answered:
+                    return
+                answered.append(status)
+                if timer is not None:
+                    timer.stop()
+                if seq:
+                    self._inflight.pop(seq, None)
+                try:
+                    respond(status, result)
+                except Exception as e:
+                    # Already marked answered: settle the call here, not in the
+                    # runner, whose finish(1, ...) would now be a no-op
+                    self.logger.error(f"Error answering {name}: {e}")
+                    if status == 0:
+                        respond(1, str(e))
+
+            def _cancelled():
+                self.logger.debug(f"IPC Call cancelled: {name}")
+                finish(1, "Cancelled")
+
+            if seq:
+                self._inflight[seq] = token
+
+            def _call():
+                token.raise_if_cancelled()
+                if timer is not None:
+                    timer.start()
+                scope = _current_token.set(token)
+                window = _current_window.set(self)
+                try:
+                    return python_func(*args, **kwargs)
+                finally:
+                    _current_window.reset(window)
+                    _current_token.reset(scope)
 
             # Runner Logic
             def _runner():
                 try:
-                    res = python_func(*args)
-                    _respond(0, _serialize_result(res))
+                    res = _call()
+                    finish(0, res)
+                except CallCancelled:
+                    _cancelled()
                 except Exception as e:
                     self.logger.error(f"Error in {name}: {e}")
-                    _respond(1, str(e))
+                    finish(1, str(e))
 
             async def _async_runner():
+                if timer is not None:
+                    timer.start()
+                # Each task has its own context: no reset needed
+                _current_token.set(token)
+                _current_window.set(self)
+                try:
+                    res = await python_func(*args, **kwargs)
+                    finish(0, res)
+                except CallCancelled:
+                    _cancelled()
+                except Exception as e:
+                    self.logger.error(f"Error in {name}: {e}")
+                    finish(1, str(e))
+
+            def _gate_done(future):
                 try:
-                    res = await python_func(*args)
-                    _respond(0, _serialize_result(res))
+                    finish(0, future.result())
+                except CallCancelled:
+                    _cancelled()
                 except Exception as e:
                     self.logger.error(f"Error in {name}: {e}")
-                    _respond(1, str(e))
+                    finish(1, str(e))
 
-            if is_async:
-                asyncio.run_coroutine_threadsafe(_async_runner(), self.loop)
+            if streaming:
+                if timer is not None:
+                    timer.start()
+                try:
+                    generator = python_func(*args, **kwargs)
+                except Exception as e:
+                    self.logger.error(f"Error in {name}: {e}")
+                    finish(1, str(e))
+                    return
+                self._start_stream(name, generator, token, finish)
+            elif is_async:
+
+                def _launch():
+                    coro = _async_runner()
+                    future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+                    # Cancelling the concurrent future cancels the task
+                    future.add_done_callback(lambda f: f.cancelled() and _cancelled())
+                    if gate is not None:
+                        future.add_done_callback(
+                            lambda f: gate.release(answered != [0])
+                        )
+                    token.on_cancel(future.cancel)
+
+                if gate is None:
+                    _launch()
+                elif not gate.admit(_launch):
+                    self.logger.warning(f"Rejected call to {name}: queue is full")
+                    finish(1, f"'{name}' is busy, try again later.")
+            elif gate is not None:
+                fn, fn_args = (python_func, args) if gate.processes else (_call, ())
+                if not gate.submit(fn, fn_args, _gate_done):
+                    self.logger.warning(f"Rejected call to {name}: queue is full")
+                    finish(1, f"'{name}' is busy, try again later.")
             else:
                 if run_in_thread:
                     self.thread_pool.submit(_runner)
                 else:
                     _runner()
 
-        # Register with Rust
-        self.native.bind(name, _native_callback)
+        if cache is not None:
+            _run = _dispatch
+
+            # A shared run answers several callers, so no single caller may cancel it
+            def _dispatch(args, respond, seq=None, timer=None):
+                if timer is not None:
+                    answer = respond
+
+                    # Callers that joined a run or hit the cache waited until
+                    # now; stop here so encoding their reply isn't counted too
+                    def respond(status, result):
+                        timer.stop()
+                        answer(status, result)
+
+                cache.call(args, respond, lambda done: _run(args, done, timer=timer))
+
+        if validator is not None:
+            _checked = _dispatch
+
+            def _dispatch(args, respond, seq=None, timer=None):
+                try:
+                    args = validator(args)
+                except ArgumentError as e:
+                    self.logger.warning(str(e))
+                    respond(1, str(e))
+                    return
+                _checked(args, respond, seq, timer)
+
+        return _dispatch
+
+    def _start_stream(self, name, generator, token, finish):
+        """
+        PERFORMANCE: Answers the call at once with a stream descriptor (an async
+        iterator in the page), then sends each chunk as it is produced. Only as
+        many chunks as the page has granted credits for are in flight, and the
+        page cancels the stream (like any call) when it stops iterating; one
+        that grants nothing for DEFAULT_STREAM_IDLE_TIMEOUT seconds gets an error.
+        Sync generators run on the app's "stream" executor, not the call pool.
+        """
+        stream_id = uuid.uuid4().hex[:16]
+        credits = StreamCredits(DEFAULT_STREAM_CREDITS, DEFAULT_STREAM_IDLE_TIMEOUT)
+        token.on_cancel(credits.wake)
+        self._streams[stream_id] = credits
+        self._inflight[stream_id] = token
+        finish(0, {"__pytron_type__": "stream", "id": stream_id})
+
+        def send(chunk):
+            self._emit_json(
+                STREAM_EVENT,
+                pytron_dumps({"id": stream_id, "chunk": chunk}, self.serve_data),
+            )
+
+        def close(error):
+            self._streams.pop(stream_id, None)
+            self._inflight.pop(stream_id, None)
+            if token.cancelled:
+                return
+            if error is None:
+                end = {"id": stream_id, "done": True}
+            else:
+                end = {"id": stream_id, "error": error}
+            self._emit_json(STREAM_EVENT, pytron_dumps(end, None))
+
+        def _pump():
+            scope = _current_token.set(token)
+            window = _current_window.set(self)
+            error = None
+            try:
+                # Ending needs no credit, so the next chunk is produced first
+                for chunk in generator:
+                    if not credits.take(token):
+                        break
+                    send(chunk)
+            except CallCancelled:
+                pass
+            except Exception as e:
+                self.logger.error(f"Error in stream {name}: {e}")
+                error = str(e)
+            finally:
+                generator.close()
+                _current_window.reset(window)
+                _current_token.reset(scope)
+                close(error)
+
+        async def _async_pump():
+            _current_token.set(token)
+            _current_window.set(self)
+            error = None
+            try:
+                async for chunk in generator:
+                    if not await credits.take_async(token):
+                        break
+                    send(chunk)
+            except (CallCancelled, asyncio.CancelledError):
+                pass
+            except Exception as e:
+                self.logger.error(f"Error in stream {name}: {e}")
+                error = str(e)
+            finally:
+                await generator.aclose()
+                close(error)
+
+        if inspect.isasyncgen(generator):
+            future = asyncio.run_coroutine_threadsafe(_async_pump(), self.loop)
+            token.on_cancel(future.cancel)
+        else:
+            self._stream_executor().submit(_pump)
+
+    def _stream_executor(self):
+        app = getattr(self, "app", None)
+        if app is None:
+            return self.thread_pool
+        return app.executors.get(STREAM_EXECUTOR)
+
+    def _grant_stream_credit(self, stream_id, count):
+        """Called by the page as it consumes chunks of a streamed result."""
+        credits = self._streams.get(stream_id)
+        if credits is not None:
+            credits.grant(int(count))
+
+    def _cancel_calls(self, seqs=None):
+        """
+        Cancels in-flight calls the frontend abandoned (AbortSignal or page
+        unload). With no seqs, cancels every call still running.
+        """
+        if seqs is None:
+            seqs = list(self._inflight)
+        for seq in seqs:
+            token = self._inflight.get(seq)
+            if token is not None:
+                token.cancel()
+
+    def _call_starter(self, method, args, seq=None, timer=None):
+        """Returns start(respond) for one call of a batch."""
+        dispatch = self._dispatchers.get(method)
+        if dispatch is None:
+            return lambda respond: respond(1, f"Method '{method}' not found.")
+        return lambda respond: dispatch(args, respond, seq, timer)
+
+    def _run_batch(self, calls, finish):
+        """
+        Starts every (seq, method, start) call at once; each start(respond) must
+        call respond(status, result) exactly once. finish() receives the list of
+        (seq, method, status, result) entries after the last call has answered.
+        """
+        if not calls:
+            finish([])
+            return
+        entries = [None] * len(calls)
+        remaining = [len(calls)]
+        lock = threading.Lock()
+
+        def _make_respond(index, seq, method):
+            def _respond(status, result):
+                # A retried answer must not count the call twice
+                if entries[index] is not None:
+                    return
+                entries[index] = (seq, method, status, result)
+                with lock:
+                    remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done:
+                    finish(entries)
+
+            return _respond
+
+        for index, (seq, method, start) in enumerate(calls):
+            start(_make_respond(index, seq, method))
+
+    def _batch_callback(self, seq, req, arg_ptr):
+        """
+        PERFORMANCE: Calls made by the frontend in the same microtask arrive as
+        one message of [seq, method, args] triples and are answered in one frame.
+        """
+        try:
+            calls = json.loads(req) if req else []
+        except Exception:
+            calls = []
+
+        timers = [self._call_timer(method, args) for _, method, args in calls]
+
+        def _finish(entries):
+            encoding = time.perf_counter()
+            payload = self._encode_batch(entries, self.serve_data)
+            sending = time.perf_counter()
+            self.native.return_result(seq, 0, payload)
+            self._record_batch(
+                timers, entries, sending - encoding, time.perf_counter() - sending
+            )
+
+        self._run_batch(
+            [
+                (call_seq, method, self._call_starter(method, args, call_seq, timer))
+                for (call_seq, method, args), timer in zip(calls, timers)
+            ],
+            _finish,
+        )
 
     # --- Core API ---
 
     def navigate(self, url):
+        # Nothing on the old page is waiting for these any more
+        self._cancel_calls()
         target = self._normalize_to_pytron(url)
         self.config["url"] = target
         self.native.navigate(target)
@@ -338,7 +770,7 @@ class Webview:
 
     def _normalize_to_pytron(self, url):
         """Ensures local file paths are converted to pytron://app/ URLs relative to root_path."""
-        if url.startswith(("http:", "https:", "pytron:")):
+        if url.startswith(("http:", "https:", "pytron:", "about:")):
             return url
 
         path_obj = pathlib.Path(url)
@@ -363,15 +795,29 @@ class Webview:
             )
             return str(path_obj)
 
-    def serve_data(self, key, data, mime_type):
+    def serve_data(self, key, data, mime_type, ttl=None):
         """
         Callback for serializing binary data used by plugins/VAP.
         Stores the data in memory to be served via __pytron_vap_get.
+        Least recently used entries are evicted once `vap_max_bytes` is exceeded.
         """
-        self._served_data[key] = (data, mime_type)
+        self._served_data.put(key, data, mime_type, ttl=ttl)
         # Use HTTPS scheme for Windows/Native compatibility
         return f"https://pytron.localhost/{key}"
 
+    def unserve_data(self, key):
+        self._served_data.remove(key)
+
+    def vap_stats(self):
+        """Returns hit/miss/eviction counters and memory usage of the VAP store."""
+        return self._served_data.stats()
+
+    def ipc_stats(self):
+        """Returns batch sizes of the scripts the native event loop evaluated."""
+        if hasattr(self.native, "script_stats"):
+            return {"scripts": self.native.script_stats()}
+        return None
+
     def _apply_ui_settings(self):
         """Applies UI configuration via JavaScript injection."""
         js = []
@@ -410,7 +856,12 @@ class Webview:
         """
         Closes the window.
         If 'close_to_tray' config is True and force is False, it just hides the window.
+        Pooled windows are handed back to the app's window pool instead.
         """
+        if not force and self._recycle:
+            self._recycle(self)
+            return
+
         if not force and self.config.get("close_to_tray", False):
             self.hide()
             # If we hide, we might want to notify or ensure tray exists?
@@ -424,12 +875,36 @@ class Webview:
         Emits a custom event to the frontend.
         Frontend can listen via window.addEventListener(event, ...)
         """
-        import json
-
-        payload = json.dumps(data)
+        self._emit_json(event, json.dumps(data))
+
+    def _emit_json(self, event, payload):
+        """Dispatches an event whose detail is already JSON (str or UTF-8 bytes)."""
+        # PERFORMANCE: The native engine queues events and dispatches everything
+        # that arrives within one event-loop iteration as a single script.
+        if hasattr(self.native, "emit"):
+            self.native.emit(event, payload)
+            return
+        if isinstance(payload, bytes):
+            payload = payload.decode("utf-8")
         js = f"window.dispatchEvent(new CustomEvent('{event}', {{ detail: {payload} }}));"
         self.eval(js)
 
+    def emit_many(self, events):
+        """
+        Emits several (event, data) pairs to the frontend with a single eval.
+        """
+        if not events:
+            return
+        if hasattr(self.native, "emit"):
+            for event, data in events:
+                self.native.emit(event, json.dumps(data))
+            return
+        js = "".join(
+            f"window.dispatchEvent(new CustomEvent('{event}', {{ detail: {json.dumps(data)} }}));"
+            for event, data in events
+        )
+        self.eval(js)
+
     # --- Asset Serving (VAP) ---
     # serve_data is defined above to return the URL.
 
@@ -438,6 +913,11 @@ class Webview:
             return self.app.state.to_dict()
         return {}
 
+    def _state_get(self, key):
+        if self.app:
+            return self.app.state.snapshot(key)
+        return {"value": None, "version": 0}
+
     # --- Path Normalizer ---
     def normalize_path(self, config):
         raw_url = config.get("url")
@@ -657,7 +1137,9 @@ class Webview:
 
     def _on_close_requested(self):
         """Called by Native Engine when X is clicked and prevent_close is True."""
-        if self.config.get("close_to_tray", False):
+        if self._recycle:
+            self._recycle(self)
+        elif self.config.get("close_to_tray", False):
             self.hide()
         else:
             # Should not happen if prevent_close logic is consistent, but fallback
@@ -669,10 +1151,12 @@ class Webview:
         Returns {'raw': <binary_string>, 'mime': <mime_type>} or None.
         """
         # 1. Check Memory Cache (_served_data)
-        if key in self._served_data:
-            data, mime = self._served_data[key]
+        asset = self._served_data.get(key)
+        if asset is not None:
+            data, mime = asset
             # Convert bytes to "latin-1" string for JS binary interop
-            raw = data.decode("latin-1")
+            # (typed arrays are stored as memoryviews over their buffer)
+            raw = bytes(data).decode("latin-1")
             return {"raw": raw, "mime": mime}
 
         # 2. Check File System (if key is a relative path)
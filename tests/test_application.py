@@ -99,3 +99,78 @@ def test_on_exit_hook(mock_app_env):
 
     # 1 default (thread pool) + 1 new
     assert len(app._on_exit_callbacks) == 2
+
+
+def test_app_expose_with_limits(mock_app_env):
+    app = App()
+
+    @app.expose(executor="export", max_concurrency=2, max_queue=5)
+    def export_pdf():
+        return "ok"
+
+    gate = app._exposed_functions["export_pdf"]["gate"]
+    assert (gate.max_concurrency, gate.max_queue) == (2, 5)
+    assert gate.executor is not app.thread_pool
+    assert "export_pdf" in app.executors.stats()["functions"]
+    # Plain exposes keep the shared pool
+    app.expose(lambda: 1, name="plain")
+    assert app._exposed_functions["plain"]["gate"] is None
+    app.executors.shutdown()
+
+
+def test_app_expose_with_cache(mock_app_env):
+    app = App()
+
+    @app.expose(cache_ttl=30)
+    def get_config():
+        return {}
+
+    cache = app._exposed_functions["get_config"]["cache"]
+    assert cache.memoize and cache.ttl == 30
+    cache.call([], lambda *a: None, lambda done: done(0, {}))
+    assert app.cache_stats()["get_config"]["entries"] == 1
+    app.invalidate_cache("get_config")
+    assert app.cache_stats()["get_config"]["entries"] == 0
+    app.executors.shutdown()
+
+
+def test_app_call_stats_feed_inspector(mock_app_env):
+    app = App()
+    app.call_timings.record(
+        "hello",
+        ["x" * 5],
+        {"queue": 0.0, "execute": 0.3, "serialize": 0.0, "transport": 0.0},
+    )
+    assert app.call_stats("hello")["hello"]["calls"] == 1
+    assert app.slow_calls()[0]["args"] == ["str[5]"]
+    # Every call shows up in the inspector's IPC log, as shapes only
+    assert app.inspector.ipc_history[-1]["args"] == ["str[5]"]
+    app.executors.shutdown()
+
+
+def test_app_loop_is_shared_and_lazy(mock_app_env):
+    import asyncio
+
+    app = App()
+    assert app.shared_loop and app._loop is None
+    loop = app.loop
+    assert app.loop is loop and loop.is_running()
+    assert asyncio.run_coroutine_threadsafe(asyncio.sleep(0, "ok"), loop).result(2)
+    loop.call_soon_threadsafe(loop.stop)
+    app.executors.shutdown()
+
+
+def test_app_expose_compiles_validator(mock_app_env):
+    app = App()
+
+    @app.expose
+    def greet(name: str):
+        return f"hi {name}"
+
+    @app.expose(validate=False)
+    def raw(name: str):
+        return name
+
+    assert app._exposed_functions["greet"]["validator"](["bob"]) == ["bob"]
+    assert app._exposed_functions["raw"]["validator"] is None
+    app.executors.shutdown()
@@ -0,0 +1,72 @@
+import threading
+import time
+from pytron.apputils.callcache import CallCache
+
+
+def _collect():
+    answers = []
+    return answers, lambda status, result: answers.append((status, result))
+
+
+def test_identical_calls_share_one_run():
+    cache = CallCache("get_config")
+    starts = []
+    answers, respond = _collect()
+
+    for _ in range(3):
+        cache.call(["a"], respond, starts.append)
+    cache.call(["b"], respond, starts.append)
+    assert len(starts) == 2
+
+    starts[0](0, {"theme": "dark"})
+    assert answers == [(0, {"theme": "dark"})] * 3
+    # Single-flight only: a finished call isn't kept
+    cache.call(["a"], respond, starts.append)
+    assert len(starts) == 3
+
+    stats = cache.stats()
+    assert (stats["shared"], stats["misses"], stats["hits"]) == (2, 3, 0)
+    assert stats["in_flight"] == 2
+
+
+def test_memoizes_with_lru_and_ttl():
+    cache = CallCache("list_contents", ttl=0.05, max_entries=2)
+    starts = []
+    answers, respond = _collect()
+
+    for path in ("/a", "/b", "/c"):
+        cache.call([path], respond, lambda done, path=path: done(0, path.upper()))
+    assert cache.stats()["evictions"] == 1
+
+    cache.call(["/c"], respond, starts.append)
+    assert starts == [] and answers[-1] == (0, "/C")
+    cache.call(["/a"], respond, starts.append)
+    assert len(starts) == 1
+
+    time.sleep(0.06)
+    cache.call(["/c"], respond, starts.append)
+    assert len(starts) == 2
+    assert cache.stats()["expirations"] == 1
+
+
+def test_errors_and_invalidation():
+    cache = CallCache("load", max_entries=8)
+    answers, respond = _collect()
+
+    cache.call([1], respond, lambda done: done(1, "boom"))
+    cache.call([1], respond, lambda done: done(0, "ok"))
+    assert answers == [(1, "boom"), (0, "ok")]
+
+    # Results of a run that started before invalidate() aren't kept
+    pending = []
+    cache.call([2], respond, pending.append)
+    cache.invalidate()
+    pending[0](0, "stale")
+    runs = []
+    cache.call([2], respond, lambda done: (runs.append(1), done(0, "fresh")))
+    cache.call([1], respond, lambda done: (runs.append(1), done(0, "ok")))
+    assert len(runs) == 2
+
+    cache.invalidate(1)
+    cache.call([2], respond, lambda done: runs.append(1))
+    assert len(runs) == 2
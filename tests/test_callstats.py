@@ -0,0 +1,52 @@
+import logging
+from pytron.apputils.callstats import CallStats, LatencyHistogram, args_shape
+
+
+def test_histogram_percentiles_stay_within_bucket_error():
+    hist = LatencyHistogram()
+    for micros in range(1, 10001):
+        hist.record(micros / 1_000_000)
+
+    assert hist.count == 10000
+    for q, expected in ((50, 0.005), (90, 0.009), (99, 0.0099)):
+        assert abs(hist.percentile(q) - expected) / expected < 0.02
+    assert hist.percentile(100) == hist.max == 0.01
+    summary = hist.summary()
+    assert summary["min_ms"] == 0.001
+    assert abs(summary["mean_ms"] - 5.0) < 0.01
+    assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+
+def test_args_shape_hides_values():
+    shape = args_shape(["secret", {"user": "bob", "ids": [1, 2, 3]}, 4.5, None])
+    assert shape == ["str[6]", {"user": "str[3]", "ids": "list[3]"}, "float", "None"]
+    assert args_shape(b"\x00" * 10) == "bytes[10]"
+
+
+def test_records_phases_and_slow_calls(caplog):
+    seen = []
+    stats = CallStats(
+        slow_call_ms=50,
+        observer=lambda name, args, **info: seen.append((name, args, info)),
+    )
+    fast = {"queue": 0.001, "execute": 0.002, "serialize": 0.0, "transport": 0.0}
+    slow = {"queue": 0.0, "execute": 0.2, "serialize": 0.001, "transport": 0.0}
+
+    stats.record("search", ["abc"], fast)
+    with caplog.at_level(logging.WARNING):
+        stats.record("search", ["abcdef"], slow, error="boom")
+
+    result = stats.stats("search")["search"]
+    assert (result["calls"], result["errors"]) == (2, 1)
+    assert result["execute"]["max_ms"] == 200.0
+    assert result["queue"]["count"] == 2
+    assert stats.stats("missing") == {}
+
+    [entry] = stats.slow_calls()
+    assert entry["function"] == "search" and entry["args"] == ["str[6]"]
+    assert entry["execute_ms"] == 200.0 and entry["error"] is True
+    assert "Slow IPC call: search" in caplog.text
+    assert seen[1] == ("search", ["str[6]"], {"error": "boom", "duration": 0.201})
+
+    stats.reset()
+    assert stats.stats() == {} and stats.slow_calls() == []
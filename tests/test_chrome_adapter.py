@@ -0,0 +1,234 @@
+import sys
+import json
+import array
+import socket
+import struct
+import threading
+import time
+from unittest.mock import MagicMock
+import pytest
+from pytron.engines.chrome.adapter import (
+    ChromeAdapter,
+    ChromeIPCServer,
+    BINARY_FRAME_FLAG,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Uses the Unix socket fallback"
+)
+
+
+def _read_exact(sock, n):
+    data = b""
+    while len(data) < n:
+        data += sock.recv(n - len(data))
+    return data
+
+
+def _read_frame(sock):
+    header = sock.recv(4)
+    (length,) = struct.unpack("<I", header)
+    return _read_exact(sock, length)
+
+
+def _read_binary_frame(sock):
+    (word,) = struct.unpack("<I", _read_exact(sock, 4))
+    assert word & BINARY_FRAME_FLAG
+    body = _read_exact(sock, word & ~BINARY_FRAME_FLAG)
+    (head_len,) = struct.unpack_from("<I", body)
+    return json.loads(body[4 : 4 + head_len]), body[4 + head_len :]
+
+
+def _connect(ipc):
+    ipc._native = None
+    ipc.is_windows = False
+    ipc.conn, peer = socket.socketpair()
+    ipc.connected = True
+    return ipc, peer
+
+
+def _hold_writer(ipc):
+    # Frames pile up in the queue until _release_writer()
+    ipc._writer = "held"
+
+
+def _release_writer(ipc):
+    ipc._writer = None
+    ipc._ensure_writer()
+
+
+@pytest.fixture
+def server():
+    ipc, peer = _connect(ChromeIPCServer())
+    yield ipc, peer
+    ipc.conn.close()
+    peer.close()
+
+
+def test_send_dict(server):
+    ipc, peer = server
+    ipc.send({"action": "show"})
+    assert json.loads(_read_frame(peer)) == {"action": "show"}
+
+
+def test_send_preencoded_bytes(server):
+    ipc, peer = server
+    body = b'{"action":"reply","id":"a1","status":0,"result":[1,2]}'
+    ipc.send(body)
+    assert _read_frame(peer) == body
+
+
+def test_send_binary_raw_bytes(server):
+    ipc, peer = server
+    blob = bytes(range(256)) * 4096
+    # Larger than the socket buffer: send from another thread while we read
+    sender = threading.Thread(
+        target=ipc.send_binary, args=({"action": "serve_data", "key": "k"}, blob)
+    )
+    sender.start()
+    header, data = _read_binary_frame(peer)
+    sender.join(2)
+    assert header == {"action": "serve_data", "key": "k"}
+    assert data == blob
+
+    # JSON frames still follow as usual
+    ipc.send({"action": "show"})
+    assert json.loads(_read_frame(peer)) == {"action": "show"}
+
+
+def test_send_binary_typed_buffer(server):
+    ipc, peer = server
+    values = array.array("d", [1.5, -2.0])
+    ipc.send_binary({"action": "serve_data"}, memoryview(values))
+    assert _read_binary_frame(peer)[1] == values.tobytes()
+
+
+def test_adapter_queues_binary_frames_until_ready():
+    adapter = ChromeAdapter("electron")
+    adapter.send({"action": "init"})
+    adapter.send_binary({"action": "serve_data"}, b"raw")
+
+    adapter.ipc = MagicMock()
+    adapter._flush_queue()
+    adapter.ipc.send.assert_called_once_with({"action": "init"})
+    adapter.ipc.send_binary.assert_called_once_with({"action": "serve_data"}, b"raw")
+
+
+def test_queued_frames_coalesce_into_one_write(server):
+    ipc, peer = server
+    _hold_writer(ipc)
+    for i in range(3):
+        ipc.send({"n": i})
+    ipc.send_binary({"action": "serve_data"}, b"raw")
+    assert ipc.stats()["queued"] == 4
+
+    _release_writer(ipc)
+    assert [json.loads(_read_frame(peer)) for _ in range(3)] == [
+        {"n": 0},
+        {"n": 1},
+        {"n": 2},
+    ]
+    assert _read_binary_frame(peer) == ({"action": "serve_data"}, b"raw")
+    ipc.flush()
+    stats = ipc.stats()
+    assert stats["frames_sent"] == 4
+    assert stats["writes"] == 1
+    assert stats["high_water"] == 4
+
+
+def test_drop_backpressure():
+    ipc, peer = _connect(ChromeIPCServer(max_queue=2, backpressure="drop"))
+    _hold_writer(ipc)
+    for i in range(3):
+        ipc.send({"n": i})
+    assert ipc.stats()["dropped"] == 1
+
+    _release_writer(ipc)
+    assert json.loads(_read_frame(peer)) == {"n": 0}
+    assert json.loads(_read_frame(peer)) == {"n": 1}
+    peer.close()
+
+
+def test_block_backpressure_waits_for_room():
+    ipc, peer = _connect(ChromeIPCServer(max_queue=1, send_timeout=2))
+    _hold_writer(ipc)
+    ipc.send({"n": 0})
+
+    # The writer frees a slot while the second send is blocked
+    threading.Timer(0.05, _release_writer, args=(ipc,)).start()
+    started = time.monotonic()
+    ipc.send({"n": 1})
+    assert time.monotonic() - started >= 0.04
+    assert [json.loads(_read_frame(peer)) for _ in range(2)] == [{"n": 0}, {"n": 1}]
+    ipc.flush()
+    assert ipc.stats()["blocked"] == 1
+    assert ipc.stats()["dropped"] == 0
+    peer.close()
+
+
+def test_block_backpressure_times_out():
+    ipc, peer = _connect(ChromeIPCServer(max_queue=1, send_timeout=0.01))
+    _hold_writer(ipc)
+    ipc.send({"n": 0})
+    ipc.send({"n": 1})
+    assert ipc.stats()["blocked"] == 1
+    assert ipc.stats()["dropped"] == 1
+    peer.close()
+
+
+def test_channel_tags_frames_with_window_id():
+    adapter = ChromeAdapter("electron")
+    adapter.send = MagicMock()
+    adapter.send_binary = MagicMock()
+    channel = adapter.open_channel({"title": "Second"})
+
+    channel.send({"action": "show"})
+    channel.send(b'{"action":"reply","id":"a1","status":0,"result":[1]}')
+    channel.send_binary({"action": "serve_data"}, b"raw")
+
+    first, second = [c.args[0] for c in adapter.send.call_args_list]
+    assert first == {"action": "show", "window": "w1"}
+    assert json.loads(second) == {
+        "window": "w1",
+        "action": "reply",
+        "id": "a1",
+        "status": 0,
+        "result": [1],
+    }
+    adapter.send_binary.assert_called_once_with(
+        {"action": "serve_data", "window": "w1"}, b"raw"
+    )
+    assert channel.config == {"title": "Second"}
+    assert adapter.open_channel().window_id == "w2"
+
+
+def test_messages_are_routed_by_window():
+    adapter = ChromeAdapter("electron")
+    first, second = MagicMock(), MagicMock()
+    adapter.open_channel().bind_raw(first)
+    adapter.open_channel().bind_raw(second)
+
+    call = {"type": "ipc", "payload": {"event": "f"}, "window": "w2"}
+    adapter._on_message(json.dumps(call))
+    first.assert_not_called()
+    second.assert_called_once_with(call)
+
+    # Shell-wide messages reach every window; untagged calls run once
+    adapter._on_message({"type": "lifecycle", "payload": "app_ready"})
+    adapter._on_message({"type": "ipc", "payload": {"event": "f"}})
+    assert first.call_count == 2
+    assert second.call_count == 2
+
+
+def test_shared_adapter_is_reused(monkeypatch):
+    monkeypatch.setattr(ChromeAdapter, "_shared", {})
+    monkeypatch.setattr(ChromeAdapter, "start", lambda self: None)
+
+    adapter = ChromeAdapter.shared("electron", {})
+    assert ChromeAdapter.shared("electron", {}) is adapter
+    assert ChromeAdapter.shared("other", {}) is not adapter
+
+    # A new process is started once the shared one has exited
+    adapter.process = MagicMock()
+    adapter.process.poll.return_value = 0
+    assert ChromeAdapter.shared("electron", {}) is not adapter
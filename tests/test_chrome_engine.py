@@ -0,0 +1,165 @@
+import json
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import pytest
+
+pytest.importorskip("requests")  # chrome.forge dependency
+from pytron.engines.chrome.engine import ChromeWebView
+
+
+@pytest.fixture
+def view():
+    # Skip __init__: it launches the Electron shell
+    view = object.__new__(ChromeWebView)
+    view.logger = logging.getLogger("Pytron.Test")
+    view.bridge = MagicMock()
+    view.w = None
+    view.thread_pool = ThreadPoolExecutor(max_workers=4)
+    view._bound_functions = {}
+    view._dispatchers = {}
+    view._inflight = {}
+    view.call_timings = None
+    view._streams = {}
+    view._spammy_methods = set()
+    view.loop = asyncio.new_event_loop()
+    threading.Thread(target=view.loop.run_forever, daemon=True).start()
+    yield view
+    view.loop.call_soon_threadsafe(view.loop.stop)
+    view.thread_pool.shutdown(wait=True)
+
+
+def _ipc(event, args, seq):
+    return {
+        "type": "ipc",
+        "payload": {"event": event, "data": {"data": args, "id": seq}},
+    }
+
+
+def _replies(view, count):
+    done = threading.Event()
+    replies = []
+
+    def _record(w, seq, status, result):
+        replies.append((seq.decode(), status, json.loads(result)))
+        if len(replies) == count:
+            done.set()
+
+    view.bridge.webview_return.side_effect = _record
+    return replies, done
+
+
+def test_slow_handler_does_not_block_reader(view):
+    release = threading.Event()
+
+    def slow():
+        release.wait(2)
+        return "slow"
+
+    async def fast(x):
+        return x * 2
+
+    view.bind("slow", slow)
+    view.bind("fast", fast)
+    replies, done = _replies(view, 2)
+
+    # Both calls return immediately: the handlers run off the reader thread
+    view._handle_ipc_message(_ipc("slow", [], "s1"))
+    view._handle_ipc_message(_ipc("fast", [21], "s2"))
+    release.set()
+    assert done.wait(2)
+
+    # The fast async call is answered first; replies are matched by seq
+    assert replies == [("s2", 0, 42), ("s1", 0, "slow")]
+
+
+def test_handler_error_is_reported(view):
+    def boom():
+        raise ValueError("bad")
+
+    view.bind("boom", boom)
+    replies, done = _replies(view, 1)
+    view._handle_ipc_message(_ipc("boom", [], "s1"))
+    assert done.wait(2)
+    assert replies == [("s1", 1, "bad")]
+
+
+def test_batch_single_reply(view):
+    view.bind("add", lambda a, b: a + b)
+    replies, done = _replies(view, 1)
+    view._handle_ipc_message(
+        _ipc("__pytron_batch", [["a", "add", [1, 2]], ["b", "nope", []]], "batch")
+    )
+    assert done.wait(2)
+    assert replies == [
+        ("batch", 0, [["a", 0, 3], ["b", 1, "Method 'nope' not found."]])
+    ]
+
+
+def test_large_result_uses_binary_frame():
+    from pytron.engines.chrome.engine import ChromeBridge
+    from pytron.engines.chrome.adapter import BINARY_FRAME_THRESHOLD
+
+    adapter = MagicMock()
+    bridge = ChromeBridge(adapter)
+    bridge.webview_return(None, b"s1", 0, b"[1]")
+    adapter.send.assert_called_once_with(
+        b'{"action":"reply","id":"s1","status":0,"result":[1]}'
+    )
+
+    big = b'"' + b"x" * BINARY_FRAME_THRESHOLD + b'"'
+    bridge.webview_return(None, b"s2", 0, big)
+    adapter.send_binary.assert_called_once_with(
+        {"action": "reply", "id": "s2", "status": 0}, big
+    )
+
+
+def test_serve_data_sends_raw_bytes(view):
+    view.serve_data("img", b"\x89PNG", "image/png")
+    view.bridge.adapter.send_binary.assert_called_once_with(
+        {"action": "serve_data", "key": "img", "mime": "image/png", "ttl": None},
+        b"\x89PNG",
+    )
+
+
+def test_constructor_binds_core_apis(tmp_path):
+    from unittest.mock import patch
+
+    config = {
+        "engine_path": str(tmp_path / "electron"),
+        "url": "https://example.com/",
+        "start_hidden": True,
+    }
+    with patch("pytron.engines.chrome.engine.ChromeAdapter") as adapter:
+        view = ChromeWebView(config)
+
+    channel = adapter.return_value.open_channel.return_value
+    channel.bind_raw.assert_called_once_with(view._handle_ipc_message)
+    assert view.native is None
+    assert {"__pytron_cancel", "__pytron_stream_credit", "close"} <= set(
+        view._dispatchers
+    )
+    view.thread_pool.shutdown(wait=False)
+
+
+def test_shared_shell_serves_each_window_from_its_host(tmp_path):
+    from unittest.mock import patch
+
+    (tmp_path / "index.html").write_text("<html></html>")
+    config = {
+        "engine_path": str(tmp_path / "electron"),
+        "url": str(tmp_path / "index.html"),
+        "start_hidden": True,
+        "chrome_shared_process": True,
+    }
+    with patch("pytron.engines.chrome.engine.ChromeAdapter") as adapter:
+        channel = adapter.shared.return_value.open_channel.return_value
+        channel.window_id = "w2"
+        view = ChromeWebView(config)
+
+    sent = [call[0][0] for call in channel.send.call_args_list]
+    assert {"action": "navigate", "url": "pytron://w2/index.html"} in sent
+    assert sent[0]["options"]["root"] == str(tmp_path)
+    view.thread_pool.shutdown(wait=False)
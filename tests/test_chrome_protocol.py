@@ -0,0 +1,143 @@
+import os
+import json
+import shutil
+import subprocess
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="Needs Node.js")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROTOCOL_JS = os.path.join(ROOT, "pytron", "engines", "chrome", "shell", "protocol.js")
+
+# Runs each request through serveFile/serveBuffer and prints the responses
+RUNNER = """
+const { serveFile, serveBuffer } = require(process.argv[1]);
+const requests = JSON.parse(process.argv[2]);
+(async () => {
+    const out = [];
+    for (const { file, buffer, headers } of requests) {
+        const request = { headers: new Headers(headers || {}) };
+        const res = file
+            ? serveFile(request, file)
+            : serveBuffer(request, Buffer.from(buffer), 'application/octet-stream');
+        out.push({
+            status: res.status,
+            headers: Object.fromEntries(res.headers),
+            body: Buffer.from(await res.arrayBuffer()).toString('latin1'),
+        });
+    }
+    console.log(JSON.stringify(out));
+})();
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "video.mp4").write_bytes(bytes(range(256)))
+    (tmp_path / "assets" / "index-4f9a2c1b.js").write_text("console.log(1)")
+    (tmp_path / "main.js").write_text("console.log(2)")
+    return tmp_path
+
+
+def _serve(*requests):
+    result = subprocess.run(
+        ["node", "-e", RUNNER, os.path.abspath(PROTOCOL_JS), json.dumps(requests)],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+def test_byte_ranges(tree):
+    video = str(tree / "video.mp4")
+    partial, suffix, unsatisfiable, multi = _serve(
+        {"file": video, "headers": {"range": "bytes=16-31"}},
+        {"file": video, "headers": {"range": "bytes=-6"}},
+        {"file": video, "headers": {"range": "bytes=300-"}},
+        {"file": video, "headers": {"range": "bytes=0-1,4-5"}},
+    )
+    assert partial["status"] == 206
+    assert partial["headers"]["content-range"] == "bytes 16-31/256"
+    assert partial["body"].encode("latin1") == bytes(range(16, 32))
+    assert suffix["headers"]["content-range"] == "bytes 250-255/256"
+    assert unsatisfiable["status"] == 416
+    assert unsatisfiable["headers"]["content-range"] == "bytes */256"
+    # Multiple ranges aren't supported: the whole file is sent
+    assert multi["status"] == 200
+    assert len(multi["body"]) == 256
+
+
+def test_etag_revalidation(tree):
+    main = str(tree / "main.js")
+    (first,) = _serve({"file": main})
+    assert first["status"] == 200
+    assert first["headers"]["cache-control"] == "no-cache"
+    assert first["headers"]["accept-ranges"] == "bytes"
+    etag = first["headers"]["etag"]
+
+    same, changed = _serve(
+        {"file": main, "headers": {"if-none-match": etag}},
+        {"file": main, "headers": {"if-none-match": 'W/"0-0"'}},
+    )
+    assert same["status"] == 304
+    assert same["body"] == ""
+    assert changed["status"] == 200
+
+    # Touching the file invalidates the tag
+    os.utime(main, (0, 0))
+    (after,) = _serve({"file": main, "headers": {"if-none-match": etag}})
+    assert after["status"] == 200
+
+
+def test_hashed_assets_are_immutable(tree):
+    (hashed,) = _serve({"file": str(tree / "assets" / "index-4f9a2c1b.js")})
+    assert hashed["headers"]["cache-control"] == "public, max-age=31536000, immutable"
+    assert hashed["headers"]["content-type"] == "text/javascript"
+
+    # A name that merely ends in a digit is not a content hash
+    backup = tree / "settings-backup22.js"
+    backup.write_text("console.log(3)")
+    (plain,) = _serve({"file": str(backup)})
+    assert plain["headers"]["cache-control"] == "no-cache"
+
+
+def test_memory_assets_support_ranges():
+    full, partial = _serve(
+        {"buffer": [1, 2, 3, 4]},
+        {"buffer": [1, 2, 3, 4], "headers": {"range": "bytes=1-2"}},
+    )
+    assert full["status"] == 200
+    assert full["headers"]["cache-control"] == "no-store"
+    assert partial["status"] == 206
+    assert partial["body"].encode("latin1") == b"\x02\x03"
+
+
+def test_precompressed_siblings(tree):
+    app = tree / "app.js"
+    app.write_text("console.log('plain')")
+    (tree / "app.js.gz").write_bytes(b"gzipped")
+    (tree / "app.js.br").write_bytes(b"brotli")
+
+    br, gz, plain, ranged = _serve(
+        {"file": str(app), "headers": {"accept-encoding": "gzip, deflate, br"}},
+        {"file": str(app), "headers": {"accept-encoding": "gzip, br;q=0"}},
+        {"file": str(app)},
+        {"file": str(app), "headers": {"accept-encoding": "br", "range": "bytes=0-6"}},
+    )
+    assert br["headers"]["content-encoding"] == "br"
+    assert br["headers"]["content-type"] == "text/javascript"
+    assert br["headers"]["vary"] == "Accept-Encoding"
+    assert br["body"] == "brotli"
+    assert br["headers"]["etag"].endswith('-br"')
+    assert gz["headers"]["content-encoding"] == "gzip"
+    # Without Accept-Encoding, or for ranges, the plain file is sent
+    assert "content-encoding" not in plain["headers"]
+    assert ranged["body"] == "console"
+
+    # A sibling older than the file is ignored
+    os.utime(tree / "app.js.br", (0, 0))
+    (stale,) = _serve({"file": str(app), "headers": {"accept-encoding": "br"}})
+    assert "content-encoding" not in stale["headers"]
@@ -0,0 +1,184 @@
+import os
+import json
+import socket
+import struct
+import threading
+import time
+import pytest
+from pytron.engines.chrome import shm
+from pytron.engines.chrome.adapter import ChromeIPCServer, BINARY_FRAME_FLAG
+
+pytestmark = pytest.mark.skipif(
+    shm.shared_memory is None or not os.path.isdir("/dev/shm"),
+    reason="Needs POSIX shared memory under /dev/shm",
+)
+
+
+class ShellPeer(threading.Thread):
+    """
+    Stand-in for shell.js: parses socket frames, attaches the ring through its
+    /dev/shm file and reads it on every doorbell, like the Electron side does.
+    """
+
+    def __init__(self, ipc, sock, attach=True):
+        super().__init__(daemon=True)
+        self.ipc = ipc
+        self.sock = sock
+        self.attach = attach
+        self.attached = threading.Event()
+        self.commands = []
+        self.ring_frames = 0
+        self.fd = None
+        self.pos = 0
+
+    def run(self):
+        while True:
+            header = self._recv(4)
+            if header is None:
+                break
+            (word,) = struct.unpack("<I", header)
+            self._handle(word, self._recv(word & ~BINARY_FRAME_FLAG))
+
+    def _recv(self, n):
+        data = b""
+        while len(data) < n:
+            chunk = self.sock.recv(n - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _handle(self, word, body):
+        if not word & BINARY_FRAME_FLAG:
+            self.commands.append(json.loads(body))
+            return
+        (head_len,) = struct.unpack_from("<I", body)
+        command = json.loads(body[4 : 4 + head_len])
+        action = command.get("action")
+        if action == "shm_attach":
+            self._attach(command)
+        elif action == "shm_doorbell":
+            self._read_ring(command["end"])
+        else:
+            command["data"] = body[4 + head_len :]
+            self.commands.append(command)
+
+    def _attach(self, command):
+        self.ring = command
+        if self.attach:
+            self.fd = os.open(command["path"], os.O_RDWR)
+        # The adapter routes the shell's 'shm' reply to on_shm_ack
+        self.ipc.on_shm_ack({"attached": self.attach})
+        self.attached.set()
+
+    def _read_ring(self, end):
+        capacity, base = self.ring["capacity"], self.ring["data_offset"]
+        data = b""
+        while self.pos + len(data) < end:
+            offset = (self.pos + len(data)) % capacity
+            count = min(end - self.pos - len(data), capacity - offset)
+            data += os.pread(self.fd, count, base + offset)
+        self.pos = end
+        os.pwrite(self.fd, struct.pack("<Q", end), self.ring["read_offset"])
+        while data:
+            (word,) = struct.unpack_from("<I", data)
+            size = 4 + (word & ~BINARY_FRAME_FLAG)
+            self._handle(word, data[4:size])
+            self.ring_frames += 1
+            data = data[size:]
+
+
+def _connect(shm_size, attach=True):
+    ipc = ChromeIPCServer(shm_size=shm_size)
+    ipc._native = None
+    ipc.is_windows = False
+    ipc.conn, theirs = socket.socketpair()
+    ipc.connected = True
+    peer = ShellPeer(ipc, theirs, attach)
+    peer.start()
+    return ipc, peer
+
+
+def _drain(ipc, peer):
+    # Wait until the peer has consumed everything written to the ring
+    ipc.flush()
+    deadline = time.monotonic() + 2
+    while ipc._ring and peer.pos < ipc._ring._write_pos:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def _close(ipc, peer):
+    ipc.flush()
+    ipc.conn.close()
+    peer.join(2)
+    ipc._close_shm()
+
+
+def test_frames_travel_through_the_ring():
+    ipc, peer = _connect(4096)
+    ipc.send({"n": 0})
+    assert peer.attached.wait(2)
+    _drain(ipc, peer)
+    path = peer.ring["path"]
+    before = peer.ring_frames
+
+    ipc.send({"n": 1})
+    ipc.send_binary({"action": "serve_data", "key": "k"}, b"\x00raw\xff")
+    _drain(ipc, peer)
+    stats = ipc.stats()
+    _close(ipc, peer)
+
+    assert peer.commands == [
+        {"n": 0},
+        {"n": 1},
+        {"action": "serve_data", "key": "k", "data": b"\x00raw\xff"},
+    ]
+    assert stats["shm"] is True
+    assert stats["shm_bytes"] > 0
+    # Only doorbells crossed the socket
+    assert peer.ring_frames - before == 2
+    assert not os.path.exists(path)
+
+
+def test_wraparound_and_overflow_keep_order():
+    ipc, peer = _connect(256)
+    ipc.send({"n": -1})
+    assert peer.attached.wait(2)
+    ipc.flush()
+
+    # One at a time, so the ring wraps; payloads larger than the ring fall back
+    # to the socket, in order
+    for i in range(20):
+        ipc.send_binary({"n": i}, bytes([i]) * (20 if i % 7 else 300))
+        _drain(ipc, peer)
+    # A burst: the frames that fit use the ring, the rest the socket
+    for i in range(20, 40):
+        ipc.send_binary({"n": i}, bytes([i]) * 20)
+    _drain(ipc, peer)
+    _close(ipc, peer)
+
+    received = [c for c in peer.commands if "data" in c]
+    assert [c["n"] for c in received] == list(range(40))
+    assert all(c["data"] == bytes([c["n"]]) * len(c["data"]) for c in received)
+    assert peer.pos > 256  # the ring wrapped
+    assert peer.ring_frames >= 17
+
+
+def test_falls_back_when_shell_cannot_attach():
+    ipc, peer = _connect(4096, attach=False)
+    ipc.send({"n": 0})
+    assert peer.attached.wait(2)
+    ipc.send({"n": 1})
+    ipc.flush()
+    stats = ipc.stats()
+    _close(ipc, peer)
+
+    assert peer.commands == [{"n": 0}, {"n": 1}]
+    assert stats["shm"] is False
+    assert not os.path.exists(peer.ring["path"])
+
+
+def test_ring_unavailable(monkeypatch):
+    monkeypatch.setattr(shm, "shared_memory", None)
+    assert shm.ShmRing.create(4096) is None
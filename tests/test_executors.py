@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from pytron.apputils.executors import CallGate, ExecutorRegistry
+
+
+def square(x):
+    return x * x
+
+
+@pytest.fixture
+def pool():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_gate_limits_concurrency_and_queue(pool):
+    gate = CallGate("export", pool, max_concurrency=1, max_queue=1)
+    release = threading.Event()
+    finished = []
+    all_done = threading.Event()
+
+    def done(future):
+        finished.append(future.result())
+        if len(finished) == 2:
+            all_done.set()
+
+    assert gate.submit(lambda: release.wait(2) and "first", (), done)
+    assert gate.submit(lambda: "second", (), done)
+    # One running, one waiting: the third call is turned away
+    assert not gate.submit(lambda: "third", (), done)
+    stats = gate.stats()
+    assert (stats["active"], stats["queued"], stats["rejected"]) == (1, 1, 1)
+
+    release.set()
+    assert all_done.wait(2)
+    assert finished == ["first", "second"]
+    stats = gate.stats()
+    assert (stats["active"], stats["completed"], stats["peak_active"]) == (0, 2, 1)
+
+
+def test_gate_counts_failures(pool):
+    gate = CallGate("boom", pool)
+    done = threading.Event()
+
+    def boom():
+        raise ValueError("bad")
+
+    gate.submit(boom, (), lambda f: done.set())
+    assert done.wait(2)
+    assert gate.stats()["failed"] == 1
+
+
+def test_registry_named_and_process_executors(pool):
+    registry = ExecutorRegistry(pool, {"export": {"max_workers": 2}})
+    try:
+        gate = registry.gate("export_pdf", executor="export", max_concurrency=1)
+        assert gate.executor is not pool
+        assert registry.get("export") is gate.executor
+        assert registry.gate("plain").executor is pool
+
+        cpu = registry.gate("square", cpu_bound=True)
+        result = []
+        done = threading.Event()
+        cpu.submit(square, (7,), lambda f: (result.append(f.result()), done.set()))
+        assert done.wait(30)
+        assert result == [49]
+
+        stats = registry.stats()
+        assert stats["executors"]["export"]["max_workers"] == 2
+        assert stats["executors"]["process"]["processes"] is True
+        assert stats["functions"]["export_pdf"]["max_concurrency"] == 1
+    finally:
+        registry.shutdown()
+    assert list(registry.stats()["executors"]) == ["default"]
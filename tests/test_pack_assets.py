@@ -55,3 +55,30 @@ def test_get_smart_assets_frontend_exclusion(tmp_path):
     src_paths = [a.split(os.pathsep)[0] for a in assets]
 
     assert str(frontend_dist / "index.html") not in src_paths
+
+
+def test_precompress_assets(tmp_path):
+    import gzip
+    from pytron.pack.assets import precompress_assets
+
+    dist = tmp_path / "dist"
+    (dist / "assets").mkdir(parents=True)
+    (dist / "assets" / "index.js").write_text("console.log('pytron');\n" * 200)
+    (dist / "tiny.css").write_text("body{}")  # Below the size threshold
+    (dist / "logo.png").write_bytes(b"\x89PNG" * 1000)  # Already compressed
+
+    out = tmp_path / "precompressed"
+    assert precompress_assets(dist, out) >= 1
+
+    gz = out / "assets" / "index.js.gz"
+    source = (dist / "assets" / "index.js").read_bytes()
+    assert gzip.decompress(gz.read_bytes()) == source
+    assert not (out / "tiny.css.gz").exists()
+    assert not (out / "logo.png.gz").exists()
+    # Sources are left untouched
+    assert sorted(p.name for p in dist.rglob("*")) == [
+        "assets",
+        "index.js",
+        "logo.png",
+        "tiny.css",
+    ]
@@ -5,7 +5,18 @@ import decimal
 import pathlib
 import enum
 import dataclasses
-from pytron.serializer import pytron_serialize, PytronJSONEncoder
+import json
+import array
+import base64
+import ctypes
+import typing
+from pytron import serializer
+from pytron.serializer import (
+    pytron_serialize,
+    pytron_dumps,
+    PytronJSONEncoder,
+    register_serializer,
+)
 
 # Optional dependencies
 try:
@@ -150,3 +161,182 @@ class TestSerializer:
         obj = Unknown()
         serialized = pytron_serialize(obj)
         assert isinstance(serialized, dict) or isinstance(serialized, str)
+
+    def test_nested_dataclass(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+
+        @dataclasses.dataclass
+        class Line:
+            start: Point
+            end: Point
+            tags: tuple
+
+        line = Line(Point(0, 0), Point(1, 2), ("a", "b"))
+        assert pytron_serialize(line) == {
+            "start": {"x": 0, "y": 0},
+            "end": {"x": 1, "y": 2},
+            "tags": ["a", "b"],
+        }
+
+    def test_int_enum_keeps_value(self):
+        class Level(enum.IntEnum):
+            LOW = 1
+
+        assert pytron_serialize(Level.LOW) == 1
+
+    def test_register_serializer(self):
+        class Money:
+            def __init__(self, cents):
+                self.cents = cents
+
+        @register_serializer(Money)
+        def _money(obj):
+            return {"amount": decimal.Decimal(obj.cents) / 100}
+
+        assert pytron_serialize([Money(250)]) == [{"amount": 2.5}]
+
+    def test_register_serializer_applies_to_subclasses(self):
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        # Resolve (and cache) the fallback handler before registering
+        assert pytron_serialize(Child()) == {}
+
+        register_serializer(Base, lambda obj: "base")
+        assert pytron_serialize(Child()) == "base"
+
+    def test_register_serializer_for_builtin_subclass(self):
+        class Point(typing.NamedTuple):
+            x: int
+            y: int
+
+        register_serializer(Point, lambda obj: obj._asdict())
+        try:
+            # The C encoder would write the tuple itself and skip the converter
+            assert json.loads(pytron_dumps(Point(1, 2))) == {"x": 1, "y": 2}
+            assert pytron_serialize(Point(1, 2)) == {"x": 1, "y": 2}
+        finally:
+            serializer._registry.pop(Point)
+            serializer._native_overrides.discard(Point)
+
+    def test_register_serializer_rejects_primitives(self):
+        with pytest.raises(TypeError):
+            register_serializer(str, lambda obj: obj)
+
+    def test_dumps_matches_serialize(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+            y: int
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        data = {
+            "points": [Point(1, 2), Point(3, 4)],
+            "when": datetime.date(2023, 1, 1),
+            "tags": {"a"},
+            "color": Color.RED,
+            "nested": {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+        }
+        encoded = pytron_dumps(data)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == pytron_serialize(data)
+
+    def test_dumps_bytes_uses_vap_provider(self):
+        served = {}
+
+        def provider(key, data, mime):
+            served[key] = (data, mime)
+
+        url = json.loads(pytron_dumps(b"blob", vap_provider=provider))
+        key = url[len("pytron://") :]
+        assert served[key] == (b"blob", "application/octet-stream")
+
+    def test_dumps_non_string_keys(self):
+        data = {True: 1, None: 2, (1, 2): "pair", 3: [{False: 4}]}
+        expected = {"True": 1, "None": 2, "(1, 2)": "pair", "3": [{"False": 4}]}
+        assert json.loads(pytron_dumps(data)) == expected
+        assert pytron_serialize(data) == expected
+        # Without a tuple key the C encoder would write "true"/"null"
+        assert pytron_dumps({True: 1, None: 2}) == b'{"True":1,"None":2}'
+
+    def test_dumps_non_string_keys_serve_each_value_once(self):
+        served = {}
+
+        def provider(key, data, mime):
+            served[key] = data
+
+        @dataclasses.dataclass
+        class Report:
+            samples: array.array
+            totals: dict
+
+        report = Report(array.array("i", [1, 2]), {(2024, 1): 3})
+        result = json.loads(pytron_dumps({"report": report}, vap_provider=provider))
+        assert result["report"]["totals"] == {"(2024, 1)": 3}
+        assert list(served) == [result["report"]["samples"]["key"]]
+
+    def test_typed_array_inline(self):
+        result = pytron_serialize(array.array("d", [1.0, 2.5]))
+        assert result["__pytron_type__"] == "ndarray"
+        assert result["dtype"] == "float64"
+        assert result["shape"] == [2]
+        expected = array.array("d", [1.0, 2.5]).tobytes()
+        assert base64.b64decode(result["data"]) == expected
+
+    def test_typed_array_uses_vap_provider(self):
+        served = {}
+
+        def provider(key, data, mime):
+            served[key] = (data, mime)
+
+        values = array.array("i", [1, 2, 3])
+        result = json.loads(pytron_dumps({"xs": values}, vap_provider=provider))["xs"]
+        assert result["dtype"] == "int32"
+        assert result["url"] == f"pytron://{result['key']}"
+        data, mime = served[result["key"]]
+        assert bytes(data) == values.tobytes()
+        assert mime == "application/octet-stream"
+
+    def test_typed_array_vap_is_a_snapshot(self):
+        served = {}
+
+        def provider(key, data, mime):
+            served[key] = data
+
+        values = array.array("i", [1, 2, 3])
+        result = pytron_serialize(values, vap_provider=provider)
+        values[0] = 99
+        assert served[result["key"]] == array.array("i", [1, 2, 3]).tobytes()
+
+    def test_memoryview_shape_and_fallback(self):
+        view = memoryview(bytes(range(6))).cast("B", (2, 3))
+        result = pytron_serialize(view)
+        assert result["dtype"] == "uint8"
+        assert result["shape"] == [2, 3]
+        # Buffers the frontend can't view directly degrade to plain lists
+        big_endian = (ctypes.c_int32.__ctype_be__ * 2)(1, 2)
+        assert pytron_serialize(memoryview(big_endian)) == [1, 2]
+        assert pytron_serialize(bytearray(b"hi")) == base64.b64encode(b"hi").decode()
+
+    def test_numpy_array(self):
+        numpy = pytest.importorskip("numpy")
+        arr = numpy.arange(6, dtype=">i2").reshape(2, 3)
+        served = {}
+
+        def provider(key, data, mime):
+            served[key] = data
+
+        result = pytron_serialize(arr, vap_provider=provider)
+        assert result["dtype"] == "int16"
+        assert result["shape"] == [2, 3]
+        assert bytes(served[result["key"]]) == arr.astype("<i2").tobytes()
+        assert pytron_serialize(numpy.complex64(1)) == {"real": 1.0, "imag": 0.0}
+        assert isinstance(pytron_serialize(arr.astype(numpy.complex64)), list)
@@ -92,3 +92,219 @@ def test_state_thread_safety():
     # but we can ensure internal integrity (it didn't crash and holds a valid int).
     assert isinstance(state.counter, int)
     assert 0 <= state.counter < 200
+
+
+def test_state_coalesced_updates():
+    app = MagicMock()
+    win1 = MagicMock()
+    win2 = MagicMock()
+    app.windows = [win1, win2]
+    app.is_running = True
+
+    # Long interval: the test flushes explicitly
+    state = ReactiveState(app, flush_interval=60)
+    for i in range(100):
+        state.count = i
+    state.update({"a": 1, "count": 500})
+
+    win1.emit.assert_not_called()
+    win1.emit_many.assert_not_called()
+    assert state.count == 500
+
+    state.flush()
+    # One merged emission per window, last value wins
+    win1.emit_many.assert_called_once()
+    events = dict(
+        (data["key"], data["value"]) for _, data in win1.emit_many.call_args[0][0]
+    )
+    assert events == {"count": 500, "a": 1}
+    win2.emit_many.assert_called_once()
+
+    # Nothing left to send
+    state.flush()
+    win1.emit_many.assert_called_once()
+
+
+def test_state_coalesced_flusher_thread():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+    emitted = threading.Event()
+    win1.emit_many.side_effect = lambda events: emitted.set()
+
+    state = ReactiveState(app, flush_interval=0.01)
+    state.count = 1
+    assert emitted.wait(2)
+    win1.emit_many.assert_called_once_with(
+        [("pytron:state-update", {"key": "count", "value": 1})]
+    )
+
+
+def test_state_disabling_coalescing_flushes_pending():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app, flush_interval=60)
+    state.count = 1
+    state.set_flush_interval(None)
+    win1.emit_many.assert_called_once()
+
+    state.count = 2
+    win1.emit.assert_called_with("pytron:state-update", {"key": "count", "value": 2})
+
+
+def _apply_patch(doc, ops):
+    # Minimal RFC 6902 applier (add/remove/replace) used to check diffs
+    import copy
+
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        parts = [
+            p.replace("~1", "/").replace("~0", "~") for p in op["path"].split("/")[1:]
+        ]
+        if not parts:
+            doc = op["value"]
+            continue
+        node = doc
+        for part in parts[:-1]:
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        last = parts[-1]
+        if isinstance(node, list):
+            if op["op"] == "add":
+                node.insert(int(last), op["value"])
+            elif op["op"] == "remove":
+                del node[int(last)]
+            else:
+                node[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del node[last]
+        else:
+            node[last] = op["value"]
+    return doc
+
+
+def test_state_sends_patch_for_small_change():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app)
+    todos = [{"id": i, "done": False} for i in range(1000)]
+    state.todos = todos
+    first = win1.emit.call_args[0][1]
+    assert first["version"] == 1 and first["value"] == todos
+
+    updated = list(todos)
+    updated[500] = {"id": 500, "done": True}
+    updated.append({"id": 1000, "a/b~": 1})
+    state.todos = updated
+
+    event, payload = win1.emit.call_args[0]
+    assert event == "pytron:state-patch"
+    assert payload["base"] == 1 and payload["version"] == 2
+    assert payload["patch"] == [
+        {"op": "replace", "path": "/500/done", "value": True},
+        {"op": "add", "path": "/1000", "value": {"id": 1000, "a/b~": 1}},
+    ]
+    assert _apply_patch(todos, payload["patch"]) == updated
+    assert state.snapshot("todos") == {"value": updated, "version": 2}
+
+    # Deleting one item is a single remove, wherever it is
+    shorter = updated[:10] + updated[11:]
+    state.todos = shorter
+    assert win1.emit.call_args[0][1]["patch"] == [{"op": "remove", "path": "/10"}]
+
+
+def test_state_patch_falls_back_to_full_value():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app, patch_limit=5)
+    state.items = list(range(100))
+    state.items = [-i for i in range(100)]
+    event, payload = win1.emit.call_args[0]
+    assert event == "pytron:state-update"
+    assert payload == {"key": "items", "value": [-i for i in range(100)], "version": 2}
+
+
+def test_state_patch_nested_dict():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app)
+    old = {"user": {"name": "a", "tags": ["x"]}, "gone": 1}
+    new = {"user": {"name": "b", "tags": ["x", "y"]}, "added": True}
+    state.config = old
+    state.config = new
+    event, payload = win1.emit.call_args[0]
+    assert event == "pytron:state-patch"
+    assert _apply_patch(old, payload["patch"]) == new
+
+
+def test_state_coalesced_patch_uses_last_flushed_value():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app, flush_interval=60)
+    state.items = [1, 2, 3]
+    state.flush()
+    state.items = [1, 2, 3, 4]
+    state.items = [1, 2, 3, 4, 5]
+    state.flush()
+
+    [(event, payload)] = win1.emit_many.call_args[0][0]
+    assert event == "pytron:state-patch"
+    assert payload["base"] == 1 and payload["version"] == 2
+    assert _apply_patch([1, 2, 3], payload["patch"]) == [1, 2, 3, 4, 5]
+
+
+def test_state_patch_sees_in_place_changes():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app)
+    todos = [{"title": "a", "completed": False}]
+    state.todos = todos
+    sent = [{"title": "a", "completed": False}]
+
+    todos[0]["completed"] = True
+    state.todos = todos + [{"title": "b", "completed": False}]
+    event, payload = win1.emit.call_args[0]
+    assert event == "pytron:state-patch"
+    assert _apply_patch(sent, payload["patch"]) == state.todos
+    # The snapshot is what the frontend holds, not the live object
+    assert state.snapshot("todos")["value"] == state.todos
+    assert state.snapshot("todos")["value"] is not state.todos
+
+
+def test_state_large_values_are_sent_whole():
+    app = MagicMock()
+    win1 = MagicMock()
+    app.windows = [win1]
+    app.is_running = True
+
+    state = ReactiveState(app, patch_max_items=100)
+    state.rows = [[i] for i in range(60)]
+    state.rows = [[i] for i in range(61)]
+    # 61 lists of one item each: over budget, so no copy is kept or diffed
+    event, payload = win1.emit.call_args[0]
+    assert event == "pytron:state-update" and payload["version"] == 2
+    assert state.snapshot("rows") == {"value": state.rows, "version": 2}
+
+    state.set_patch_limit(0)
+    state.small = [1]
+    state.small = [1, 2]
+    assert win1.emit.call_args[0][0] == "pytron:state-update"
+    assert state._sent["small"] == (None, 2)
@@ -0,0 +1,54 @@
+import typing
+import pytest
+from pytron.exceptions import ArgumentError
+from pytron.apputils.validation import compile_validator
+
+
+def test_primitives_are_checked_and_coerced():
+    def resize(width: int, scale: float, label: typing.Optional[str], fit: bool):
+        pass
+
+    validate = compile_validator("resize", resize)
+    assert validate([640, 2, None, True]) == [640, 2.0, None, True]
+    # Lossless spellings JSON callers commonly send
+    assert validate(["640", 1.5, "big", "false"]) == [640, 1.5, "big", False]
+    assert validate([640.0]) == [640]
+
+    with pytest.raises(ArgumentError, match="'width' for resize: expected int"):
+        validate([1.5])
+    with pytest.raises(ArgumentError, match="expected Optional\\[str\\], got int"):
+        validate([1, 1.0, 7])
+    with pytest.raises(ArgumentError, match="expected int, got bool"):
+        validate([True])
+
+
+def test_literals_and_unhinted_parameters():
+    def export(fmt: typing.Literal["pdf", "png"], target, cancel_token=None):
+        pass
+
+    validate = compile_validator("export", export)
+    assert validate(["png", {"any": "thing"}]) == ["png", {"any": "thing"}]
+    with pytest.raises(ArgumentError, match="expected Literal"):
+        validate(["gif", None])
+
+
+def test_no_validator_without_hints():
+    assert compile_validator("plain", lambda a, b: a) is None
+    assert compile_validator("loose", lambda *args, **kwargs: None) is None
+
+
+def test_models_use_pydantic():
+    pydantic = pytest.importorskip("pydantic")
+
+    class Point(pydantic.BaseModel):
+        x: int
+        y: int
+
+    def move(point: Point, path: typing.List[Point]):
+        pass
+
+    validate = compile_validator("move", move)
+    point, path = validate([{"x": 1, "y": "2"}, [{"x": 0, "y": 0}]])
+    assert (point.x, point.y) == (1, 2) and isinstance(path[0], Point)
+    with pytest.raises(ArgumentError, match="'point' for move"):
+        validate([{"x": "a"}, []])
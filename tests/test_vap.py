@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock, patch
+from pytron.vap import VAPStore, NativeVAPStore
+
+
+def test_put_and_get():
+    store = VAPStore(max_bytes=100)
+    store.put("a", b"data", "text/plain")
+    assert store.get("a") == (b"data", "text/plain")
+    assert store.get("missing") is None
+    stats = store.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["bytes"] == 4
+
+
+def test_lru_eviction_respects_recent_use():
+    store = VAPStore(max_bytes=10)
+    store.put("a", b"1234", "x")
+    store.put("b", b"1234", "x")
+    store.get("a")  # "b" is now the least recently used
+    store.put("c", b"1234", "x")
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+    assert store.stats()["evictions"] == 1
+    assert store.stats()["bytes"] == 8
+
+
+def test_oversized_entry_is_kept_alone():
+    store = VAPStore(max_bytes=4)
+    store.put("a", b"12", "x")
+    store.put("big", b"123456789", "x")
+    assert len(store) == 1
+    assert store.get("big") == (b"123456789", "x")
+
+
+def test_replacing_key_updates_size():
+    store = VAPStore(max_bytes=100)
+    store.put("a", b"123456", "x")
+    store.put("a", b"12", "x")
+    assert store.stats()["bytes"] == 2
+
+
+def test_memoryview_size_counts_bytes():
+    store = VAPStore(max_bytes=100)
+    store.put("a", memoryview(bytes(16)).cast("d"), "x")
+    assert store.stats()["bytes"] == 16
+
+
+def test_ttl_expiry():
+    store = VAPStore(max_bytes=100, ttl=5)
+    with patch("pytron.vap.time.monotonic", return_value=100.0):
+        store.put("a", b"1", "x")
+        store.put("forever", b"1", "x", ttl=0)
+    with patch("pytron.vap.time.monotonic", return_value=106.0):
+        assert store.get("a") is None
+        assert store.get("forever") == (b"1", "x")
+    stats = store.stats()
+    assert stats["expirations"] == 1
+    assert stats["bytes"] == 1
+
+
+def test_remove():
+    store = VAPStore()
+    store.put("a", b"1", "x")
+    assert store.remove("a") is True
+    assert store.remove("a") is False
+    assert store.stats()["bytes"] == 0
+
+
+def test_native_store_forwards_to_engine():
+    native = MagicMock()
+    native.vap_get.return_value = (b"png", "image/png")
+    native.vap_stats.return_value = {"entries": 1}
+    store = NativeVAPStore(native, max_bytes=100, ttl=5)
+    native.vap_configure.assert_called_once_with(100, 5)
+
+    data = memoryview(bytearray(b"png"))
+    store.put("img", data, "image/png")
+    native.vap_put.assert_called_once_with("img", data, "image/png", None)
+    assert store.get("img") == (b"png", "image/png")
+    assert len(store) == 1
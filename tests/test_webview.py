@@ -0,0 +1,528 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import pytest
+from pytron.webview import Webview
+from pytron.vap import VAPStore
+
+
+@pytest.fixture
+def webview():
+    # Skip __init__: it needs the compiled native engine
+    view = object.__new__(Webview)
+    view.native = MagicMock()
+    view.logger = logging.getLogger("Pytron.Test")
+    view.thread_pool = ThreadPoolExecutor(max_workers=4)
+    view._dispatchers = {}
+    view._inflight = {}
+    view.call_timings = None
+    view._streams = {}
+    view._spammy_methods = set()
+    view._served_data = VAPStore()
+    yield view
+    view.thread_pool.shutdown(wait=True)
+
+
+def _wait_for_result(native):
+    done = threading.Event()
+    native.return_result.side_effect = lambda *args: done.set()
+    return done
+
+
+def test_bind_registers_with_native(webview):
+    done = _wait_for_result(webview.native)
+    webview.bind("add", lambda a, b: a + b)
+    callback = webview.native.bind.call_args[0][1]
+
+    callback("s1", "[1, 2]", 0)
+    assert done.wait(2)
+    assert webview.native.return_result.call_args[0] == ("s1", 0, b"3")
+
+
+def test_batch_answers_in_one_frame(webview):
+    done = _wait_for_result(webview.native)
+    release = threading.Event()
+
+    def slow(x):
+        release.wait(2)
+        return x
+
+    def boom():
+        raise ValueError("bad")
+
+    webview.bind("slow", slow)
+    webview.bind("boom", boom)
+    webview.bind("inline", lambda: "ui", run_in_thread=False)
+
+    calls = [
+        ["a", "slow", [1]],
+        ["b", "boom", []],
+        ["c", "inline", []],
+        ["d", "missing", []],
+    ]
+    webview._batch_callback("batch", json.dumps(calls), 0)
+    # Nothing is sent until the slowest call has finished
+    assert not done.wait(0.1)
+    release.set()
+    assert done.wait(2)
+
+    webview.native.return_result.assert_called_once()
+    seq, status, payload = webview.native.return_result.call_args[0]
+    assert (seq, status) == ("batch", 0)
+    assert json.loads(payload) == [
+        ["a", 0, 1],
+        ["b", 1, "bad"],
+        ["c", 0, "ui"],
+        ["d", 1, "Method 'missing' not found."],
+    ]
+
+
+def test_empty_batch(webview):
+    webview._batch_callback("batch", "[]", 0)
+    webview.native.return_result.assert_called_once_with("batch", 0, b"[]")
+
+
+def test_emit_is_queued_natively(webview):
+    webview.emit("tick", {"n": 1})
+    webview.emit_many([("a", 1), ("b", [2])])
+    assert [c.args for c in webview.native.emit.call_args_list] == [
+        ("tick", '{"n": 1}'),
+        ("a", "1"),
+        ("b", "[2]"),
+    ]
+    webview.native.eval.assert_not_called()
+
+    # Engines without native batching still get one eval per emit
+    webview.native = MagicMock(spec=["eval"])
+    webview.emit("tick", None)
+    assert "CustomEvent('tick'" in webview.native.eval.call_args[0][0]
+    assert webview.ipc_stats() is None
+
+
+def test_gated_calls_fail_fast_when_saturated(webview):
+    from pytron.apputils.executors import CallGate
+
+    release = threading.Event()
+    gate = CallGate("export", webview.thread_pool, max_concurrency=1, max_queue=0)
+    webview.bind("export", lambda: release.wait(2), gate=gate)
+    callback = webview.native.bind.call_args[0][1]
+
+    callback("s1", "[]", 0)
+    callback("s2", "[]", 0)
+    seq, status, payload = webview.native.return_result.call_args[0]
+    assert (seq, status) == ("s2", 1)
+    assert b"busy" in payload
+
+    done = _wait_for_result(webview.native)
+    release.set()
+    assert done.wait(2)
+    assert webview.native.return_result.call_args[0] == ("s1", 0, b"true")
+
+
+def test_gate_limits_async_calls(webview):
+    import asyncio
+    from pytron.apputils.executors import CallGate
+
+    webview.loop = asyncio.new_event_loop()
+    threading.Thread(target=webview.loop.run_forever, daemon=True).start()
+    release = threading.Event()
+    started = []
+
+    async def export(n):
+        started.append(n)
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+        return n
+
+    answers = []
+    answered = threading.Event()
+    webview.native.return_result.side_effect = lambda seq, status, payload: (
+        answers.append((seq, status)),
+        len(answers) == 3 and answered.set(),
+    )
+    gate = CallGate("export", webview.thread_pool, max_concurrency=1, max_queue=1)
+    webview.bind("export", export, gate=gate)
+    callback = webview.native.bind.call_args[0][1]
+    for n in (1, 2, 3):
+        callback(f"s{n}", f"[{n}]", 0)
+
+    # One call on the loop, one waiting for its slot, the third turned away
+    time.sleep(0.1)
+    assert started == [1]
+    assert answers == [("s3", 1)]
+
+    release.set()
+    assert answered.wait(2)
+    assert answers == [("s3", 1), ("s1", 0), ("s2", 0)]
+    webview.loop.call_soon_threadsafe(webview.loop.stop)
+
+
+def test_cancel_sync_call_via_token(webview):
+    started = threading.Event()
+
+    def search(query, cancel_token):
+        started.set()
+        while not cancel_token.wait(0.01):
+            pass
+        cancel_token.raise_if_cancelled()
+
+    done = threading.Event()
+    webview.native.return_result.side_effect = (
+        lambda seq, *args: seq == "s1" and done.set()
+    )
+    webview.bind("search", search)
+    webview.bind("__pytron_cancel", webview._cancel_calls, run_in_thread=False)
+    search_cb = webview.native.bind.call_args_list[0][0][1]
+    cancel_cb = webview.native.bind.call_args_list[1][0][1]
+
+    search_cb("s1", '["py"]', 0)
+    assert started.wait(2)
+    assert "s1" in webview._inflight
+    # Cancels are fire-and-forget: sent without a seq and never answered
+    cancel_cb("", '[["s1"]]', 0)
+    assert done.wait(2)
+    calls = {c.args[0]: c.args[1:] for c in webview.native.return_result.call_args_list}
+    assert calls == {"s1": (1, b'"Cancelled"')}
+    assert webview._inflight == {}
+
+
+def test_cancel_async_call(webview):
+    import asyncio
+
+    webview.loop = asyncio.new_event_loop()
+    threading.Thread(target=webview.loop.run_forever, daemon=True).start()
+    started = threading.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    done = _wait_for_result(webview.native)
+    webview.bind("slow", slow)
+    callback = webview.native.bind.call_args[0][1]
+    callback("s1", "[]", 0)
+    assert started.wait(2)
+
+    webview._cancel_calls(["s1"])
+    assert done.wait(2)
+    assert webview.native.return_result.call_args[0] == ("s1", 1, b'"Cancelled"')
+    webview.loop.call_soon_threadsafe(webview.loop.stop)
+
+
+def test_single_flight_binding(webview):
+    from pytron.apputils.callcache import CallCache
+
+    release = threading.Event()
+    runs = []
+
+    def get_config():
+        runs.append(1)
+        release.wait(2)
+        return {"theme": "dark"}
+
+    answered = threading.Event()
+    seqs = []
+    webview.native.return_result.side_effect = lambda seq, *args: (
+        seqs.append(seq),
+        len(seqs) == 2 and answered.set(),
+    )
+    webview.bind("get_config", get_config, cache=CallCache("get_config"))
+    callback = webview.native.bind.call_args[0][1]
+    callback("s1", "[]", 0)
+    callback("s2", "[]", 0)
+    release.set()
+
+    assert answered.wait(2)
+    assert len(runs) == 1
+    assert sorted(seqs) == ["s1", "s2"]
+
+
+def test_cached_calls_stop_their_timer_on_the_result(webview):
+    from pytron.apputils.callcache import CallCache
+    from pytron.apputils.callstats import CallStats
+
+    stats = CallStats(slow_call_ms=None)
+    dispatch = webview._make_dispatcher(
+        "get_config", lambda: 1, run_in_thread=False, cache=CallCache("c", ttl=60)
+    )
+    dispatch([], lambda *args: None, timer=stats.timer("get_config", []))
+
+    hit = stats.timer("get_config", [])
+    seen = []
+    dispatch([], lambda *args: seen.append(hit.executed), timer=hit)
+    # The hit never ran: all of its time up to the result is queueing
+    assert seen[0] is not None
+    assert hit.started is None
+
+
+def _stream_events(native, until):
+    """Collects 'pytron:stream' payloads, setting the event once until(payloads)."""
+    payloads = []
+    ready = threading.Event()
+
+    def emit(event, payload):
+        payloads.append(json.loads(payload))
+        if until(payloads):
+            ready.set()
+
+    native.emit.side_effect = emit
+    return payloads, ready
+
+
+def test_generator_streams_chunks(webview):
+    def count(n):
+        yield from range(n)
+
+    payloads, ended = _stream_events(webview.native, lambda p: "done" in p[-1])
+    done = _wait_for_result(webview.native)
+    webview.bind("count", count)
+    callback = webview.native.bind.call_args[0][1]
+
+    callback("s1", "[3]", 0)
+    assert done.wait(2)
+    seq, status, payload = webview.native.return_result.call_args[0]
+    descriptor = json.loads(payload)
+    assert (seq, status, descriptor["__pytron_type__"]) == ("s1", 0, "stream")
+
+    assert ended.wait(2)
+    stream_id = descriptor["id"]
+    assert payloads == [
+        {"id": stream_id, "chunk": 0},
+        {"id": stream_id, "chunk": 1},
+        {"id": stream_id, "chunk": 2},
+        {"id": stream_id, "done": True},
+    ]
+    assert webview._streams == {} and webview._inflight == {}
+
+
+def test_stream_waits_for_credits(webview):
+    from pytron.streams import DEFAULT_STREAM_CREDITS
+
+    window = DEFAULT_STREAM_CREDITS
+    payloads, filled = _stream_events(webview.native, lambda p: len(p) == window)
+    produced = []
+    held = threading.Event()
+
+    def ticks():
+        for i in range(window * 2):
+            produced.append(i)
+            if i == window:
+                held.set()
+            yield i
+
+    webview.bind("ticks", ticks)
+    webview.native.bind.call_args[0][1]("s1", "[]", 0)
+    assert filled.wait(2)
+    stream_id = payloads[0]["id"]
+    # The producer holds its next chunk until the page grants more credits
+    assert held.wait(2)
+    time.sleep(0.1)
+    assert len(payloads) == window and len(produced) == window + 1
+
+    _, ended = _stream_events(webview.native, lambda p: "done" in p[-1])
+    webview._grant_stream_credit(stream_id, window)
+    assert ended.wait(2)
+    assert len(produced) == window * 2
+
+
+def test_stalled_stream_ends_off_the_call_pool(webview, monkeypatch):
+    from pytron.apputils.executors import ExecutorRegistry
+
+    monkeypatch.setattr("pytron.webview.DEFAULT_STREAM_IDLE_TIMEOUT", 0.1)
+    webview.app = MagicMock()
+    webview.app.executors = ExecutorRegistry(webview.thread_pool)
+    payloads, ended = _stream_events(webview.native, lambda p: "error" in p[-1])
+    threads = set()
+    closed = threading.Event()
+
+    def forever():
+        try:
+            while True:
+                threads.add(threading.current_thread().name)
+                yield "x"
+        finally:
+            closed.set()
+
+    webview.bind("forever", forever)
+    webview.native.bind.call_args[0][1]("s1", "[]", 0)
+    # The page never grants more credits, nor cancels
+    assert ended.wait(2)
+    assert closed.wait(2)
+    assert "stalled" in payloads[-1]["error"]
+    assert all(name.startswith("Pytron-stream") for name in threads)
+    assert webview._streams == {} and webview._inflight == {}
+    webview.app.executors.shutdown()
+
+
+def test_cancelled_stream_closes_generator(webview):
+    payloads, started = _stream_events(webview.native, lambda p: len(p) == 2)
+    closed = threading.Event()
+
+    def forever():
+        try:
+            while True:
+                yield "x"
+        finally:
+            closed.set()
+
+    webview.bind("forever", forever)
+    webview.native.bind.call_args[0][1]("s1", "[]", 0)
+    assert started.wait(2)
+
+    webview._cancel_calls([payloads[0]["id"]])
+    assert closed.wait(2)
+    # No done/error event once the page walked away
+    assert all("chunk" in p for p in payloads)
+    assert webview._streams == {}
+
+
+def test_async_generator_streams_chunks(webview):
+    import asyncio
+
+    webview.loop = asyncio.new_event_loop()
+    threading.Thread(target=webview.loop.run_forever, daemon=True).start()
+    payloads, ended = _stream_events(webview.native, lambda p: "chunk" not in p[-1])
+
+    async def rows():
+        yield {"row": 1}
+        await asyncio.sleep(0)
+        raise ValueError("lost connection")
+
+    webview.bind("rows", rows)
+    webview.native.bind.call_args[0][1]("s1", "[]", 0)
+    assert ended.wait(2)
+    assert payloads[0]["chunk"] == {"row": 1}
+    assert payloads[1]["error"] == "lost connection"
+    webview.loop.call_soon_threadsafe(webview.loop.stop)
+
+
+def test_calls_are_timed_per_phase(webview):
+    from pytron.apputils.callstats import CallStats
+
+    webview.call_timings = CallStats(slow_call_ms=None)
+    answered = threading.Event()
+    webview.native.return_result.side_effect = (
+        lambda seq, *args: seq == "batch" and answered.set()
+    )
+    webview.bind("add", lambda a, b: a + b)
+    webview.bind("inspector_get_data", lambda: {})
+    webview._batch_callback(
+        "batch", json.dumps([["a", "add", [1, 2]], ["b", "inspector_get_data", []]]), 0
+    )
+    assert answered.wait(2)
+
+    stats = webview.call_timings.stats()
+    # The inspector's own polling isn't measured
+    assert list(stats) == ["add"]
+    assert stats["add"]["calls"] == 1
+    for phase in ("queue", "execute", "serialize", "transport"):
+        assert stats["add"][phase]["count"] == 1
+
+
+def test_handlers_see_calling_window(webview):
+    import asyncio
+    from pytron import current_window
+    from pytron.eventloop import start_event_loop, stop_event_loop
+
+    webview.loop = start_event_loop(use_uvloop=False)
+    seen = []
+    answered = threading.Event()
+    webview.native.return_result.side_effect = (
+        lambda *args: len(seen) == 2 and answered.set()
+    )
+
+    async def from_loop():
+        await asyncio.sleep(0)
+        seen.append(current_window())
+
+    webview.bind("sync", lambda: seen.append(current_window()))
+    webview.bind("async", from_loop)
+    for _, (name, callback), _ in webview.native.bind.mock_calls:
+        callback("s-" + name, "[]", 0)
+
+    assert answered.wait(2)
+    assert seen == [webview, webview]
+    assert current_window() is None
+    stop_event_loop(webview.loop)
+
+
+def test_validator_runs_before_the_handler(webview):
+    from pytron.apputils.validation import compile_validator
+
+    def scale(factor: float):
+        return factor * 2
+
+    webview.bind("scale", scale, validator=compile_validator("scale", scale))
+    callback = webview.native.bind.call_args[0][1]
+
+    done = _wait_for_result(webview.native)
+    callback("s1", '["1.5"]', 0)
+    assert done.wait(2)
+    assert webview.native.return_result.call_args[0] == ("s1", 0, b"3.0")
+
+    # Rejected without reaching the thread pool
+    callback("s2", '["big"]', 0)
+    seq, status, payload = webview.native.return_result.call_args[0]
+    assert (seq, status) == ("s2", 1)
+    assert b"Invalid argument 'factor' for scale" in payload
+
+
+def test_unencodable_result_is_answered_as_error(webview):
+    def circular():
+        data = {}
+        data["self"] = data
+        return data
+
+    done = _wait_for_result(webview.native)
+    webview.bind("circular", circular)
+    webview.native.bind.call_args[0][1]("s1", "[]", 0)
+
+    assert done.wait(2)
+    seq, status, payload = webview.native.return_result.call_args[0]
+    assert (seq, status) == ("s1", 1)
+    assert b"Could not encode result" in payload
+
+
+def test_failed_reply_still_settles_the_call(webview):
+    replies = []
+    done = threading.Event()
+
+    def return_result(seq, status, payload):
+        replies.append(status)
+        if status == 0:
+            raise RuntimeError("engine rejected the reply")
+        done.set()
+
+    webview.native.return_result.side_effect = return_result
+    dispatch = webview._make_dispatcher("ok", lambda: "fine")
+    dispatch([], lambda status, result: return_result("s1", status, result), "s1")
+
+    assert done.wait(2)
+    assert replies == [0, 1]
+
+
+def test_unencodable_batch_entry_fails_alone(webview, caplog):
+    def circular():
+        data = []
+        data.append(data)
+        return data
+
+    done = _wait_for_result(webview.native)
+    webview.bind("ok", lambda: "fine")
+    webview.bind("blob", lambda: b"data")
+    webview.bind("circ", circular)
+    calls = [["a", "ok", []], ["b", "blob", []], ["c", "circ", []]]
+    webview._batch_callback("batch", json.dumps(calls), 0)
+
+    assert done.wait(2)
+    seq, status, payload = webview.native.return_result.call_args[0]
+    ok, blob, circ = json.loads(payload)
+    assert ok == ["a", 0, "fine"]
+    assert circ[:2] == ["c", 1] and "Could not encode result" in circ[2]
+    # The bytes went to the VAP once, and the log names the method, not the seq
+    assert len(webview._served_data) == 1
+    assert blob[2].rsplit("/", 1)[-1] in webview._served_data
+    assert "Could not encode result of circ" in caplog.text
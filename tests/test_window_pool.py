@@ -0,0 +1,114 @@
+import os
+import threading
+from unittest.mock import MagicMock, patch
+import pytest
+from pytron.apputils.windows import WindowMixin
+from pytron.apputils.windowpool import WindowPool
+
+
+class MockApp(WindowMixin):
+    def __init__(self, pool_size=2):
+        self.config = {
+            "title": "Test App",
+            "url": "index.html",
+            "window_pool_size": pool_size,
+            "window_pool_delay": 60,  # tests fill explicitly
+        }
+        self.windows = []
+        self._exposed_functions = {}
+        self.logger = MagicMock()
+        self.app_root = os.getcwd()
+        self.is_running = True
+
+
+def _fake_window(config):
+    window = MagicMock()
+    window.config = dict(config)
+    window.native = None
+    return window
+
+
+@pytest.fixture
+def app():
+    app = MockApp()
+    with patch("pytron.apputils.windows.Webview", side_effect=_fake_window):
+        app.create_window()  # main window, never pooled
+        yield app
+    if getattr(app, "_window_pool", None):
+        app._window_pool.drain()
+
+
+def _warm(app):
+    app._start_window_pool()
+    app._window_pool.fill()
+    return app._window_pool
+
+
+def test_pool_fills_in_background():
+    created = threading.Event()
+
+    def factory():
+        created.set()
+        return MagicMock()
+
+    pool = WindowPool(factory, size=2, delay=0)
+    pool.schedule()
+    assert created.wait(2)
+    pool.fill()
+    assert pool.stats()["idle"] == 2
+    assert pool.stats()["created"] == 2
+
+
+def test_create_window_uses_warm_window(app):
+    pool = _warm(app)
+    warm = list(pool._idle)
+    assert all(w.config["start_hidden"] for w in warm)
+
+    app._exposed_functions["late"] = {"func": MagicMock(), "secure": False}
+    window = app.create_window(title="Settings", dimensions=[400, 300])
+
+    assert window is warm[0]
+    window.set_title.assert_called_with("Settings")
+    window.set_size.assert_called_with(400, 300)
+    window.show.assert_called_once()
+    # Only functions exposed after warm-up are bound on hand-out
+    assert [c.args[0] for c in window.bind.call_args_list] == ["late"]
+    assert app.window_pool_stats()["hits"] == 1
+
+
+def test_incompatible_options_miss(app):
+    pool = _warm(app)
+    window = app.create_window(frameless=True)
+    assert window not in pool._idle
+    assert window.config["frameless"] is True
+    stats = app.window_pool_stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (0, 1, 0.0)
+
+
+def test_closed_windows_are_recycled(app):
+    pool = _warm(app)
+    window = app.create_window(title="About")
+    app.create_window(title="Help")
+
+    assert app.recycle_window(window) is True
+    assert window not in app.windows
+    window.hide.assert_called()
+    window.navigate.assert_called_with("about:blank")
+    assert app.create_window() is window
+
+    # Past the pool size, closed windows are destroyed
+    pool.fill()
+    extra = app.windows[-1]
+    assert app.recycle_window(extra) is False
+    extra.close.assert_called_once_with(force=True)
+    assert pool.stats()["recycled"] == 1
+    assert pool.stats()["discarded"] == 1
+
+
+def test_quit_closes_idle_windows(app):
+    pool = _warm(app)
+    idle = list(pool._idle)
+    app.quit()
+    for window in idle:
+        window.close.assert_called_once_with(force=True)
+    assert pool.stats()["idle"] == 0